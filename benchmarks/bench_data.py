@@ -0,0 +1,45 @@
+"""
+Estimation time benchmarks on the bundled data series.
+
+The classes follow the airspeed velocity (asv) conventions (see
+bench_estimators.py).
+"""
+from pyelw import LW, ELW, TwoStepELW, LWLFC, fit_collection
+
+from .common import DATASETS, dataset
+
+ESTIMATORS = {
+    'LW': LW,
+    'LW_hc': lambda: LW(taper='hc'),
+    'ELW': ELW,
+    'TwoStepELW': TwoStepELW,
+    'LWLFC': LWLFC,
+}
+
+
+class TimeDatasets:
+    """Each estimator on each bundled series, at its default and the plug-in bandwidth."""
+    params = (list(DATASETS), list(ESTIMATORS), ['default', 'plugin'])
+    param_names = ['dataset', 'estimator', 'm']
+
+    def setup(self, name, estimator, m):
+        self.x = dataset(name)
+        self.est = ESTIMATORS[estimator]()
+        self.m = None if m == 'default' else m
+
+    def time_fit(self, name, estimator, m):
+        self.est.fit(self.x, m=self.m)
+
+
+class TimeFitCollection:
+    """All bundled series at once with fit_collection, serial and parallel."""
+    params = (['ELW', 'TwoStepELW'], [1, -1])
+    param_names = ['estimator', 'n_jobs']
+    timeout = 600
+
+    def setup(self, estimator, n_jobs):
+        self.series = {name: dataset(name) for name in DATASETS}
+        self.est = ESTIMATORS[estimator]()
+
+    def time_fit_collection(self, estimator, n_jobs):
+        fit_collection(self.est, self.series, n_jobs=n_jobs)
@@ -0,0 +1,117 @@
+"""
+Estimation time benchmarks on simulated ARFIMA(0,0.4,0) series.
+
+The classes follow the airspeed velocity (asv) conventions: setup()
+prepares the data for each parameter combination, and raising
+NotImplementedError there skips combinations that would take too long.
+Run them without asv, with JSON output, using
+
+    python -m benchmarks.run
+"""
+from pyelw import LW, ELW, TwoStepELW, LWLFC, LWBootstrapM
+
+from .common import SIZES, M_RULES, bandwidth, simulated, skip_if
+
+
+class TimeLW:
+    """LW with each taper at m = n^0.65."""
+    params = (SIZES, ['none', 'kolmogorov', 'cosine', 'bartlett', 'hc'])
+    param_names = ['n', 'taper']
+    timeout = 600
+
+    def setup(self, n, taper):
+        self.x = simulated(n)
+        self.est = LW(taper=taper)
+
+    def time_fit(self, n, taper):
+        self.est.fit(self.x)
+
+
+class TimeELW:
+    """ELW at m = n^0.65."""
+    params = SIZES
+    param_names = ['n']
+    timeout = 600
+
+    def setup(self, n):
+        self.x = simulated(n)
+        self.est = ELW()
+
+    def time_fit(self, n):
+        self.est.fit(self.x)
+
+
+class TimeTwoStepELW:
+    """Two-step ELW with linear detrending at m = n^0.65."""
+    params = SIZES
+    param_names = ['n']
+    timeout = 600
+
+    def setup(self, n):
+        self.x = simulated(n)
+        self.est = TwoStepELW(trend_order=1)
+
+    def time_fit(self, n):
+        self.est.fit(self.x)
+
+
+class TimeLWLFC:
+    """Local Whittle for low frequency contaminations at its default m = n^0.8."""
+    params = SIZES
+    param_names = ['n']
+    timeout = 600
+
+    def setup(self, n):
+        self.x = simulated(n)
+        self.est = LWLFC()
+
+    def time_fit(self, n):
+        self.est.fit(self.x)
+
+
+class TimeBandwidthRules:
+    """LW, ELW and TwoStepELW with fixed bandwidth rules and the plug-in selector."""
+    params = (SIZES, M_RULES, ['LW', 'ELW', 'TwoStepELW'])
+    param_names = ['n', 'm', 'estimator']
+    timeout = 600
+
+    def setup(self, n, m, estimator):
+        self.x = simulated(n)
+        self.m = bandwidth(m, n)
+        self.est = {'LW': LW, 'ELW': ELW, 'TwoStepELW': TwoStepELW}[estimator]()
+
+    def time_fit(self, n, m, estimator):
+        self.est.fit(self.x, m=self.m)
+
+
+class TimeLWBootstrapM:
+    """Bootstrap MSE bandwidth selection (Arteche and Orbe, 2016), serial and parallel."""
+    params = (SIZES, [1, -1])
+    param_names = ['n', 'n_jobs']
+    timeout = 1800
+
+    def setup(self, n, n_jobs):
+        # Each iteration fits B bootstrap samples at every candidate m, so
+        # that even with B = 50 a single fit takes minutes from n = 1000 on
+        skip_if(n > 10**2)
+        self.x = simulated(n)
+        self.est = LWBootstrapM(B=50, n_jobs=n_jobs)
+
+    def time_fit(self, n, n_jobs):
+        self.est.fit(self.x)
+
+
+class TimeFitMany:
+    """Vectorized estimation of 100 series at once."""
+    params = (SIZES[:4], ['LW', 'ELW', 'TwoStepELW', 'LWLFC'])
+    param_names = ['n', 'estimator']
+    timeout = 600
+
+    def setup(self, n, estimator):
+        import numpy as np
+        from pyelw.simulate import arfima_batch
+        self.X = arfima_batch(100, n, 0.4, seed=np.random.SeedSequence(1))
+        self.est = {'LW': LW, 'ELW': ELW, 'TwoStepELW': TwoStepELW, 'LWLFC': LWLFC}[estimator]()
+
+    def time_fit_many(self, n, estimator):
+        self.est.fit_many(self.X)
@@ -0,0 +1,46 @@
+"""
+Import time benchmarks.
+
+The timeraw_ functions follow the airspeed velocity (asv) convention: each
+returns code that asv times in a fresh interpreter.  Run this file directly
+for a quick measurement without asv:
+
+    python benchmarks/bench_import.py
+"""
+import subprocess
+import sys
+import time
+
+
+def timeraw_import_pyelw():
+    return "import pyelw"
+
+
+def timeraw_import_lw():
+    return "from pyelw import LW"
+
+
+def timeraw_import_lwlfc():
+    return "from pyelw import LWLFC"
+
+
+def timeraw_import_lw_bootstrap_m():
+    return "from pyelw import LWBootstrapM"
+
+
+def _time_fresh(code, repeat=10):
+    """Best wall-clock time of running code in a fresh interpreter."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+    baseline = _time_fresh("pass")
+    for name, func in sorted(globals().items()):
+        if name.startswith('timeraw_'):
+            elapsed = _time_fresh(func()) - baseline
+            print(f"{name:32s} {1e3 * elapsed:8.1f} ms")
@@ -0,0 +1,48 @@
+"""
+Fractional differencing and simulation benchmarks.
+
+The classes follow the airspeed velocity (asv) conventions (see
+bench_estimators.py).
+"""
+import numpy as np
+
+from pyelw.fracdiff import fracdiff
+from pyelw.simulate import arfima, arfima_batch, arfima_exact
+
+from .common import SIZES, simulated
+
+
+class TimeFracdiff:
+    """Fractional differencing of one series."""
+    params = (SIZES, [0.4, 1.3])
+    param_names = ['n', 'd']
+    timeout = 600
+
+    def setup(self, n, d):
+        self.x = simulated(n)
+
+    def time_fracdiff(self, n, d):
+        fracdiff(self.x, d)
+
+
+class TimeArfima:
+    """Simulation of one ARFIMA(1,d,0) series."""
+    params = (SIZES, [0.0, 0.5])
+    param_names = ['n', 'phi']
+    timeout = 600
+
+    def time_arfima(self, n, phi):
+        arfima(n, 0.4, phi=phi, seed=np.random.SeedSequence(1))
+
+    def time_arfima_exact(self, n, phi):
+        arfima_exact(n, 0.4, phi=phi, seed=np.random.SeedSequence(1))
+
+
+class TimeArfimaBatch:
+    """Simulation of 100 replications at once."""
+    params = SIZES[:5]
+    param_names = ['n']
+    timeout = 600
+
+    def time_arfima_batch(self, n):
+        arfima_batch(100, n, 0.4, seed=np.random.SeedSequence(1))
@@ -0,0 +1,63 @@
+"""
+Shared fixtures for the benchmarks: simulated series and the bundled data.
+"""
+import functools
+import os
+import numpy as np
+
+# Sample sizes of the simulated series
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6, 10**7]
+
+# Bandwidth rules: exponent a of m = n^a, or the name of a selector
+M_RULES = ['0.5', '0.65', '0.8', 'plugin']
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+# Bundled series: file name and, for CSV files, column
+DATASETS = {
+    'nile': ('nile.csv', 'nile'),
+    'sealevel': ('sealevel.csv', 'Sea'),
+    'np_realgnp': ('nelson_plosser_ext.csv', 'realgnp'),
+    'np_sp500': ('nelson_plosser_ext.csv', 'sp500'),
+    'cpi_us': ('cpi_us.dat', None),
+    'glotemp': ('glotemp.dat', None),
+    'snp500': ('snp500.dat', None),
+}
+
+
+@functools.lru_cache(maxsize=4)
+def simulated(n, d=0.4):
+    """ARFIMA(0,d,0) series of length n, the same on every call."""
+    from pyelw.simulate import arfima_batch
+    x = arfima_batch(1, n, d, seed=np.random.SeedSequence(20250101))[0]
+    x.flags.writeable = False
+    return x
+
+
+@functools.lru_cache(maxsize=None)
+def dataset(name):
+    """A bundled series, without missing values."""
+    filename, column = DATASETS[name]
+    path = os.path.join(DATA_DIR, filename)
+    if column is None:
+        x = np.loadtxt(path)
+    else:
+        with open(path) as f:
+            header = [h.strip('"') for h in f.readline().strip().split(',')]
+        values = np.genfromtxt(path, delimiter=',', skip_header=1, usecols=header.index(column),
+                               missing_values='NA', filling_values=np.nan)
+        x = values[np.isfinite(values)]
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    x.flags.writeable = False
+    return x
+
+
+def bandwidth(rule, n):
+    """Value of the m argument of fit() for a bandwidth rule."""
+    return rule if rule == 'plugin' else int(n**float(rule))
+
+
+def skip_if(condition):
+    """Skip a parameter combination (the asv convention)."""
+    if condition:
+        raise NotImplementedError
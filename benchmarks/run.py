@@ -0,0 +1,210 @@
+"""
+Run the benchmarks without asv and write the results as JSON.
+
+Discovers the benchmarks in the bench_*.py modules of this package with
+the asv conventions (Time* classes with time_* methods and parameters,
+and timeraw_* functions), times every parameter combination and writes
+one JSON document per run, for tracking performance over time:
+
+    python -m benchmarks.run --max-n 100000 --output results.json
+
+Each result records the best and median of several timings in seconds,
+or why the combination was skipped or failed.
+"""
+import argparse
+import datetime
+import importlib
+import itertools
+import json
+import math
+import os
+import pkgutil
+import platform
+import re
+import subprocess
+import sys
+import time
+import traceback
+
+import numpy as np
+
+
+def _discover():
+    """Benchmark modules of this package."""
+    package = os.path.dirname(os.path.abspath(__file__))
+    for info in pkgutil.iter_modules([package]):
+        if info.name.startswith('bench_'):
+            yield importlib.import_module(f'{__package__}.{info.name}')
+
+
+def _combinations(cls):
+    """Parameter combinations of a benchmark class, as dicts."""
+    names = list(getattr(cls, 'param_names', []))
+    params = getattr(cls, 'params', None)
+    if params is None:
+        return [{}]
+    if len(names) <= 1:
+        params = [params]
+        names = names or ['param']
+    return [dict(zip(names, combo)) for combo in itertools.product(*params)]
+
+
+def _benchmarks(pattern):
+    """All (name, kind, target, params) to run, in a stable order."""
+    for module in _discover():
+        short = module.__name__.rsplit('.', 1)[-1]
+        for attr in sorted(vars(module)):
+            obj = getattr(module, attr)
+            if attr.startswith('timeraw_') and callable(obj):
+                name = f'{short}.{attr}'
+                if re.search(pattern, name):
+                    yield name, 'raw', obj, {}
+            elif attr.startswith('Time') and isinstance(obj, type):
+                for method in sorted(m for m in vars(obj) if m.startswith('time_')):
+                    name = f'{short}.{attr}.{method}'
+                    if re.search(pattern, name):
+                        for params in _combinations(obj):
+                            yield name, 'method', (obj, method), params
+
+
+def _time_method(cls, method, params, repeat, budget):
+    """Timings of a benchmark method after its setup, or None if skipped."""
+    obj = cls()
+    args = list(params.values())
+    try:
+        if hasattr(obj, 'setup'):
+            obj.setup(*args)
+    except NotImplementedError:
+        return None
+    try:
+        func = getattr(obj, method)
+        # The first call also warms up caches and FFT plans
+        start = time.perf_counter()
+        func(*args)
+        first = time.perf_counter() - start
+        n = max(1, min(repeat, math.ceil(budget / max(first, 1e-9))))
+        samples = []
+        for _ in range(n):
+            start = time.perf_counter()
+            func(*args)
+            samples.append(time.perf_counter() - start)
+        return samples
+    finally:
+        if hasattr(obj, 'teardown'):
+            obj.teardown(*args)
+
+
+def _time_raw(func, repeat):
+    """Timings of the code returned by a timeraw_ function in fresh interpreters."""
+    def fresh(code):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        return time.perf_counter() - start
+
+    baseline = min(fresh('pass') for _ in range(repeat))
+    return [fresh(func()) - baseline for _ in range(repeat)]
+
+
+def _environment():
+    """Description of the machine and software versions."""
+    try:
+        from importlib.metadata import version
+        pyelw_version = version('pyelw')
+    except Exception:
+        pyelw_version = None
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                check=True).stdout.strip()
+    except Exception:
+        commit = None
+    return {
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'pyelw': pyelw_version,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def run(pattern='', max_n=None, repeat=5, budget=2.0, verbose=True):
+    """
+    Run the benchmarks and return the results as a JSON-serializable dict.
+
+    Parameters
+    ----------
+    pattern : str, default=''
+        Regular expression selecting benchmarks by name, e.g. 'TimeELW'.
+    max_n : int, optional
+        Skip parameter combinations with a sample size n above max_n.
+    repeat : int, default=5
+        Maximum number of timings per combination (after a warm-up call).
+    budget : float, default=2.0
+        Approximate time in seconds to spend timing each combination.
+    verbose : bool, default=True
+        Print each result as it is measured.
+
+    Returns
+    -------
+    dict
+        'environment' and a list of 'results', each with 'name',
+        'params', 'status' ('ok', 'skipped' or 'failed') and, if ok,
+        'min', 'median' and 'samples' (seconds).
+    """
+    results = []
+    for name, kind, target, params in _benchmarks(pattern):
+        result = {'name': name, 'params': params}
+        if max_n is not None and params.get('n', 0) > max_n:
+            result['status'] = 'skipped'
+        else:
+            try:
+                if kind == 'raw':
+                    samples = _time_raw(target, repeat)
+                else:
+                    samples = _time_method(*target, params, repeat, budget)
+            except Exception:
+                result['status'] = 'failed'
+                result['error'] = traceback.format_exc(limit=3)
+            else:
+                if samples is None:
+                    result['status'] = 'skipped'
+                else:
+                    result.update(status='ok', min=min(samples),
+                                  median=float(np.median(samples)), samples=samples)
+        results.append(result)
+
+        if verbose:
+            label = ', '.join(f'{k}={v}' for k, v in params.items())
+            timing = (f"{1e3 * result['min']:12.3f} ms" if result['status'] == 'ok'
+                      else f"{result['status']:>15s}")
+            print(f"{name:48s} {label:48s} {timing}", flush=True)
+
+    return {'environment': _environment(), 'results': results}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--filter', default='', help="regular expression selecting benchmarks")
+    parser.add_argument('--max-n', type=int, default=None, help="largest sample size to run")
+    parser.add_argument('--repeat', type=int, default=5, help="maximum timings per benchmark")
+    parser.add_argument('--budget', type=float, default=2.0,
+                        help="seconds to spend timing each benchmark")
+    parser.add_argument('--output', default=None, help="JSON output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    report = run(args.filter, max_n=args.max_n, repeat=args.repeat, budget=args.budget,
+                 verbose=args.output is not None)
+    text = json.dumps(report, indent=1)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+
+
+if __name__ == '__main__':
+    main()
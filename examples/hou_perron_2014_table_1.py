@@ -17,48 +17,7 @@ contaminations. _Journal of Econometrics_ 182, 309--328.
 
 import numpy as np
 from pyelw import LWLFC
-from pyelw.simulate import arfima
-
-
-def generate_rls(n, p, sigma_eta=1.0, seed=None):
-    """
-    Helper for generating a random level shift (RLS) process.
-
-    Following Definition 1 in Hou and Perron (2014, p. 311):
-    u_t = sum_{s=1}^t delta_{T,s} where delta_{T,t} = pi_{T,t} * eta_t
-    with eta_t ~ iid N(0, sigma_eta^2) and pi_{T,t} ~ Bernoulli(p/T, 1).
-
-    Parameters
-    ----------
-    n : int
-        Sample size.
-    p : float
-        Expected number of level shifts over the entire sample
-        (probability = p/n per period).
-    sigma_eta : float
-        Standard deviation of level shift magnitudes.
-    seed : int, optional
-        Random seed.
-
-    Returns
-    -------
-    np.ndarray
-        RLS process of length n.
-    """
-    rng = np.random.default_rng(seed)
-
-    # Bernoulli draws for level shift occurrences
-    probs = rng.random(n)
-    shifts = probs < (p / n)
-
-    # Level shift magnitudes
-    eta = rng.normal(0, sigma_eta, n)
-
-    # Cumulative sum of shifts
-    delta = shifts * eta
-    u = np.cumsum(delta)
-
-    return u
+from pyelw.simulate import arfima, random_level_shifts
 
 
 def run_monte_carlo(T, p, beta, alpha, mc_reps=500, seed=42):
@@ -85,7 +44,8 @@ def run_monte_carlo(T, p, beta, alpha, mc_reps=500, seed=42):
         y = arfima(T, d=0.0, phi=alpha, sigma=1.0, seed=arfima_seed)
 
         # Generate RLS contamination
-        u = generate_rls(T, p, sigma_eta=1.0, seed=rls_seed)
+        u = random_level_shifts(1, T, p, sigma_eta=1.0,
+                                seed=np.random.default_rng(rls_seed))[0]
 
         # Observed series
         z = y + u
@@ -1,13 +1,54 @@
-from .lw import LW
-from .elw import ELW
-from .twostep import TwoStepELW
-from .lw_bootstrap_m import LWBootstrapM
-from .lwlfc import LWLFC
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .lw import LW
+    from .elw import ELW
+    from .twostep import TwoStepELW
+    from .lw_bootstrap_m import LWBootstrapM
+    from .lw_plugin_m import LWPluginM
+    from .lwlfc import LWLFC
+    from .parallel import fit_collection, imap_fit, parallel_backend
+    from .montecarlo import monte_carlo
+
+# Public name -> submodule defining it.  Submodules are imported on first
+# access, so `import pyelw` stays cheap and heavy dependencies such as
+# joblib are only loaded when they are used.
+_exports = {
+    'LW': 'lw',
+    'ELW': 'elw',
+    'TwoStepELW': 'twostep',
+    'LWBootstrapM': 'lw_bootstrap_m',
+    'LWPluginM': 'lw_plugin_m',
+    'LWLFC': 'lwlfc',
+    'parallel_backend': 'parallel',
+    'fit_collection': 'parallel',
+    'imap_fit': 'parallel',
+    'monte_carlo': 'montecarlo',
+}
 
 __all__ = [
     'LW',
     'ELW',
     'TwoStepELW',
     'LWBootstrapM',
+    'LWPluginM',
     'LWLFC',
+    'parallel_backend',
+    'fit_collection',
+    'imap_fit',
+    'monte_carlo',
 ]
+
+
+def __getattr__(name):
+    if name in _exports:
+        module = importlib.import_module(f'.{_exports[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,11 @@
 import numpy as np
 from typing import Optional, Dict, Any, Tuple
 
-from .optimization import golden_section_search, robust_golden_section_search
+from .gph import initial_bracket, periodogram
+from .optimization import (bracketed_search, chebyshev_search, robust_golden_section_search,
+                           scalar_search, search_tolerance,
+                           vectorized_golden_section_search,
+                           vectorized_robust_golden_section_search)
 from .fracdiff import fracdiff
 
 
@@ -20,10 +24,27 @@ class ELW:
         - 'none': no mean correction
     n_grid : int, default=20
         Number of grid points for robust optimization check. If n_grid > 0,
-        performs a coarse grid search to verify the golden section search
-        found the global minimum. Recommended when local minima are suspected.
+        performs a coarse grid search first and refines its minimum by golden
+        section search, so that the global minimum is found. Recommended
+        when local minima are suspected.
         Set n_grid = 0 to use standard golden section search only (faster but
         less robust).
+    optimizer : str, default='golden'
+        Local minimizer: 'golden' for golden section search or 'brent' for
+        Brent's method. The grid check of n_grid applies to both.
+    tol : float or 'se', optional
+        Convergence tolerance of the minimizer. Default sqrt(machine
+        epsilon). 'se' resolves d to 1% of its asymptotic standard error.
+    surrogate : bool, default=False
+        Minimize a Chebyshev interpolant of the objective instead of
+        searching the objective directly. The objective is evaluated at
+        n_nodes Chebyshev nodes with batched FFTs, the interpolant is
+        minimized over the whole bracket, which replaces the n_grid check,
+        and its minimizer is polished by a few exact evaluations to within
+        tol. Needs far fewer evaluations for the smooth objectives of
+        repeated fits, as in simulations and rolling windows.
+    n_nodes : int, default=12
+        Number of Chebyshev nodes when surrogate=True.
 
     Attributes
     ----------
@@ -41,6 +62,9 @@ class ELW:
         Final objective function value.
     nfev_ : int
         Number of function evaluations.
+    surrogate_error_ : float
+        Estimated largest error of the Chebyshev interpolant over the
+        bracket (only if surrogate=True).
 
     References
     ----------
@@ -48,13 +72,22 @@ class ELW:
     of Fractional Integration. _Annals of Statistics_ 33, 1890--1933.
     """
 
-    def __init__(self, bounds=(-1.0, 2.2), mean_est='none', n_grid=20):
+    def __init__(self, bounds=(-1.0, 2.2), mean_est='none', n_grid=20, optimizer='golden',
+                 tol=None, surrogate=False, n_nodes=12):
         self._default_bounds = (-1.0, 2.2)
         self._default_mean_est = 'none'
+        self._default_optimizer = 'golden'
+        self._default_tol = None
+        self._default_surrogate = False
+        self._default_n_nodes = 12
 
         self.bounds = bounds
         self.mean_est = mean_est
         self.n_grid = n_grid
+        self.optimizer = optimizer
+        self.tol = tol
+        self.surrogate = surrogate
+        self.n_nodes = n_nodes
 
     def objective(self, d: float, X: np.ndarray, m: int, x_fft=None) -> float:
         """
@@ -107,7 +140,53 @@ class ELW:
         except (OverflowError, ZeroDivisionError, ValueError):
             return np.float64(np.inf)
 
-    def fit(self, X, m=None, verbose=False, n_jobs=1):
+    def objective_many(self, d: np.ndarray, X: np.ndarray, m: int, x_fft=None) -> np.ndarray:
+        """
+        Exact Local Whittle objective function for many series at once.
+
+        Fractionally differences each row of X at its own value of d and
+        computes all periodograms with batched FFTs.
+
+        Parameters
+        ----------
+        d : np.ndarray
+            Memory parameter for each series
+        X : np.ndarray
+            2-D array with one time series per row
+        m : int
+            Number of frequencies to use
+        x_fft : np.ndarray, optional
+            Pre-computed FFTs of the rows of X, as used by fracdiff.
+
+        Returns
+        -------
+        np.ndarray
+            ELW objective function values, inf where undefined
+        """
+        n = X.shape[-1]
+        d = np.asarray(d, dtype=np.float64)
+
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            # Fractionally difference the original series
+            dx = fracdiff(X, d, x_fft=x_fft)
+
+            # Compute FFT and periodogram
+            fft_dx = np.fft.fft(dx)
+            I_dx = np.abs(fft_dx)**2 / (2 * np.pi * n)
+
+            # Use first m frequencies (excluding zero)
+            I_dx_m = I_dx[..., 1:m+1]  # frequencies 1, 2, ..., m
+            freqs = 2 * np.pi * np.arange(1, m+1, dtype=np.float64) / n
+
+            # ELW objective function
+            G_hat = np.mean(I_dx_m, axis=-1)
+            first_term = np.log(G_hat)
+            second_term = -2 * d * np.mean(np.log(freqs))
+            obj = first_term + second_term
+
+        return np.where((G_hat > 0) & np.isfinite(obj), obj, np.inf)
+
+    def fit(self, X, m=None, verbose=False, n_jobs=1, time_budget=None, d_init=None):
         """
         Exact local Whittle estimation of memory parameter d.
 
@@ -115,17 +194,29 @@ class ELW:
         ----------
         X : np.ndarray
             Time series data.
-        m : int or 'auto', optional
+        m : int, 'auto' or 'plugin', optional
             Number of frequencies to use. Options:
             - int: Use specified number of frequencies
             - None: Use default n^0.65
             - 'auto': Use bootstrap procedure to select optimal bandwidth
+            - 'plugin': Use plug-in MSE-optimal bandwidth (fast)
         verbose : bool, default=False
             Print diagnostic information during fitting.
         n_jobs : int, default=1
             Number of parallel jobs for the bootstrap bandwidth search when
-            m='auto' (ignored otherwise). Default 1 runs serially. -1 uses
-            all available cores; any positive integer sets the worker count.
+            m='auto'. Default 1 runs serially. -1 uses all available cores;
+            any positive integer sets the worker count. Also the number of
+            threads evaluating the n_grid safety-check grid.
+        time_budget : float, optional
+            Maximum time in seconds for the bootstrap bandwidth search when
+            m='auto' (ignored otherwise). When exhausted, the best bandwidth
+            found so far is used and bootstrap_m_truncated_ is set.
+        d_init : float or 'gph', optional
+            Initial value of d. The search starts in a bracket of 2.576
+            asymptotic standard errors around d_init, widened if the
+            minimum lies on its edge, and the n_grid safety check is
+            skipped. 'gph' uses the log-periodogram regression estimate
+            (see pyelw.gph.gph).
 
         Returns
         -------
@@ -152,7 +243,8 @@ class ELW:
             # Use bootstrap MSE bandwidth selection to find optimal m
             from .lw_bootstrap_m import LWBootstrapM
             selector = LWBootstrapM(bounds=self.bounds, verbose=verbose,
-                                    n_jobs=n_jobs)
+                                    n_jobs=n_jobs, time_budget=time_budget,
+                                    optimizer=self.optimizer, tol=self.tol)
             selector.fit(X)
 
             # Store bootstrap-specific attributes
@@ -160,9 +252,21 @@ class ELW:
             self.bootstrap_m_iterations_ = selector.iterations_
             self.bootstrap_m_mse_profile_ = selector.mse_profile_
             self.bootstrap_m_k_n_ = selector.k_n_
+            self.bootstrap_m_truncated_ = selector.truncated_
 
             # Use the optimal m for ELW estimation
             m = selector.optimal_m_
+        elif m == 'plugin':
+            # Use plug-in MSE-optimal bandwidth
+            from .lw_plugin_m import LWPluginM
+            selector = LWPluginM(bounds=self.bounds, verbose=verbose)
+            selector.select(X)
+
+            # Store plug-in-specific attributes
+            self.plugin_m_optimal_m_ = selector.optimal_m_
+            self.plugin_m_curvature_ = selector.curvature_
+
+            m = selector.optimal_m_
 
         # Pre-compute FFT for optimization
         np2 = 1 << (2*n - 1).bit_length()
@@ -172,11 +276,19 @@ class ELW:
         def objective_func(d: float) -> float:
             return self.objective(d, X, m, x_fft=x_fft)
 
-        # Optimize using golden section search with bounds
-        if self.n_grid > 0:
-            result = robust_golden_section_search(objective_func, brack=self.bounds, n_grid=self.n_grid)
+        # Optimize within bounds
+        tol = search_tolerance(self.tol, m)
+        if self.surrogate:
+            result = self._surrogate_search(X, m, x_fft, tol, d_init)
+        elif d_init is not None:
+            center, width = self._initial_bracket(d_init, X, m)
+            result = bracketed_search(objective_func, self.bounds, center, width,
+                                      method=self.optimizer, tol=tol)
+        elif self.n_grid > 0:
+            result = robust_golden_section_search(objective_func, brack=self.bounds, n_grid=self.n_grid,
+                                                  tol=tol, method=self.optimizer, n_jobs=n_jobs)
         else:
-            result = golden_section_search(objective_func, brack=self.bounds)
+            result = scalar_search(objective_func, brack=self.bounds, method=self.optimizer, tol=tol)
 
         if not result.success:
             if verbose:
@@ -220,16 +332,150 @@ class ELW:
         self.ase_ = ase
         self.objective_ = final_obj
         self.nfev_ = result.nfev
+        if self.surrogate:
+            self.surrogate_error_ = result.error_bound
 
         return self
 
+    @staticmethod
+    def _initial_bracket(d_init, X, m):
+        """Initial bracket for d_init (see pyelw.gph.initial_bracket)."""
+        # The objective computes the periodogram of the differenced series
+        # at each d, so the periodogram of X is computed once here
+        I_X, freqs = periodogram(X, m) if isinstance(d_init, str) else (None, None)
+        return initial_bracket(d_init, m, I_X, freqs)
+
+    def _surrogate_search(self, X, m, x_fft, tol, d_init=None):
+        """Minimize a Chebyshev interpolant of the objective (see surrogate)."""
+        def objective_func(d: np.ndarray) -> np.ndarray:
+            return self.objective_many(d, X, m, x_fft=x_fft)
+
+        lower, upper = self.bounds
+        if d_init is None:
+            return chebyshev_search(objective_func, (lower, upper), n_nodes=self.n_nodes, tol=tol)
+
+        # Interpolate over the narrow bracket, and over all of bounds if
+        # the minimum lies on one of its inner edges
+        center, width = self._initial_bracket(d_init, X, m)
+        if np.isfinite(center) and np.isfinite(width):
+            xl, xr = max(lower, center - width), min(upper, center + width)
+            if xl < xr:
+                result = chebyshev_search(objective_func, (xl, xr), n_nodes=self.n_nodes, tol=tol)
+                edge = 10 * tol * max(1.0, abs(result.x))
+                if not ((xl > lower and result.x - xl <= edge) or
+                        (xr < upper and xr - result.x <= edge)):
+                    return result
+                retry = chebyshev_search(objective_func, (lower, upper), n_nodes=self.n_nodes,
+                                         tol=tol)
+                retry.nfev += result.nfev
+                return retry
+        return chebyshev_search(objective_func, (lower, upper), n_nodes=self.n_nodes, tol=tol)
+
+    def fit_many(self, X: np.ndarray, m: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Exact local Whittle estimation for many series of equal length.
+
+        At each step of the search, all series are fractionally differenced
+        at their current trial values of d and their periodograms computed
+        with batched FFTs, and the golden section searches of all series
+        advance in lockstep.  Each series gives the same estimate as fit()
+        with optimizer='golden'; the optimizer and surrogate settings are
+        not used here.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            2-D array with one time series per row
+        m : int, optional
+            Number of frequencies to use for every series. Default n^0.65.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary containing:
+            - 'n': sample size
+            - 'm': number of frequencies
+            - 'd_hat': array of memory parameter estimates
+            - 'se': array of standard errors
+            - 'ase': asymptotic standard error
+            - 'objective': array of objective function values
+            - 'nfev': array of objective function evaluation counts
+            - 'method': estimation method
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2:
+            raise ValueError("X must be a 2-D array with one series per row")
+
+        # Mean adjustment (see Shimotsu, 2010, section 3)
+        if self.mean_est == 'mean':
+            # Subtract sample means
+            X = X - np.mean(X, axis=-1, keepdims=True)
+        elif self.mean_est == 'init':
+            # Subtract initial values
+            X = (X - X[:, :1])[:, 1:]
+        elif self.mean_est == 'none':
+            pass
+        else:
+            raise ValueError("mean_est must be one of 'mean', 'init', 'none'")
+
+        n_series, n = X.shape
+        if m is None:
+            m = int(n**0.65)
+        elif isinstance(m, str):
+            raise ValueError("fit_many requires an integer bandwidth m")
+
+        # Pre-compute FFTs for optimization
+        np2 = 1 << (2*n - 1).bit_length()
+        x_fft = np.fft.rfft(X, n=np2)
+
+        # ELW objective function for the series in index
+        def objective_func(d: np.ndarray, index: np.ndarray) -> np.ndarray:
+            return self.objective_many(d, X[index], m, x_fft=x_fft[index])
+
+        # Optimize all series in lockstep
+        lower = np.full(n_series, self.bounds[0], dtype=np.float64)
+        upper = np.full(n_series, self.bounds[1], dtype=np.float64)
+        index = np.arange(n_series)
+        tol = search_tolerance(self.tol, m)
+        if self.n_grid > 0:
+            result = vectorized_robust_golden_section_search(objective_func, lower, upper,
+                                                             n_grid=self.n_grid, tol=tol)
+        else:
+            result = vectorized_golden_section_search(lambda d: objective_func(d, index),
+                                                      lower, upper, tol=tol)
+
+        valid = np.isfinite(result.x) & np.isfinite(result.fun)
+        d_hat = np.where(valid, result.x, np.nan)
+        final_obj = np.where(valid, result.fun, np.nan)
+
+        # Standard error based on Fisher information, using a finite
+        # difference approximation of the second derivative
+        d_safe = np.where(valid, d_hat, 0.0)
+        fl = objective_func(d_safe * 0.99, index)
+        fu = objective_func(d_safe * 1.01, index)
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            d2 = 1.0e4*(fl - 2*final_obj + fu)/d_hat**2
+            se = np.where(valid & (d2 > 0), np.sqrt(1/(m*d2)), np.nan)
+
+        return {
+            'n': n,
+            'm': m,
+            'd_hat': d_hat,
+            'se': se,
+            'ase': 1 / (2 * np.sqrt(m)),
+            'objective': final_obj,
+            'nfev': result.nfev,
+            'method': 'elw',
+        }
+
     def estimate(self,
                  X: np.ndarray,
                  m = None,
                  bounds: Optional[Tuple[float, float]] = None,
                  mean_est: Optional[str] = None,
                  verbose: Optional[bool] = False,
-                 n_jobs: int = 1) -> Dict[str, Any]:
+                 n_jobs: int = 1,
+                 time_budget: Optional[float] = None) -> Dict[str, Any]:
         """
         Exact local Whittle estimation of memory parameter d.
 
@@ -241,8 +487,9 @@ class ELW:
         ----------
         X : np.ndarray
             Time series data
-        m : int or 'auto', optional
-            Number of frequencies to use. Use 'auto' for bootstrap selection.
+        m : int, 'auto' or 'plugin', optional
+            Number of frequencies to use. Use 'auto' for bootstrap selection
+            or 'plugin' for plug-in selection.
         bounds: tuple[float, float], optional
             Lower and upper bounds for golden section search.
             If provided, temporarily overrides constructor bounds.
@@ -253,8 +500,12 @@ class ELW:
             Print diagnostic information
         n_jobs : int, default=1
             Number of parallel jobs for the bootstrap bandwidth search when
-            m='auto' (ignored otherwise). Default 1 runs serially. -1 uses
-            all available cores; any positive integer sets the worker count.
+            m='auto', and of threads evaluating the safety-check grid.
+            Default 1 runs serially. -1 uses all available cores.
+        time_budget : float, optional
+            Maximum time in seconds for the bootstrap bandwidth search when
+            m='auto' (ignored otherwise). When exhausted, the best bandwidth
+            found so far is used and bootstrap_m_truncated_ is set.
 
         Returns
         -------
@@ -273,7 +524,8 @@ class ELW:
 
         try:
             # Fit the model
-            self.fit(X, m=m, verbose=verbose, n_jobs=n_jobs)
+            self.fit(X, m=m, verbose=verbose, n_jobs=n_jobs,
+                     time_budget=time_budget)
 
             # Return results as dictionary for backward compatibility
             return {
@@ -299,6 +551,14 @@ class ELW:
             params.append(f"bounds={self.bounds}")
         if self.mean_est != self._default_mean_est:
             params.append(f"mean_est='{self.mean_est}'")
+        if self.optimizer != self._default_optimizer:
+            params.append(f"optimizer='{self.optimizer}'")
+        if self.tol != self._default_tol:
+            params.append(f"tol={self.tol!r}")
+        if self.surrogate != self._default_surrogate:
+            params.append(f"surrogate={self.surrogate}")
+        if self.n_nodes != self._default_n_nodes:
+            params.append(f"n_nodes={self.n_nodes}")
 
         params_str = ", ".join(params)
         return f"ELW({params_str})"
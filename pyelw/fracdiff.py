@@ -1,7 +1,7 @@
 import numpy as np
 
 
-def fracdiff(x: np.ndarray, d: float, x_fft=None) -> np.ndarray:
+def fracdiff(x: np.ndarray, d, x_fft=None) -> np.ndarray:
     """
     Apply fractional differencing operator (1-L)^d to time series.
 
@@ -10,18 +10,20 @@ def fracdiff(x: np.ndarray, d: float, x_fft=None) -> np.ndarray:
     Parameters
     ----------
     x : np.ndarray
-        Input time series
-    d : float
-        Fractional differencing parameter
+        Input time series.  For a 2-D array, each row is differenced
+        separately with a single batched FFT.
+    d : float or np.ndarray
+        Fractional differencing parameter.  For 2-D x, an array gives a
+        separate parameter for each row.
     x_fft : np.ndarray, optional
         Pre-computed FFT of x. If provided, skips recomputing FFT of x.
 
     Returns
     -------
     np.ndarray
-        Fractionally differenced series (same length as input)
+        Fractionally differenced series (same shape as input)
     """
-    n = len(x)
+    n = x.shape[-1]
 
     if n == 0:
         return x
@@ -35,17 +37,18 @@ def fracdiff(x: np.ndarray, d: float, x_fft=None) -> np.ndarray:
     else:
         x_fft_ = np.fft.rfft(x, n=np2)
 
-    # Single allocation for coefficients with padding
-    b_full = np.zeros(np2)
-    b_full[0] = 1.0
+    # Single allocation for coefficients with padding, one row per value of d
+    d = np.asarray(d, dtype=np.float64)
+    b_full = np.zeros(d.shape + (np2,))
+    b_full[..., 0] = 1.0
 
     # Compute coefficients in-place
     if n > 1:
         k = np.arange(1, n, dtype=np.float64)
-        b_full[1:n] = np.cumprod((k - d - 1) / k)
+        b_full[..., 1:n] = np.cumprod((k - d[..., None] - 1) / k, axis=-1)
 
     # Use rfft for real inputs
     b_fft = np.fft.rfft(b_full)
 
     # Compute and return
-    return np.fft.irfft(x_fft_ * b_fft, n=np2)[:n]
+    return np.fft.irfft(x_fft_ * b_fft, n=np2)[..., :n]
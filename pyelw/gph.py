@@ -0,0 +1,137 @@
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+
+
+def gph(X: np.ndarray, m: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Log-periodogram regression estimate of the memory parameter d.
+
+    Regresses the log periodogram on a constant and -2 log(lambda_j) over
+    the first m Fourier frequencies, as in Geweke and Porter-Hudak (1983)
+    and Robinson (1995).  The estimate is available in closed form, so it
+    is cheap to compute and can be used to bracket the search of the
+    local Whittle estimators (see the d_init argument of LW.fit and
+    ELW.fit).
+
+    Parameters
+    ----------
+    X : np.ndarray
+        Time series data
+    m : int, optional
+        Number of frequencies to use. Default n^0.65.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionary containing:
+        - 'n': sample size
+        - 'm': number of frequencies
+        - 'd_hat': estimate of d (NaN if fewer than two usable frequencies)
+        - 'se': asymptotic standard error, pi / sqrt(24 sum (x_j - x_bar)^2)
+          with x_j = log(lambda_j)
+        - 'method': 'gph'
+
+    References
+    ----------
+    Geweke, J. and S. Porter-Hudak (1983). The Estimation and Application
+    of Long Memory Time Series Models. _Journal of Time Series Analysis_ 4,
+    221--238.
+
+    Robinson, P. M. (1995). Log-Periodogram Regression of Time Series with
+    Long Range Dependence. _Annals of Statistics_ 23, 1048--1072.
+    """
+    X = np.asarray(X, dtype=np.float64).flatten()
+    n = len(X)
+    if m is None:
+        m = int(n**0.65)
+    m = min(m, n // 2)
+
+    I_X, freqs = periodogram(X, m)
+    d_hat, se = log_periodogram_regression(I_X, freqs)
+    return {'n': n, 'm': m, 'd_hat': d_hat, 'se': se, 'method': 'gph'}
+
+
+def periodogram(X: np.ndarray, m: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Periodogram of X at the first m Fourier frequencies.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Periodogram I_j and frequencies lambda_j = 2 pi j / n, j = 1, ..., m
+    """
+    n = len(X)
+    I_X = np.abs(np.fft.rfft(X)[1:m+1])**2 / (2 * np.pi * n)
+    freqs = 2 * np.pi * np.arange(1, m+1, dtype=np.float64) / n
+    return I_X, freqs
+
+
+def log_periodogram_regression(I_X: np.ndarray, freqs: np.ndarray) -> Tuple[Any, Any]:
+    """
+    Log-periodogram regression estimate of d from periodogram ordinates.
+
+    The O(m) regression of gph, for periodograms the estimators have
+    already computed.  Zero ordinates are left out.
+
+    Parameters
+    ----------
+    I_X : np.ndarray
+        Periodogram at freqs, or a 2-D array with one periodogram per row
+    freqs : np.ndarray
+        Frequencies of the periodogram ordinates
+
+    Returns
+    -------
+    Tuple
+        Estimate of d and its standard error pi / sqrt(24 sum (x_j - x_bar)^2)
+        with x_j = log(lambda_j), one per periodogram, NaN where fewer than
+        two ordinates are positive.
+    """
+    valid = I_X > 0
+    count = np.count_nonzero(valid, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_I = np.where(valid, np.log(np.where(valid, I_X, 1.0)), 0.0)
+        log_freqs = np.log(freqs)
+        mean = np.sum(np.where(valid, log_freqs, 0.0), axis=-1) / count
+        x = np.where(valid, log_freqs - mean[..., np.newaxis], 0.0)
+        sxx = np.sum(x**2, axis=-1)
+
+        # Least squares slope of log I_j on -2 log(lambda_j)
+        d_hat = -0.5 * np.sum(x * log_I, axis=-1) / sxx
+        se = np.pi / np.sqrt(24 * sxx)
+    enough = count >= 2
+    return np.where(enough, d_hat, np.nan)[()], np.where(enough, se, np.nan)[()]
+
+
+def initial_bracket(d_init, m: int, I_X: Optional[np.ndarray] = None,
+                    freqs: Optional[np.ndarray] = None) -> Tuple[float, float]:
+    """
+    Center and half-width of a narrow initial search bracket for d.
+
+    Parameters
+    ----------
+    d_init : float or 'gph'
+        Initial value of d, such as the estimate for a neighboring window
+        in a rolling analysis, or 'gph' for the log-periodogram regression
+        estimate.
+    m : int
+        Number of frequencies
+    I_X : np.ndarray, optional
+        Periodogram ordinates prepared by the estimator, required for
+        'gph'.  The estimate is an O(m) regression on them.
+    freqs : np.ndarray, optional
+        Frequencies of the periodogram ordinates, required for 'gph'
+
+    Returns
+    -------
+    Tuple[float, float]
+        Center and half-width.  The half-width is 2.576 standard errors:
+        those of the log-periodogram estimate for 'gph', and the local
+        Whittle asymptotic standard error 1/(2 sqrt(m)) otherwise.
+    """
+    if isinstance(d_init, str):
+        if d_init != 'gph':
+            raise ValueError("d_init must be a float, 'gph' or None")
+        d_hat, se = log_periodogram_regression(I_X, freqs)
+        return d_hat, 2.576 * se
+    return float(d_init), 2.576 / (2 * np.sqrt(m))
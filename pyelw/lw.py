@@ -1,7 +1,34 @@
 import numpy as np
 from typing import Optional, Dict, Any, Tuple
 
-from .optimization import golden_section_search
+from .gph import initial_bracket
+from .optimization import (bracketed_search, scalar_search, search_tolerance,
+                           vectorized_bracketed_search, vectorized_golden_section_search)
+
+
+def local_whittle_objective(d: float, data: Dict[str, np.ndarray]) -> float:
+    """
+    Untapered local Whittle objective (see LW.objective).
+
+    A module-level function, so that parallel workers can be sent the
+    objective without an estimator instance.
+    """
+    freqs = data['freqs']
+    I_X = data['I_X']
+
+    try:
+        G_hat = np.mean(I_X * (freqs**(2*d)))
+        if G_hat <= 0:
+            return np.float64(np.inf)
+
+        obj = np.log(G_hat) - 2 * d * np.mean(np.log(freqs))
+        if not np.isfinite(obj):
+            return np.float64(np.inf)
+
+        return np.float64(obj)
+
+    except (OverflowError, ZeroDivisionError, ValueError):
+        return np.float64(np.inf)
 
 
 class LW:
@@ -26,6 +53,14 @@ class LW:
 
     diff : int, default=1
         Number of times to difference for HC taper. Only used when taper='hc'.
+    optimizer : str, default='golden'
+        Minimizer of the objective function: 'golden' for golden section
+        search or 'brent' for Brent's method, which needs far fewer
+        objective evaluations on these smooth objectives.
+    tol : float or 'se', optional
+        Convergence tolerance of the minimizer. Default sqrt(machine
+        epsilon). 'se' stops once d is resolved to 1% of its asymptotic
+        standard error.
 
     Attributes
     ----------
@@ -63,14 +98,18 @@ class LW:
     21, 155--180.
     """
 
-    def __init__(self, bounds=(-1.0, 2.2), taper='none', diff=1):
+    def __init__(self, bounds=(-1.0, 2.2), taper='none', diff=1, optimizer='golden', tol=None):
         self._default_bounds = (-1.0, 2.2)
         self._default_taper = 'none'
         self._default_diff = 1
+        self._default_optimizer = 'golden'
+        self._default_tol = None
 
         self.bounds = bounds
         self.taper = taper
         self.diff = diff
+        self.optimizer = optimizer
+        self.tol = tol
 
     def _hc_dft(self, y: np.ndarray, max_j: Optional[int] = None):
         r"""
@@ -82,7 +121,7 @@ class LW:
         Parameters
         ----------
         y : np.ndarray
-            Input data
+            Input data.  For 2-D input, the DFT of each row is computed.
         max_j : int, optional
             Maximum frequency index to compute. If None, computes up to n.
 
@@ -91,7 +130,7 @@ class LW:
         np.ndarray
             Complex DFT values w_j for j = 0, 1, ..., max_j
         """
-        n = len(y)
+        n = y.shape[-1]
 
         if max_j is None:
             max_j = n - 1
@@ -102,7 +141,7 @@ class LW:
         j = np.arange(max_j + 1)
         A = np.fft.ifft(y) * n
         phase = np.exp(1j * 2 * np.pi * j / n)
-        w = phase * A[:max_j + 1] / np.sqrt(2 * np.pi * n)
+        w = phase * A[..., :max_j + 1] / np.sqrt(2 * np.pi * n)
 
         return w
 
@@ -114,7 +153,8 @@ class LW:
         Parameters
         ----------
         X : np.ndarray
-            Time series data
+            Time series data.  For a 2-D array, each row is a separate series
+            and the periodograms are returned as rows of 'I_X'.
         m : int
             Number of frequencies to use in estimation
         taper : str, optional
@@ -130,7 +170,7 @@ class LW:
             - For 'kolmogorov', 'cosine', and 'bartlett': 'n', 'm', 'I_X' (subsampled periodogram), 'freqs', 'p', 'Phi'
             - For 'hc': 'n', 'm', 'I_X' (periodogram), 'freqs', 'diff'
         """
-        n = len(X)
+        n = X.shape[-1]
 
         # Apply taper and differencing if needed to produce X_tapered
         if taper == 'kolmogorov':
@@ -171,7 +211,7 @@ class LW:
             X_diff = X.copy()
             for _ in range(diff):
                 X_diff = np.diff(X_diff)
-            n = len(X_diff)  # Update n after differencing
+            n = X_diff.shape[-1]  # Update n after differencing
 
             # Apply complex cosine bell taper from Hurvich-Chen (2000, eq. 3):
             # h_t = 0.5*(1 - exp(i * 2 * pi * (t - 1/2) / n)).
@@ -195,7 +235,7 @@ class LW:
             # For Velasco (1999) tapers, normalize by H = sum(h_t^2)
             # The tapered periodogram is I_T(\lambda) = |sum h_t x_t exp(i\lambda t)|^2 / (2\pi H)
             H = np.sum(h**2)
-            I_X_full = (np.abs(fft_X[1:])**2) / (2 * np.pi * H)
+            I_X_full = (np.abs(fft_X[..., 1:])**2) / (2 * np.pi * H)
 
             # Subsample with appropriate step p
             if taper == 'bartlett':
@@ -212,7 +252,7 @@ class LW:
 
             # Subsample periodogram and compute frequencies
             indices = j - 1  # Convert to 0-based for array access
-            I_X = I_X_full[indices]  # Pre-subsampled periodogram
+            I_X = I_X_full[..., indices]  # Pre-subsampled periodogram
 
             return {
                 'n': n,
@@ -231,7 +271,7 @@ class LW:
             # Normalization: for HC taper, \sum_t |h_t|^2 = n/2.
             # The paper's DFT already includes 1/sqrt(2 \pi n),
             # so we need to adjust by sqrt(n) / sqrt(n/2) = sqrt(2).
-            w_T = w_tapered[1:m+1] * np.sqrt(2)
+            w_T = w_tapered[..., 1:m+1] * np.sqrt(2)
 
             # Tapered periodogram I_j^T = |w_j^T|^2
             I_X = np.abs(w_T)**2
@@ -251,7 +291,7 @@ class LW:
         else:
 
             # Standard periodogram (skip DC component)
-            I_X = np.abs(fft_X[1:m+1])**2 / (2 * np.pi * n)
+            I_X = np.abs(fft_X[..., 1:m+1])**2 / (2 * np.pi * n)
 
             # Frequencies: \lambda_j = (2 \pi j)/n for j = 1, ..., m
             freqs = 2 * np.pi * np.arange(1, m+1, dtype=np.float64) / n
@@ -295,22 +335,7 @@ class LW:
         float
             Local Whittle objective value to be minimized
         """
-        freqs = data['freqs']
-        I_X = data['I_X']
-
-        try:
-            G_hat = np.mean(I_X * (freqs**(2*d)))
-            if G_hat <= 0:
-                return np.float64(np.inf)
-
-            obj = np.log(G_hat) - 2 * d * np.mean(np.log(freqs))
-            if not np.isfinite(obj):
-                return np.float64(np.inf)
-
-            return np.float64(obj)
-
-        except (OverflowError, ZeroDivisionError, ValueError):
-            return np.float64(np.inf)
+        return local_whittle_objective(d, data)
 
     def objective_velasco(self, d: float, data: Dict[str, np.ndarray]) -> float:
         """
@@ -393,7 +418,95 @@ class LW:
         except (OverflowError, ZeroDivisionError, ValueError, KeyError):
             return np.float64(np.inf)
 
-    def fit(self, X, m=None, verbose=False, n_jobs=1):
+    def objective_many(self, d: np.ndarray, data: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Local Whittle objective function for many series at once.
+
+        Evaluates the objective of the current taper for each row of the
+        periodogram matrix prepared from a 2-D array, at its own value of d.
+
+        Parameters
+        ----------
+        d : np.ndarray
+            Memory parameter for each series (for differenced data with the
+            'hc' taper)
+        data : Dict[str, np.ndarray]
+            Precomputed quantities from prepare_data applied to a 2-D array
+
+        Returns
+        -------
+        np.ndarray
+            Objective function values, inf where the objective is undefined
+        """
+        freqs = data['freqs']
+        I_X = data['I_X']
+        d = np.asarray(d, dtype=np.float64)
+
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            if self.taper in ['kolmogorov', 'cosine', 'bartlett']:
+                p = data['p']
+                m = data['m']
+                G_hat = (p / m) * np.sum(I_X * (freqs**(2*d[..., None])), axis=-1)
+                obj = np.log(G_hat) - 2*d*(p/m) * np.sum(np.log(freqs))
+            else:
+                G_hat = np.mean(I_X * (freqs**(2*d[..., None])), axis=-1)
+                obj = np.log(G_hat) - 2 * d * np.mean(np.log(freqs))
+
+        return np.where((G_hat > 0) & np.isfinite(obj), obj, np.inf)
+
+    def _standard_errors(self, d_hat, data: Dict[str, np.ndarray]):
+        """
+        Standard and asymptotic standard errors at the estimate d_hat.
+
+        d_hat may be a scalar or, with data prepared from a 2-D array, an
+        array with one estimate per series.
+        """
+        m = data['m']
+
+        if self.taper == 'none':
+
+            # Standard local Whittle standard error
+            freqs = data['freqs']
+            I_X = data['I_X']
+
+            # Derivatives at estimated d_hat
+            lambda_2d = freqs**(2 * np.asarray(d_hat)[..., None])
+            log_lambda = np.log(freqs)
+            d0 = np.mean(lambda_2d * I_X, axis=-1)
+            d1 = 2 * np.mean(log_lambda * lambda_2d * I_X, axis=-1)
+            d2 = 4 * np.mean((log_lambda**2) * lambda_2d * I_X, axis=-1)
+
+            # Fisher Information-based standard error:
+            # d0/(sqrt(m)*sqrt(d0*d2-d1^2))
+            fisher_info = d0 * d2 - d1**2
+            with np.errstate(invalid='ignore', divide='ignore'):
+                se = d0 / (np.sqrt(m) * np.sqrt(fisher_info))
+            se = np.where((fisher_info > 0) & (d0 > 0), se, np.nan)[()]
+
+            # Asymptotic standard error
+            ase = 1 / (2 * np.sqrt(m))
+
+        elif self.taper in ['kolmogorov', 'cosine', 'bartlett']:
+
+            # Velasco (1999, p. 100)
+            p = data['p']
+            Phi = data['Phi']
+            ase = np.sqrt(p * Phi / (4 * m))
+            se = ase
+
+        elif self.taper == 'hc':
+
+            # Asymptotic standard errors: Hurvich and Chen (2020, Theorem 2)
+            ase = np.sqrt(1.5 / (4 * m))
+            # Standard errors: Hurvich and Chen (2020, eq. 11)
+            two_sin_half_freqs = 2.0 * np.sin(data['freqs'] / 2.0)
+            v = np.log(two_sin_half_freqs) - np.mean(np.log(two_sin_half_freqs))
+            v2_sum = np.sum(v**2)
+            se = np.sqrt(1.5 / (4 * v2_sum))
+
+        return se, ase
+
+    def fit(self, X, m=None, verbose=False, n_jobs=1, time_budget=None, d_init='gph'):
         """
         Local Whittle estimation of memory parameter d.
 
@@ -401,17 +514,32 @@ class LW:
         ----------
         X : np.ndarray
             Time series data
-        m : int or 'auto', optional
+        m : int, 'auto' or 'plugin', optional
             Number of frequencies to use. Options:
             - int: Use specified number of frequencies
             - None: Use default n^0.65
             - 'auto': Use bootstrap procedure to select optimal bandwidth
+            - 'plugin': Use plug-in MSE-optimal bandwidth (fast)
         verbose : bool, default=False
             Print diagnostic information during fitting.
         n_jobs : int, default=1
             Number of parallel jobs for the bootstrap bandwidth search when
             m='auto' (ignored otherwise). Default 1 runs serially. -1 uses
             all available cores; any positive integer sets the worker count.
+        time_budget : float, optional
+            Maximum time in seconds for the bootstrap bandwidth search when
+            m='auto' (ignored otherwise). When exhausted, the best bandwidth
+            found so far is used and bootstrap_m_truncated_ is set.
+        d_init : float, 'gph' or None, default='gph'
+            Initial value of d. The search starts in a bracket of 2.576
+            asymptotic standard errors around d_init instead of the full
+            bounds, and is widened if the minimum lies on its edge. Useful
+            in rolling and Monte Carlo analyses where consecutive
+            estimates are close. The default 'gph' uses the
+            log-periodogram regression estimate and its standard error,
+            computed in O(m) from the prepared periodogram (see
+            pyelw.gph.log_periodogram_regression). None searches all of
+            bounds.
 
         Returns
         -------
@@ -431,7 +559,8 @@ class LW:
             # Create a plain LW estimator for bootstrap (no taper)
             # Bootstrap is only defined for standard LW
             selector = LWBootstrapM(bounds=self.bounds, verbose=verbose,
-                                    n_jobs=n_jobs)
+                                    n_jobs=n_jobs, time_budget=time_budget,
+                                    optimizer=self.optimizer, tol=self.tol)
             selector.fit(X)
 
             # Store bootstrap-specific attributes
@@ -439,9 +568,21 @@ class LW:
             self.bootstrap_m_iterations_ = selector.iterations_
             self.bootstrap_m_mse_profile_ = selector.mse_profile_
             self.bootstrap_m_k_n_ = selector.k_n_
+            self.bootstrap_m_truncated_ = selector.truncated_
 
             # Use the optimal m with current estimator's settings
             m = selector.optimal_m_
+        elif m == 'plugin':
+            # Use plug-in MSE-optimal bandwidth
+            from .lw_plugin_m import LWPluginM
+            selector = LWPluginM(bounds=self.bounds, verbose=verbose)
+            selector.select(X)
+
+            # Store plug-in-specific attributes
+            self.plugin_m_optimal_m_ = selector.optimal_m_
+            self.plugin_m_curvature_ = selector.curvature_
+
+            m = selector.optimal_m_
 
         # Prepare data with taper and differencing
         data = self.prepare_data(X, m, self.taper, self.diff)
@@ -472,11 +613,21 @@ class LW:
             raise ValueError(f"Unknown taper type: {self.taper}. "
                              "Supported: 'none', 'kolmogorov', 'cosine', 'bartlett', 'hc'")
 
-        # Use golden section search with bounds
-        if self.taper == 'hc':
-            result = golden_section_search(objective_func, brack=bounds)
+        # Minimize within bounds
+        tol = search_tolerance(self.tol, m)
+        if self.taper != 'hc':
+            bounds = self.bounds
+        if d_init is None:
+            result = scalar_search(objective_func, brack=bounds, method=self.optimizer, tol=tol)
         else:
-            result = golden_section_search(objective_func, brack=self.bounds)
+            # Bracket around the initial value, in the parameterization of
+            # the objective (d - diff for HC, where the log-periodogram
+            # regression on the differenced series already gives d - diff)
+            center, width = initial_bracket(d_init, m, data['I_X'], data['freqs'])
+            if self.taper == 'hc' and not isinstance(d_init, str):
+                center -= self.diff
+            result = bracketed_search(objective_func, bounds, center, width,
+                                      method=self.optimizer, tol=tol)
 
         if not result.success:
             if verbose:
@@ -493,51 +644,8 @@ class LW:
 
         # Standard errors
         if np.isfinite(d_hat):
-
-            if self.taper == 'none':
-
-                # Standard local Whittle standard error
-                freqs = data['freqs']
-                I_X = data['I_X']
-
-                # Derivatives at estimated d_hat
-                lambda_2d = freqs**(2 * d_hat)
-                log_lambda = np.log(freqs)
-                d0 = np.mean(lambda_2d * I_X)
-                d1 = 2 * np.mean(log_lambda * lambda_2d * I_X)
-                d2 = 4 * np.mean((log_lambda**2) * lambda_2d * I_X)
-
-                # Fisher Information-based standard error:
-                # d0/(sqrt(m)*sqrt(d0*d2-d1^2))
-                fisher_info = d0 * d2 - d1**2
-                if fisher_info > 0 and d0 > 0:
-                    se = d0 / (np.sqrt(data['m']) * np.sqrt(fisher_info))
-                else:
-                    se = np.nan
-
-                # Asymptotic standard error
-                ase = 1 / (2 * np.sqrt(m))
-
-            elif self.taper in ['kolmogorov', 'cosine', 'bartlett']:
-
-                # Velasco (1999, p. 100)
-                p = data['p']
-                Phi = data['Phi']
-                ase = np.sqrt(p * Phi / (4 * m))
-                se = ase
-
-            elif self.taper == 'hc':
-
-                # Asymptotic standard errors: Hurvich and Chen (2020, Theorem 2)
-                ase = np.sqrt(1.5 / (4 * m))
-                # Standard errors: Hurvich and Chen (2020, eq. 11)
-                two_sin_half_freqs = 2.0 * np.sin(data['freqs'] / 2.0)
-                v = np.log(two_sin_half_freqs) - np.mean(np.log(two_sin_half_freqs))
-                v2_sum = np.sum(v**2)
-                se = np.sqrt(1.5 / (4 * v2_sum))
-
+            se, ase = self._standard_errors(d_hat, data)
         else:
-
             se = np.nan
             ase = np.nan
 
@@ -555,6 +663,110 @@ class LW:
 
         return self
 
+    def fit_many(self, X: np.ndarray, m: Optional[int] = None, d_init='gph') -> Dict[str, Any]:
+        """
+        Local Whittle estimation for many series of equal length.
+
+        All periodograms are computed with one FFT along the rows and all
+        minimizations are carried out together by a vectorized golden
+        section search, so each series gives the same estimate as fit()
+        with optimizer='golden'.  The golden section search is used
+        whatever the optimizer setting, while tol is respected.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            2-D array with one time series per row
+        m : int, optional
+            Number of frequencies to use for every series. Default n^0.65.
+        d_init : float, 'gph' or None, default='gph'
+            Initial value of d for every series (see fit).  With 'gph',
+            each series starts from its own log-periodogram estimate.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary containing:
+            - 'n': sample size
+            - 'm': number of frequencies
+            - 'd_hat': array of memory parameter estimates
+            - 'se': array of standard errors
+            - 'ase': asymptotic standard error
+            - 'objective': array of objective function values
+            - 'nfev': array of objective function evaluation counts
+            - 'method': estimation method
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2:
+            raise ValueError("X must be a 2-D array with one series per row")
+        n_series, n = X.shape
+
+        if m is None:
+            m = int(n**0.65)
+        elif isinstance(m, str):
+            raise ValueError("fit_many requires an integer bandwidth m")
+
+        if self.taper == 'none':
+            method = 'lw'
+            bounds = self.bounds
+        elif self.taper in ['kolmogorov', 'cosine', 'bartlett']:
+            method = 'lw_velasco'
+            bounds = self.bounds
+        elif self.taper == 'hc':
+            method = 'lw_hc'
+            # Adjust bounds for differencing
+            bounds = (self.bounds[0] - self.diff, self.bounds[1] - self.diff)
+        else:
+            raise ValueError(f"Unknown taper type: {self.taper}. "
+                             "Supported: 'none', 'kolmogorov', 'cosine', 'bartlett', 'hc'")
+
+        # Batched periodograms, one row per series
+        data = self.prepare_data(X, m, self.taper, self.diff)
+
+        # Golden section search for all series in lockstep
+        tol = search_tolerance(self.tol, m)
+        if d_init is None:
+            result = vectorized_golden_section_search(
+                lambda d: self.objective_many(d, data),
+                np.full(n_series, bounds[0], dtype=np.float64),
+                np.full(n_series, bounds[1], dtype=np.float64),
+                tol=tol)
+        else:
+            # Brackets around the initial values, as in fit()
+            center, width = initial_bracket(d_init, m, data['I_X'], data['freqs'])
+            if self.taper == 'hc' and not isinstance(d_init, str):
+                center -= self.diff
+
+            def objective_rows(d, rows):
+                return self.objective_many(d, dict(data, I_X=data['I_X'][rows]))
+
+            result = vectorized_bracketed_search(
+                objective_rows, bounds,
+                np.broadcast_to(center, (n_series,)), np.broadcast_to(width, (n_series,)),
+                tol=tol)
+
+        valid = np.isfinite(result.x) & np.isfinite(result.fun)
+        d_hat = np.where(valid, result.x, np.nan)
+        # For HC, add diff to 'undo' first differencing
+        if self.taper == 'hc':
+            d_hat = d_hat + self.diff
+        final_obj = np.where(valid, result.fun, np.nan)
+
+        # Standard errors
+        se, ase = self._standard_errors(np.where(valid, d_hat, 0.0), data)
+        se = np.where(valid, se, np.nan)
+
+        return {
+            'n': data['n'],
+            'm': data['m'],
+            'd_hat': d_hat,
+            'se': se,
+            'ase': ase,
+            'objective': final_obj,
+            'nfev': result.nfev,
+            'method': method,
+        }
+
     def estimate(self,
                  X: np.ndarray,
                  m = None,
@@ -562,7 +774,8 @@ class LW:
                  taper: Optional[str] = None,
                  diff: Optional[int] = 1,
                  verbose: Optional[bool] = False,
-                 n_jobs: int = 1) -> Dict[str, Any]:
+                 n_jobs: int = 1,
+                 time_budget: Optional[float] = None) -> Dict[str, Any]:
         """
         Local Whittle estimation of memory parameter d.
 
@@ -574,8 +787,9 @@ class LW:
         ----------
         X : np.ndarray
             Time series data
-        m : int or 'auto', optional
-            Number of frequencies to use. Use 'auto' for bootstrap selection.
+        m : int, 'auto' or 'plugin', optional
+            Number of frequencies to use. Use 'auto' for bootstrap selection
+            or 'plugin' for plug-in selection.
         bounds: tuple[float, float], optional
             Lower and upper bounds for golden section search.
             If provided, temporarily overrides constructor bounds.
@@ -590,6 +804,10 @@ class LW:
             Number of parallel jobs for the bootstrap bandwidth search when
             m='auto' (ignored otherwise). Default 1 runs serially. -1 uses
             all available cores; any positive integer sets the worker count.
+        time_budget : float, optional
+            Maximum time in seconds for the bootstrap bandwidth search when
+            m='auto' (ignored otherwise). When exhausted, the best bandwidth
+            found so far is used and bootstrap_m_truncated_ is set.
 
         Returns
         -------
@@ -611,7 +829,8 @@ class LW:
 
         try:
             # Fit the model
-            self.fit(X, m=m, verbose=verbose, n_jobs=n_jobs)
+            self.fit(X, m=m, verbose=verbose, n_jobs=n_jobs,
+                     time_budget=time_budget)
 
             # Return results as dictionary for backward compatibility
             return {
@@ -642,6 +861,10 @@ class LW:
             params.append(f"taper='{self.taper}'")
         if self.diff != self._default_diff:
             params.append(f"diff={self.diff}")
+        if self.optimizer != self._default_optimizer:
+            params.append(f"optimizer='{self.optimizer}'")
+        if self.tol != self._default_tol:
+            params.append(f"tol={self.tol!r}")
 
         params_str = ", ".join(params)
         return f"LW({params_str})"
@@ -1,7 +1,200 @@
+import contextlib
+import time
 import numpy as np
-from typing import Optional, Tuple
-from joblib import Parallel, delayed
-from .optimization import golden_section_search
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+from .lw import local_whittle_objective
+from .optimization import bracketed_search, scalar_search, search_tolerance
+from .parallel import effective_n_jobs, get_active_pool
+
+if TYPE_CHECKING:
+    from joblib import Parallel
+
+
+def _local_resample(v_j: np.ndarray,
+                    k_n: int,
+                    m: int,
+                    seed: Optional[int] = None) -> np.ndarray:
+    """
+    Local bootstrap resample of the first m standardized periodogram ordinates.
+
+    See LWBootstrapM._local_bootstrap_resample for details.
+    """
+    # Use local random state for reproducibility
+    rng = np.random.RandomState(seed) if seed is not None else np.random
+
+    # Step 3: Generate random shifts S_j from integers -k_n to k_n
+    S = rng.randint(-k_n, k_n + 1, size=m)
+
+    # Step 4: v*_j = v_{|j+S_j|} if |j+S_j| > 0, else v_1.  Indices j + S_j
+    # are 1-based as in the paper; the absolute value reflects at zero.
+    idx_paper = np.arange(1, m + 1) + S
+    idx_code = np.where(idx_paper == 0, 0, np.abs(idx_paper) - 1)
+
+    # Handle boundary case where index exceeds available data
+    idx_code = np.minimum(idx_code, len(v_j) - 1)
+
+    return v_j[idx_code]
+
+
+def _bootstrap_replicates(v_j: np.ndarray,
+                          n: int,
+                          m_eval: int,
+                          d_current: float,
+                          k_n: int,
+                          B: int,
+                          bounds: Tuple[float, float],
+                          optimizer: str = 'golden',
+                          tol=None,
+                          warm_start: bool = False) -> Tuple[np.ndarray, int, float, float]:
+    """
+    Bootstrap LW estimates d*_b(m) for b = 0, ..., B-1.
+
+    See LWBootstrapM._bootstrap_d_estimates for details.
+
+    Returns
+    -------
+    np.ndarray
+        Bootstrap d estimates of length B
+    int
+        Total number of objective function evaluations
+    float
+        Time spent resampling, in seconds
+    float
+        Time spent optimizing, in seconds
+    """
+    d_star = np.zeros(B)
+    nfev = 0
+    time_resample = 0.0
+    time_optimize = 0.0
+
+    # Precompute frequency-related values
+    freqs = 2 * np.pi * np.arange(1, m_eval + 1) / n
+    freq_factor = freqs ** (-2 * d_current)
+    search_tol = search_tolerance(tol, m_eval)
+    ase = 1 / (2 * np.sqrt(m_eval))
+
+    for b in range(B):
+        t0 = time.perf_counter()
+
+        # Steps 3-4: Resample standardized periodogram
+        v_star = _local_resample(v_j, k_n, m_eval, seed=b)
+
+        # Step 5: Generate bootstrap periodogram I*_j = lambda_j^(-2d_1) v*_j
+        data = {
+            'n': n,
+            'm': m_eval,
+            'I_X': v_star * freq_factor,
+            'freqs': freqs,
+        }
+
+        t1 = time.perf_counter()
+
+        # Step 6: Obtain bootstrap LW estimate d*_b by minimizing R(d)
+        def objective_func(d: float) -> float:
+            return local_whittle_objective(d, data)
+
+        if warm_start and b > 0:
+            # Bracket around the mean of the earlier replicates, which
+            # includes the bootstrap bias, of 2.576 times their standard
+            # deviation (at least the asymptotic standard error)
+            done = d_star[:b][~np.isnan(d_star[:b])]
+            center = np.mean(done) if len(done) else d_current
+            spread = np.std(done) if len(done) > 2 else 0.0
+            result = bracketed_search(objective_func, bounds, center, 2.576 * max(ase, spread),
+                                      method=optimizer, tol=search_tol)
+        else:
+            result = scalar_search(objective_func, brack=bounds, method=optimizer,
+                                   tol=search_tol)
+        d_star[b] = result.x if result.success else np.nan
+        nfev += result.nfev
+
+        t2 = time.perf_counter()
+        time_resample += t1 - t0
+        time_optimize += t2 - t1
+
+    return d_star, nfev, time_resample, time_optimize
+
+
+def _bootstrap_mse(d_star: np.ndarray, d_current: float) -> Tuple[float, float]:
+    """
+    Step 7: MSE*(m) = (1/B) sum (d*_b(m) - d_1)^2 over valid replicates.
+
+    Returns
+    -------
+    float
+        Bootstrap MSE estimate (inf if no replicate is valid)
+    float
+        Monte Carlo standard error of the MSE estimate
+    """
+    valid_estimates = d_star[~np.isnan(d_star)]
+    if len(valid_estimates) == 0:
+        return np.inf, np.nan
+    sq_err = (valid_estimates - d_current)**2
+    if len(sq_err) > 1:
+        mse_se = np.std(sq_err, ddof=1) / np.sqrt(len(sq_err))
+    else:
+        mse_se = np.nan
+    return np.mean(sq_err), mse_se
+
+
+def _bootstrap_mse_block(v_j: np.ndarray,
+                         n: int,
+                         m_block: Sequence[int],
+                         d_current: float,
+                         k_n: int,
+                         B: int,
+                         bounds: Tuple[float, float],
+                         store_draws: bool = False,
+                         optimizer: str = 'golden',
+                         tol=None,
+                         warm_start: bool = False) -> Dict[str, Any]:
+    """
+    Bootstrap MSE for a block of bandwidths.
+
+    This is the unit of work dispatched to parallel workers.  It is a
+    module-level function so that only the arguments it needs, rather than
+    the selector and the full series, are sent to the workers.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionary containing, for each m in m_block:
+        - 'mse': bootstrap MSE
+        - 'mse_se': Monte Carlo standard error of the MSE
+        - 'nfev': number of objective evaluations over all replicates
+        - 'draws': B x len(m_block) float32 matrix of d* (if store_draws)
+        and the block totals 'time_resample' and 'time_optimize'.
+    """
+    k = len(m_block)
+    out = {
+        'mse': np.empty(k),
+        'mse_se': np.empty(k),
+        'nfev': np.empty(k, dtype=np.int64),
+        'draws': np.empty((B, k), dtype=np.float32) if store_draws else None,
+        'time_resample': 0.0,
+        'time_optimize': 0.0,
+    }
+    for i, m_eval in enumerate(m_block):
+        d_star, nfev, t_resample, t_optimize = _bootstrap_replicates(
+            v_j, n, m_eval, d_current, k_n, B, bounds, optimizer, tol, warm_start)
+        out['mse'][i], out['mse_se'][i] = _bootstrap_mse(d_star, d_current)
+        out['nfev'][i] = nfev
+        out['time_resample'] += t_resample
+        out['time_optimize'] += t_optimize
+        if store_draws:
+            out['draws'][:, i] = d_star
+    return out
+
+
+def _strided_blocks(values: Sequence[int], n_blocks: int) -> List[List[int]]:
+    """
+    Split values into n_blocks interleaved blocks values[i::n_blocks].
+
+    Interleaving balances the work per block, since the cost of evaluating a
+    bandwidth grows with m, and every block spans the full candidate range.
+    """
+    n_blocks = max(1, min(n_blocks, len(values)))
+    return [list(values[i::n_blocks]) for i in range(n_blocks)]
 
 
 class LWBootstrapM:
@@ -25,8 +218,10 @@ class LWBootstrapM:
         Minimum bandwidth to consider. Default is 6.
     m_max : int, optional
         Maximum bandwidth to consider. Default is n/2.
-    m_init : int, optional
-        Initial bandwidth for iteration. Default is 15.
+    m_init : int or str, optional
+        Initial bandwidth for iteration. Default is 15. If 'plugin', starts
+        from the plug-in MSE-optimal bandwidth of LWPluginM, which is
+        usually close to the bootstrap choice.
     delta : float, default=-0.01
         Convergence criterion for iterative procedure
     max_iter : int, default=10
@@ -39,7 +234,31 @@ class LWBootstrapM:
     n_jobs : int, default=1
         Number of parallel jobs (joblib workers) for the bootstrap MSE
         bandwidth search. Default 1 runs serially. -1 uses all available
-        cores; any positive integer sets the worker count.
+        cores; any positive integer sets the worker count. Ignored inside
+        a pyelw.parallel_backend() block, whose worker pool is used instead.
+    time_budget : float, optional
+        Maximum wall-clock time in seconds for the bandwidth search. When
+        the budget is exhausted, the search stops and returns the best
+        bandwidth found so far.
+    deadline : float, optional
+        Absolute deadline for the bandwidth search, as a time.monotonic()
+        value. Combined with time_budget, whichever comes first applies.
+    store_draws : bool, default=False
+        Keep the bootstrap d* draws of the last iteration in d_star_.
+    optimizer : str, default='golden'
+        Minimizer for the LW estimates, 'golden' or 'brent' (see LW). Only
+        used if lw_estimator is None.  The bootstrap replicates use the
+        optimizer and tol of the LW estimator.
+    tol : float or 'se', optional
+        Convergence tolerance of the minimizer (see LW). Only used if
+        lw_estimator is None.
+    warm_start : bool, default=False
+        Start each bootstrap replicate search in a narrow bracket around
+        the mean of the earlier replicates at the same bandwidth, instead
+        of searching the full bounds, and each LW fit at a new bandwidth
+        from the previous estimate instead of the log-periodogram
+        estimate (see the d_init argument of LW.fit).
+        Results agree with the default up to the tolerance of the searches.
 
     Attributes
     ----------
@@ -52,13 +271,43 @@ class LWBootstrapM:
     ase_ : float
         Asymptotic standard error
     mse_profile_ : dict
-        Bootstrap MSE values for each evaluated bandwidth
+        Bootstrap MSE values for each evaluated bandwidth (last iteration)
+    m_grid_ : np.ndarray
+        Candidate bandwidths m_min, ..., m_max
+    m_path_ : np.ndarray
+        Bandwidth m_1 at the start of each iteration
+    d_path_ : np.ndarray
+        Estimate d_1 at the start of each iteration
+    mse_path_ : np.ndarray
+        Bootstrap MSE profile of each iteration, shape (iterations, len(m_grid_)).
+        NaN for bandwidths not evaluated before a time limit.
+    mse_se_path_ : np.ndarray
+        Monte Carlo standard errors of mse_path_
+    nfev_path_ : np.ndarray
+        Number of objective evaluations over all bootstrap replicates in
+        each iteration (reused results from earlier iterations cost none)
+    timings_ : dict
+        Wall-clock seconds per iteration for 'lw_fit', 'periodogram',
+        'resampling', 'optimization', 'dispatch' and 'total'. Resampling and
+        optimization are summed over workers; dispatch is the evaluation
+        time not accounted for by the work divided among the workers.
+    d_star_ : np.ndarray or None
+        float32 matrix of bootstrap draws d*, shape (B, len(m_grid_)), for
+        the last iteration if store_draws=True
     k_n_ : int
         Actual resampling width used (useful when k_n='auto')
+    m_init_ : int
+        Actual initial bandwidth used (useful when m_init='plugin')
     iterations_ : int
         Number of iterations performed
     converged_ : bool
         Whether the iterative procedure converged
+    truncated_ : bool
+        Whether the search was cut short by time_budget or deadline
+    n_candidates_evaluated_ : int
+        Number of (bandwidth, d) pairs whose bootstrap MSE was computed
+    n_replicates_evaluated_ : int
+        Number of bootstrap replicates computed
     n_ : int
         Sample size
     objective_ : float
@@ -87,7 +336,13 @@ class LWBootstrapM:
                  max_iter=10,
                  bounds=(-1.0, 2.2),
                  verbose=False,
-                 n_jobs=1):
+                 n_jobs=1,
+                 time_budget=None,
+                 deadline=None,
+                 store_draws=False,
+                 optimizer='golden',
+                 tol=None,
+                 warm_start=False):
         self.lw_estimator = lw_estimator
         self.k_n = k_n
         self.B = B
@@ -99,15 +354,47 @@ class LWBootstrapM:
         self.bounds = bounds
         self.verbose = verbose
         self.n_jobs = n_jobs
+        self.time_budget = time_budget
+        self.deadline = deadline
+        self.store_draws = store_draws
+        self.optimizer = optimizer
+        self.tol = tol
+        self.warm_start = warm_start
 
         # Default LW estimator if none provided
         if self.lw_estimator is None:
             from . import LW  # Avoid circular import
-            self.lw_estimator = LW(bounds=self.bounds)
+            self.lw_estimator = LW(bounds=self.bounds, optimizer=self.optimizer, tol=self.tol)
+
+    def _periodogram(self, X: np.ndarray) -> np.ndarray:
+        """
+        Compute the raw periodogram I_j for j=1,...,floor(n/2).
+
+        The periodogram does not depend on the current d estimate, so it is
+        computed once per call to fit() and reused across iterations.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Time series data
+
+        Returns
+        -------
+        np.ndarray
+            Periodogram values for j=1,...,floor(n/2)
+        """
+        n = len(X)
+
+        # Compute periodogram (skip DC component)
+        fft_X = np.fft.fft(X)
+        I_X = np.abs(fft_X[1:])**2 / (2 * np.pi * n)
+
+        return I_X[:n//2]  # Return up to Nyquist frequency
 
     def _locally_standardized_periodogram(self,
                                           X: np.ndarray,
-                                          d_hat: float) -> np.ndarray:
+                                          d_hat: float,
+                                          I_X: Optional[np.ndarray] = None) -> np.ndarray:
         r"""
         Compute locally standardized periodogram v_j^(1) = I_j * \lambda_j^(2d).
 
@@ -119,6 +406,9 @@ class LWBootstrapM:
             Time series data
         d_hat : float
             Estimated memory parameter
+        I_X : np.ndarray, optional
+            Precomputed periodogram from _periodogram(). If provided, skips
+            recomputing the FFT of X.
 
         Returns
         -------
@@ -127,9 +417,8 @@ class LWBootstrapM:
         """
         n = len(X)
 
-        # Compute periodogram (skip DC component)
-        fft_X = np.fft.fft(X)
-        I_X = np.abs(fft_X[1:])**2 / (2 * np.pi * n)
+        if I_X is None:
+            I_X = self._periodogram(X)
 
         # Compute frequencies \lambda_j = 2*pi*j/n for j=1,2,...
         freqs = 2 * np.pi * np.arange(1, len(I_X) + 1) / n
@@ -137,7 +426,7 @@ class LWBootstrapM:
         # Locally standardize: v_j = I_j * \lambda_j^(2d)
         v_j = I_X * (freqs**(2 * d_hat))
 
-        return v_j[:n//2]  # Return up to Nyquist frequency
+        return v_j
 
     def _spectral_flatness(self, v_j: np.ndarray) -> float:
         """
@@ -250,39 +539,7 @@ class LWBootstrapM:
         np.ndarray
             Bootstrap sample of standardized periodogram
         """
-        # Use local random state for reproducibility
-        rng = np.random.RandomState(seed) if seed is not None else np.random
-
-        # Step 3: Generate random shifts S_j from integers -k_n to k_n
-        S = rng.randint(-k_n, k_n + 1, size=m)
-
-        # Step 4: Apply local resampling to generate bootstrap series
-        v_star = np.zeros(m)
-        for j in range(m):
-            # Indexing conversion: Paper uses 1-based, code uses 0-based
-            # Paper's frequency j=1,2,...,m corresponds to code's j=0,1,...,m-1
-
-            # Calculate j + S_j in paper's 1-based notation
-            j_paper = j + 1
-            idx_paper = j_paper + S[j]
-
-            # Step 4: Apply formula v*_j = v_{|j+S_j|} if |j+S_j| > 0, else v_1
-            # The absolute value |j+S_j| creates reflection symmetry at zero
-            if idx_paper == 0:
-                # Special case: j + S_j = 0, use v_1 (first frequency)
-                idx_code = 0
-            else:
-                # Use absolute value to get frequency index, then convert to 0-based
-                # Example: if j+S_j = -2, use v_{|-2|} = v_2, which is v_j[1] in code
-                idx_code = abs(idx_paper) - 1
-
-            # Handle boundary case where index exceeds available data
-            if idx_code >= len(v_j):
-                idx_code = len(v_j) - 1
-
-            v_star[j] = v_j[idx_code]
-
-        return v_star
+        return _local_resample(v_j, k_n, m, seed=seed)
 
     def _bootstrap_d_estimates(self,
                                v_j: np.ndarray,
@@ -314,35 +571,12 @@ class LWBootstrapM:
         np.ndarray
             Bootstrap d estimates of length B
         """
-        d_star = np.zeros(self.B)
-
-        # Precompute frequency-related values
-        freqs = 2 * np.pi * np.arange(1, m_eval + 1) / n
-        freq_factor = freqs ** (-2 * d_current)
-
-        for b in range(self.B):
-            # Steps 3-4: Resample standardized periodogram
-            v_star = self._local_bootstrap_resample(v_j, k_n, m_eval, seed=b)
-
-            # Step 5: Generate bootstrap periodogram I*_j = lambda_j^(-2d_1) v*_j
-            I_star = v_star * freq_factor
-
-            # Prepare data for LW estimation
-            data = {
-                'n': n,
-                'm': m_eval,
-                'I_X': I_star,
-                'freqs': freqs,
-            }
-
-            # Step 6: Obtain bootstrap LW estimate d*_b by minimizing R(d)
-            def objective_func(d: float) -> float:
-                return self.lw_estimator.objective(d, data)
-
-            result = golden_section_search(objective_func,
-                                           brack=self.lw_estimator.bounds)
-            d_star[b] = result.x if result.success else np.nan
-
+        d_star, _, _, _ = _bootstrap_replicates(v_j, n, m_eval, d_current, k_n,
+                                                self.B,
+                                                self.lw_estimator.bounds,
+                                                self.lw_estimator.optimizer,
+                                                self.lw_estimator.tol,
+                                                self.warm_start)
         return d_star
 
     def _compute_bootstrap_mse(self,
@@ -382,12 +616,7 @@ class LWBootstrapM:
         d_star = self._bootstrap_d_estimates(v_j, n, m_eval, d_init, k_n)
 
         # Step 7: Compute MSE*(m) = (1/B) \sum (d*_b(m) - d_1)^2
-        valid_estimates = d_star[~np.isnan(d_star)]
-        if len(valid_estimates) > 0:
-            mse = np.mean((valid_estimates - d_init)**2)
-        else:
-            mse = np.inf
-
+        mse, _ = _bootstrap_mse(d_star, d_init)
         return mse, d_star
 
     def _evaluate_bandwidth(self,
@@ -425,14 +654,115 @@ class LWBootstrapM:
         d_star = self._bootstrap_d_estimates(v_j, n, m_eval, d_current, k_n)
 
         # Step 7: Compute MSE*(m) = (1/B) \sum (d*_b(m) - d_current)^2
-        valid_estimates = d_star[~np.isnan(d_star)]
-        if len(valid_estimates) > 0:
-            mse = np.mean((valid_estimates - d_current)**2)
-        else:
-            mse = np.inf
-
+        mse, _ = _bootstrap_mse(d_star, d_current)
         return m_eval, mse
 
+    def _evaluate_bandwidths(self,
+                             n: int,
+                             m_values: Sequence[int],
+                             d_current: float,
+                             k_n: int,
+                             v_j: np.ndarray,
+                             parallel: Optional["Parallel"] = None,
+                             deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Evaluate bootstrap MSE for several bandwidths.
+
+        Bandwidths are split into interleaved blocks, a few per worker, and
+        each block is dispatched as a single task.  Tasks receive only the
+        sample size and the standardized periodogram; joblib memory-maps
+        large arrays rather than pickling them for every task.
+
+        Parameters
+        ----------
+        n : int
+            Sample size
+        m_values : sequence of int
+            Bandwidths to evaluate
+        d_current : float
+            Current d estimate
+        k_n : int
+            Resampling width
+        v_j : np.ndarray
+            Precomputed locally standardized periodogram
+        parallel : joblib.Parallel, optional
+            Active worker pool.  If None, bandwidths are evaluated serially.
+        deadline : float, optional
+            time.monotonic() value after which no further blocks are started.
+            Since blocks are interleaved, the bandwidths evaluated before the
+            deadline form a coarse grid over the full candidate range.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary containing, for each m in m_values:
+            - 'mse': bootstrap MSE (NaN if not evaluated before the deadline)
+            - 'mse_se': Monte Carlo standard error of the MSE
+            - 'nfev': number of objective evaluations (0 if not evaluated)
+            - 'draws': B x len(m_values) float32 matrix of d* draws, or None
+              unless store_draws=True
+            and the totals 'time_resample' and 'time_optimize' summed over
+            all tasks.
+        """
+        bounds = self.lw_estimator.bounds
+        optimizer = self.lw_estimator.optimizer
+        tol = self.lw_estimator.tol
+        warm_start = self.warm_start
+        store_draws = self.store_draws
+
+        if parallel is None and deadline is None:
+            return _bootstrap_mse_block(v_j, n, m_values, d_current, k_n,
+                                        self.B, bounds, store_draws,
+                                        optimizer, tol, warm_start)
+
+        # A few blocks per worker keeps the load balanced.  Blocks are
+        # dispatched in waves of one per worker so that the deadline can be
+        # checked between waves.
+        n_workers = 1 if parallel is None else effective_n_jobs(parallel.n_jobs)
+        blocks = _strided_blocks(m_values, max(4 * n_workers, 16 if deadline else 1))
+        wave_size = len(blocks) if deadline is None else n_workers
+        block_results = []
+        for start in range(0, len(blocks), wave_size):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            wave = blocks[start:start + wave_size]
+            if parallel is None:
+                block_results.extend(
+                    _bootstrap_mse_block(v_j, n, block, d_current, k_n,
+                                         self.B, bounds, store_draws,
+                                         optimizer, tol, warm_start)
+                    for block in wave
+                )
+            else:
+                from joblib import delayed
+                block_results.extend(parallel(
+                    delayed(_bootstrap_mse_block)(v_j, n, block, d_current, k_n,
+                                                  self.B, bounds, store_draws,
+                                                  optimizer, tol, warm_start)
+                    for block in wave
+                ))
+
+        # Reassemble in the original order
+        k = len(m_values)
+        out = {
+            'mse': np.full(k, np.nan),
+            'mse_se': np.full(k, np.nan),
+            'nfev': np.zeros(k, dtype=np.int64),
+            'draws': np.full((self.B, k), np.nan, dtype=np.float32) if store_draws else None,
+            'time_resample': 0.0,
+            'time_optimize': 0.0,
+        }
+        for i, block in enumerate(block_results):
+            idx = slice(i, None, len(blocks))
+            out['mse'][idx] = block['mse']
+            out['mse_se'][idx] = block['mse_se']
+            out['nfev'][idx] = block['nfev']
+            if store_draws:
+                out['draws'][:, idx] = block['draws']
+            out['time_resample'] += block['time_resample']
+            out['time_optimize'] += block['time_optimize']
+        return out
+
     def fit(self, X: np.ndarray, verbose: Optional[bool] = None):
         """
         Select optimal bandwidth using the iterative bootstrap MSE
@@ -453,6 +783,12 @@ class LWBootstrapM:
         if verbose is None:
             verbose = self.verbose
 
+        # Time limit for the search, if any
+        stop_at = self.deadline
+        if self.time_budget is not None:
+            budget_end = time.monotonic() + self.time_budget
+            stop_at = budget_end if stop_at is None else min(stop_at, budget_end)
+
         X = np.asarray(X, dtype=np.float64).flatten()
         n = len(X)
 
@@ -463,7 +799,13 @@ class LWBootstrapM:
         # Ensure m_min doesn't exceed m_max (can happen with small samples)
         m_min = min(m_min, m_max)
 
-        m_init = self.m_init if self.m_init is not None else min(15, m_max)
+        if self.m_init == 'plugin':
+            from .lw_plugin_m import LWPluginM
+            m_init = LWPluginM(m_min=m_min, m_max=m_max).select(X)
+        elif self.m_init is not None:
+            m_init = self.m_init
+        else:
+            m_init = min(15, m_max)
         # Ensure m_init is within [m_min, m_max]
         m_init = max(m_min, min(m_init, m_max))
 
@@ -471,13 +813,44 @@ class LWBootstrapM:
         m_current = m_init
         mse_history = []
         converged = False
+        truncated = False
+
+        # Step 1 ingredients that do not change across iterations: the raw
+        # periodogram is computed once, LW fits are memoized by bandwidth,
+        # standardized periodograms by d, and bootstrap MSEs by (m, d).
+        t0 = time.perf_counter()
+        I_X = self._periodogram(X)
+        time_raw_periodogram = time.perf_counter() - t0
+        lw_cache = {}
+        v_j_cache = {}
+        mse_cache = {}
+        last_fit_m = None
+
+        def warm_d():
+            # Previous LW estimate, as the starting value of the next fit,
+            # or else the log-periodogram estimate as in LW.fit
+            if self.warm_start and last_fit_m is not None:
+                return lw_cache[last_fit_m]
+            return 'gph'
+
+        def fit_lw(m):
+            nonlocal last_fit_m
+            if m not in lw_cache:
+                self.lw_estimator.fit(X, m=m, d_init=warm_d())
+                last_fit_m = m
+                lw_cache[m] = self.lw_estimator.d_hat_
+            return lw_cache[m]
+
+        def standardized_periodogram(d):
+            if d not in v_j_cache:
+                v_j_cache[d] = self._locally_standardized_periodogram(X, d, I_X=I_X)
+            return v_j_cache[d]
 
         # Step 2: Select resampling width k_n
         if self.k_n == 'auto':
             # Get initial d estimate
-            self.lw_estimator.fit(X, m=m_current)
-            d_init = self.lw_estimator.d_hat_
-            v_j = self._locally_standardized_periodogram(X, d_init)
+            d_init = fit_lw(m_current)
+            v_j = standardized_periodogram(d_init)
             k_n = self._select_k_n(v_j, n)
             if verbose:
                 spectral_flatness = self._spectral_flatness(v_j)
@@ -486,68 +859,161 @@ class LWBootstrapM:
         else:
             k_n = min(self.k_n, n // 2)
 
-        # Store actual k_n used
+        # Store actual k_n and m_init used
         self.k_n_ = k_n
-
-        # Iterative procedure
-        for iteration in range(self.max_iter):
-            if verbose:
-                print(f"\nIteration {iteration + 1}")
-                print(f"Current bandwidth: {m_current}")
-
-            # Step 1: Obtain d_1 with current bandwidth m_1
-            self.lw_estimator.fit(X, m=m_current)
-            d_current = self.lw_estimator.d_hat_
-
-            if verbose:
-                print(f"Current d estimate: {d_current:.4f}")
-
-            # Steps 3-7: Evaluate MSE for all candidate bandwidths m = m_min, ..., m_max
-            m_candidates = list(range(m_min, m_max + 1))
-
-            if verbose:
-                print(f"Evaluating bandwidths from {m_min} to {m_max}...")
-
-            # Precompute locally standardized periodogram (same for all bandwidths)
-            v_j = self._locally_standardized_periodogram(X, d_current)
-
-            # Parallel evaluation over bandwidths
-            results = Parallel(n_jobs=self.n_jobs)(
-                delayed(self._evaluate_bandwidth)(X, m, d_current, k_n, v_j)
-                for m in m_candidates
-            )
-            mse_values = dict(results)
-
-            # Step 8: Choose \hat{m}_1 such that MSE*(\hat{m}_1) <= MSE*(m) for all m
-            m_optimal = min(mse_values, key=mse_values.get)
-            mse_optimal = mse_values[m_optimal]
-
-            if verbose:
-                print(f"Optimal bandwidth: {m_optimal}, MSE: {mse_optimal:.6f}")
-
-            # Step 9: Check convergence criterion. Continue until
-            # [MSE*(\hat{m}_l) - MSE*(\hat{m}_{l-1})] / MSE*(\hat{m}_{l-1}) > delta
-            if len(mse_history) > 0:
-                mse_prev = mse_history[-1]
-
-                # Only check if both MSE values are finite and previous is non-zero
-                if np.isfinite(mse_prev) and np.isfinite(mse_optimal) and mse_prev != 0:
-                    relative_change = (mse_optimal - mse_prev) / mse_prev
-
-                    if relative_change > self.delta:  # delta is negative
-                        converged = True
-                        # Step 9: Final bandwidth is \hat{m}_{l-1} (previous m)
-                        m_optimal = m_current
-                        if verbose:
-                            print(f"Converged! Relative change: {relative_change:.4f}")
-                        break
-
-            mse_history.append(mse_optimal)
-            # Replace m_1 with \hat{m}_1 and iterate
-            m_current = m_optimal
-
-        # Final fit with optimal bandwidth
-        self.lw_estimator.fit(X, m=m_current)
+        self.m_init_ = m_init
+
+        # Candidate bandwidths m = m_min, ..., m_max
+        m_candidates = list(range(m_min, m_max + 1))
+
+        # States (m_1, MSE*(\hat{m}_{l-1})) already visited.  The iteration
+        # is deterministic given this state, so a repeat means a cycle.
+        visited = set()
+
+        mse_values = {}
+
+        # Per-iteration diagnostics
+        m_path = []
+        d_path = []
+        mse_path = []
+        mse_se_path = []
+        nfev_path = []
+        timings = {key: [] for key in ('lw_fit', 'periodogram', 'resampling',
+                                       'optimization', 'dispatch', 'total')}
+
+        # Iterative procedure.  A single worker pool is kept alive across
+        # iterations when running in parallel, or the pool of an enclosing
+        # parallel_backend() block is used.
+        n_iter = 0
+        active_pool = get_active_pool()
+        if active_pool is not None:
+            pool = contextlib.nullcontext(active_pool)
+        elif effective_n_jobs(self.n_jobs) > 1:
+            from joblib import Parallel
+            pool = Parallel(n_jobs=self.n_jobs)
+        else:
+            pool = contextlib.nullcontext()
+        with pool as parallel:
+            n_workers = 1 if parallel is None else effective_n_jobs(parallel.n_jobs)
+            for iteration in range(self.max_iter):
+                if verbose:
+                    print(f"\nIteration {iteration + 1}")
+                    print(f"Current bandwidth: {m_current}")
+
+                state = (m_current, mse_history[-1] if mse_history else None)
+                if state in visited:
+                    if verbose:
+                        print(f"Bandwidth sequence cycles at m = {m_current}; stopping")
+                    break
+                visited.add(state)
+
+                if stop_at is not None and time.monotonic() >= stop_at:
+                    truncated = True
+                    if verbose:
+                        print("Time budget exhausted; stopping")
+                    break
+                n_iter += 1
+                t_start = time.perf_counter()
+
+                # Step 1: Obtain d_1 with current bandwidth m_1
+                d_current = fit_lw(m_current)
+                t_fit = time.perf_counter()
+
+                if verbose:
+                    print(f"Current d estimate: {d_current:.4f}")
+
+                # Steps 3-7: Evaluate MSE for all candidate bandwidths
+                if verbose:
+                    print(f"Evaluating bandwidths from {m_min} to {m_max}...")
+
+                # Locally standardized periodogram (same for all bandwidths)
+                v_j = standardized_periodogram(d_current)
+                t_periodogram = time.perf_counter()
+
+                # Parallel evaluation over bandwidths not evaluated at this d yet
+                m_pending = [m for m in m_candidates if (m, d_current) not in mse_cache]
+                time_resample = time_optimize = 0.0
+                nfev = 0
+                if m_pending:
+                    result = self._evaluate_bandwidths(n, m_pending, d_current,
+                                                       k_n, v_j, parallel,
+                                                       deadline=stop_at)
+                    for i, m in enumerate(m_pending):
+                        if not np.isnan(result['mse'][i]):
+                            draws = result['draws'][:, i] if self.store_draws else None
+                            mse_cache[(m, d_current)] = (result['mse'][i],
+                                                         result['mse_se'][i],
+                                                         draws)
+                    time_resample = result['time_resample']
+                    time_optimize = result['time_optimize']
+                    nfev = int(np.sum(result['nfev']))
+                t_eval = time.perf_counter()
+                profile = {m: mse_cache[(m, d_current)][0] for m in m_candidates
+                           if (m, d_current) in mse_cache}
+
+                # Record diagnostics for this iteration
+                row = [mse_cache.get((m, d_current), (np.nan, np.nan, None))
+                       for m in m_candidates]
+                m_path.append(m_current)
+                d_path.append(d_current)
+                mse_path.append([r[0] for r in row])
+                mse_se_path.append([r[1] for r in row])
+                nfev_path.append(nfev)
+                timings['lw_fit'].append(t_fit - t_start)
+                timings['periodogram'].append(t_periodogram - t_fit
+                                              + (time_raw_periodogram if n_iter == 1 else 0.0))
+                timings['resampling'].append(time_resample)
+                timings['optimization'].append(time_optimize)
+                timings['dispatch'].append(
+                    max(0.0, (t_eval - t_periodogram)
+                        - (time_resample + time_optimize) / n_workers))
+                timings['total'].append(t_eval - t_start)
+
+                # Out of time before all candidates were evaluated: use the
+                # best bandwidth among those evaluated, if any
+                if len(profile) < len(m_candidates):
+                    truncated = True
+                    if profile:
+                        mse_values = profile
+                        m_current = min(profile, key=profile.get)
+                    if verbose:
+                        print(f"Time budget exhausted after {len(profile)} "
+                              f"of {len(m_candidates)} bandwidths; using m = {m_current}")
+                    break
+                mse_values = profile
+
+                # Step 8: Choose \hat{m}_1 such that MSE*(\hat{m}_1) <= MSE*(m) for all m
+                m_optimal = min(mse_values, key=mse_values.get)
+                mse_optimal = mse_values[m_optimal]
+
+                if verbose:
+                    print(f"Optimal bandwidth: {m_optimal}, MSE: {mse_optimal:.6f}")
+
+                # Step 9: Check convergence criterion. Continue until
+                # [MSE*(\hat{m}_l) - MSE*(\hat{m}_{l-1})] / MSE*(\hat{m}_{l-1}) > delta
+                if len(mse_history) > 0:
+                    mse_prev = mse_history[-1]
+
+                    # Only check if both MSE values are finite and previous is non-zero
+                    if np.isfinite(mse_prev) and np.isfinite(mse_optimal) and mse_prev != 0:
+                        relative_change = (mse_optimal - mse_prev) / mse_prev
+
+                        if relative_change > self.delta:  # delta is negative
+                            converged = True
+                            # Step 9: Final bandwidth is \hat{m}_{l-1} (previous m)
+                            m_optimal = m_current
+                            if verbose:
+                                print(f"Converged! Relative change: {relative_change:.4f}")
+                            break
+
+                mse_history.append(mse_optimal)
+                # Replace m_1 with \hat{m}_1 and iterate
+                m_current = m_optimal
+
+        # Final fit with optimal bandwidth, unless the estimator already
+        # holds it from the last iteration
+        if last_fit_m != m_current:
+            self.lw_estimator.fit(X, m=m_current, d_init=warm_d())
 
         # Store fitted attributes
         self.optimal_m_ = m_current
@@ -555,8 +1021,25 @@ class LWBootstrapM:
         self.se_ = self.lw_estimator.se_
         self.ase_ = self.lw_estimator.ase_
         self.mse_profile_ = mse_values
-        self.iterations_ = iteration + 1
+        self.m_grid_ = np.array(m_candidates, dtype=np.int64)
+        self.m_path_ = np.array(m_path, dtype=np.int64)
+        self.d_path_ = np.array(d_path, dtype=np.float64)
+        self.mse_path_ = np.array(mse_path, dtype=np.float64).reshape(-1, len(m_candidates))
+        self.mse_se_path_ = np.array(mse_se_path, dtype=np.float64).reshape(-1, len(m_candidates))
+        self.nfev_path_ = np.array(nfev_path, dtype=np.int64)
+        self.timings_ = {key: np.array(values) for key, values in timings.items()}
+        if self.store_draws and d_path:
+            self.d_star_ = np.full((self.B, len(m_candidates)), np.nan, dtype=np.float32)
+            for i, m in enumerate(m_candidates):
+                if (m, d_path[-1]) in mse_cache:
+                    self.d_star_[:, i] = mse_cache[(m, d_path[-1])][2]
+        else:
+            self.d_star_ = None
+        self.iterations_ = n_iter
         self.converged_ = converged
+        self.truncated_ = truncated
+        self.n_candidates_evaluated_ = len(mse_cache)
+        self.n_replicates_evaluated_ = len(mse_cache) * self.B
         self.n_ = n
         self.objective_ = self.lw_estimator.objective_
         self.method_ = 'lw_bootstrap_m'
@@ -573,6 +1056,12 @@ class LWBootstrapM:
             params.append(f"B={self.B}")
         if self.delta != -0.01:
             params.append(f"delta={self.delta}")
+        if self.optimizer != 'golden':
+            params.append(f"optimizer='{self.optimizer}'")
+        if self.tol is not None:
+            params.append(f"tol={self.tol!r}")
+        if self.warm_start:
+            params.append("warm_start=True")
 
         params_str = ", ".join(params) if params else ""
         return f"LWBootstrapM({params_str})"
@@ -1,6 +1,7 @@
 import numpy as np
-from scipy.optimize import minimize
 from typing import Optional, Dict, Any, Tuple
+from .gph import initial_bracket
+from .optimization import vectorized_bounded_quasi_newton, vectorized_golden_section_search
 
 
 class LWLFC:
@@ -23,6 +24,14 @@ class LWLFC:
         additive noise by including a constant term in the pseudo spectral
         density. This is recommended when additive noise contamination
         is suspected in addition to low frequency contamination.
+    optimizer : {'qn', 'profile'}, default='qn'
+        Optimization strategy.  'qn' runs a bounded quasi-Newton search from
+        (d, theta) = (0, 0), as in the R LongMemoryTS implementation.
+        'profile' first profiles out the auxiliary parameters on a grid of
+        d values and then polishes the best grid point with the
+        quasi-Newton search, which guards against poor local minima.
+    n_grid : int, default=50
+        Number of d values in the grid for optimizer='profile'.
 
     Attributes
     ----------
@@ -46,6 +55,10 @@ class LWLFC:
         Number of function evaluations.
     method_ : str
         Estimation method used ('lwlfc' or 'lwplfc').
+    profile_ : dict or None
+        For optimizer='profile', the profile objective over the d grid with
+        keys 'd', 'objective', 'theta' and (for noise=True) 'theta_noise'
+        holding the grid and the profiled values.  None otherwise.
 
     Notes
     -----
@@ -75,12 +88,16 @@ class LWLFC:
     contaminations. _Journal of Econometrics_ 182, 309--328.
     """
 
-    def __init__(self, bounds=(-1.0, 2.2), noise=False):
+    def __init__(self, bounds=(-1.0, 2.2), noise=False, optimizer='qn', n_grid=50):
         self._default_bounds = (-1.0, 2.2)
         self._default_noise = False
+        self._default_optimizer = 'qn'
+        self._default_n_grid = 50
 
         self.bounds = bounds
         self.noise = noise
+        self.optimizer = optimizer
+        self.n_grid = n_grid
 
     def prepare_data(self, X: np.ndarray, m: int) -> Dict[str, np.ndarray]:
         """
@@ -89,7 +106,8 @@ class LWLFC:
         Parameters
         ----------
         X : np.ndarray
-            Time series data
+            Time series data.  For a 2-D array, each row is a separate series
+            and the periodograms are returned as rows of 'I_X'.
         m : int
             Number of frequencies to use in estimation
 
@@ -101,12 +119,13 @@ class LWLFC:
             - 'm': number of frequencies
             - 'I_X': periodogram values at frequencies 1, ..., m
             - 'freqs': Fourier frequencies lambda_j = 2*pi*j/n
+            - 'log_freqs': log(lambda_j)
         """
-        n = len(X)
+        n = X.shape[-1]
 
         # Compute FFT and periodogram
         fft_X = np.fft.fft(X)
-        I_X = np.abs(fft_X[1:m+1])**2 / (2 * np.pi * n)
+        I_X = np.abs(fft_X[..., 1:m+1])**2 / (2 * np.pi * n)
 
         # Frequencies: lambda_j = 2*pi*j/n for j = 1, ..., m
         freqs = 2 * np.pi * np.arange(1, m+1, dtype=np.float64) / n
@@ -116,6 +135,7 @@ class LWLFC:
             'm': m,
             'I_X': I_X,
             'freqs': freqs,
+            'log_freqs': np.log(freqs),
         }
 
     def objective(self, params: np.ndarray, data: Dict[str, np.ndarray]) -> float:
@@ -172,37 +192,207 @@ class LWLFC:
         except (OverflowError, ZeroDivisionError, ValueError):
             return np.float64(np.inf)
 
-    def fit(self, X, m=None, verbose=False):
+    def _pseudo_spectrum(self,
+                         params: np.ndarray,
+                         data: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
         """
-        LWLFC estimation of memory parameter d.
+        Pseudo spectral density g_k and its derivatives with respect to params.
+
+        Returns g_k (length m) and the matrix of partial derivatives
+        dg_k/dparams (shape len(params) x m).  For a 2-D array of parameter
+        vectors, one per row, both gain a leading dimension.
+        """
+        freqs = data['freqs']
+        n = data['n']
+        log_freqs = data['log_freqs']
+
+        params = np.asarray(params, dtype=np.float64)
+        d = params[..., 0, np.newaxis]
+        theta_u = params[..., -1, np.newaxis]
+        theta_w = params[..., 1, np.newaxis] if self.noise else 0.0
+
+        long_memory = np.exp(-2 * d * log_freqs)
+        lfc = freqs**(-2) / n
+        g_k = long_memory + theta_w + theta_u * lfc
+
+        terms = [-2 * log_freqs * long_memory]
+        if self.noise:
+            terms.append(np.ones_like(g_k))
+        terms.append(np.broadcast_to(lfc, g_k.shape))
+        return g_k, np.stack(terms, axis=-2)
+
+    def objective_and_gradient(self,
+                               params: np.ndarray,
+                               data: Dict[str, np.ndarray]) -> Tuple[np.float64, np.ndarray]:
+        """
+        LWLFC objective function and its analytic gradient.
+
+        With r_k = I_k/g_k and a_k = (dg_k/dparams)/g_k, the gradient of
+        J_m = log(mean(r_k)) + mean(log(g_k)) is
+
+            dJ_m/dparams = -mean(r_k a_k)/mean(r_k) + mean(a_k).
 
         Parameters
         ----------
-        X : np.ndarray
-            Time series data.
-        m : int, optional
-            Number of frequencies to use. If None, uses n^0.8 as recommended
-            by Hou and Perron (2014) for the case with only LFC.
-        verbose : bool, default=False
-            Print diagnostic information during fitting.
+        params : np.ndarray
+            Parameter vector [d, theta] for LWLFC or [d, theta_w, theta_u] for
+            LWPLFC, or a 2-D array of such vectors, one per row, evaluated
+            against the matching rows of a 2-D data['I_X'].
+        data : Dict[str, np.ndarray]
+            Precomputed quantities from prepare_data.
 
         Returns
         -------
-        self : object
-            Returns the fitted estimator.
+        Tuple[np.float64, np.ndarray]
+            Objective function value and gradient (arrays over the rows for
+            2-D params).  The value is inf (and the gradient NaN) outside
+            the region where the objective is defined.
         """
-        X = np.asarray(X, dtype=np.float64).flatten()
-        n = len(X)
+        params = np.asarray(params, dtype=np.float64)
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            g_k, dg = self._pseudo_spectrum(params, data)
+            m = g_k.shape[-1]
 
-        # Default bandwidth
-        if m is None:
-            m = int(n**0.8)
+            r_k = data['I_X'] / g_k
+            mean_ratio = np.mean(r_k, axis=-1)
+            obj = np.log(mean_ratio) + np.mean(np.log(g_k), axis=-1)
 
-        # Prepare data
-        data = self.prepare_data(X, m)
+            a_k = dg / g_k[..., np.newaxis, :]
+            grad = (-np.sum(a_k * r_k[..., np.newaxis, :], axis=-1)
+                    / (m * mean_ratio[..., np.newaxis]) + np.mean(a_k, axis=-1))
+
+            valid = (np.all(g_k > 0, axis=-1) & np.all(np.isfinite(g_k), axis=-1)
+                     & (mean_ratio > 0) & np.isfinite(obj))
+        obj = np.where(valid, obj, np.inf)
+        grad = np.where(valid[..., np.newaxis], grad, np.nan)
+
+        if params.ndim == 1:
+            return np.float64(obj), grad
+        return obj, grad
+
+    def hessian(self, params: np.ndarray, data: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Analytic Hessian of the LWLFC objective function.
+
+        Parameters
+        ----------
+        params : np.ndarray
+            Parameter vector [d, theta] for LWLFC or [d, theta_w, theta_u] for LWPLFC.
+        data : Dict[str, np.ndarray]
+            Precomputed quantities from prepare_data.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of second derivatives of the objective.
+        """
+        g_k, dg = self._pseudo_spectrum(params, data)
+        m = len(g_k)
+
+        r_k = data['I_X'] / g_k
+        mean_ratio = np.mean(r_k)
+        a_k = dg / g_k
+
+        # Only d enters g_k nonlinearly: d2g/dd2 = 4 log(lambda)^2 lambda^{-2d}
+        b_k = np.zeros((len(params), len(params), m))
+        b_k[0, 0] = 4 * data['log_freqs']**2 * np.exp(-2 * params[0] * data['log_freqs']) / g_k
+
+        mean_ra = (a_k @ r_k) / m
+        mean_raa = np.einsum('ik,jk,k->ij', a_k, a_k, r_k) / m
+        mean_rb = (b_k @ r_k) / m
+        mean_aa = (a_k @ a_k.T) / m
+        mean_b = np.mean(b_k, axis=2)
+
+        return (-(mean_rb - 2 * mean_raa) / mean_ratio
+                - np.outer(mean_ra, mean_ra) / mean_ratio**2
+                + mean_b - mean_aa)
+
+    def _objective_array(self,
+                         d: np.ndarray,
+                         theta: np.ndarray,
+                         data: Dict[str, np.ndarray],
+                         theta_noise=0.0) -> np.ndarray:
+        """
+        Objective function evaluated elementwise on broadcast parameter arrays.
+
+        Returns inf wherever the objective is not defined.
+        """
+        d, theta, theta_noise = np.broadcast_arrays(d, theta, theta_noise)
+        log_freqs = data['log_freqs']
+        lfc = data['freqs']**(-2) / data['n']
+
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            g_k = (np.exp(-2 * d[..., None] * log_freqs) + theta_noise[..., None]
+                   + theta[..., None] * lfc)
+            obj = np.log(np.mean(data['I_X'] / g_k, axis=-1)) + np.mean(np.log(g_k), axis=-1)
+        valid = np.all(g_k > 0, axis=-1) & np.isfinite(obj)
+        return np.where(valid, obj, np.inf)
+
+    def _profile(self,
+                 data: Dict[str, np.ndarray],
+                 theta_max: float) -> Tuple[Dict[str, np.ndarray], np.ndarray, Any]:
+        """
+        Profile the auxiliary parameters out of the objective on a d grid.
+
+        For every d in the grid, theta is concentrated out by a golden
+        section search over log(1 + theta), run in lockstep for the whole
+        grid.  For noise=True, theta_w is concentrated out over a log-spaced
+        grid on [0, theta_max] in the same array computation.  With data
+        prepared from a 2-D array, all series are profiled together.
+
+        Returns the profile, the best grid point as a starting value, and
+        the number of objective evaluations (per series for 2-D data).
+        """
+        I_X = data['I_X']
+        batch = I_X.shape[:-1]
+        d_grid = np.linspace(self.bounds[0], self.bounds[1], self.n_grid)
+        u_max = np.log1p(theta_max)
+
+        if self.noise:
+            grid_shape = (self.n_grid, 16)
+            d, theta_noise = np.meshgrid(d_grid, np.expm1(np.linspace(0.0, u_max, 16)),
+                                         indexing='ij')
+        else:
+            grid_shape = (self.n_grid,)
+            d, theta_noise = d_grid, np.zeros_like(d_grid)
+        d = np.broadcast_to(d, batch + grid_shape)
+        theta_noise = np.broadcast_to(theta_noise, batch + grid_shape)
+        grid_data = dict(data, I_X=I_X.reshape(batch + (1,) * len(grid_shape) + I_X.shape[-1:]))
+
+        # Inner search over u = log(1 + theta); check theta = 0 separately
+        # since the golden section search never evaluates the endpoints
+        result = vectorized_golden_section_search(
+            lambda u: self._objective_array(d, np.expm1(u), grid_data, theta_noise),
+            np.zeros(d.shape), np.full(d.shape, u_max), tol=1e-4)
+        obj_zero = self._objective_array(d, 0.0, grid_data, theta_noise)
+        theta = np.where(obj_zero <= result.fun, 0.0, np.expm1(result.x))
+        obj = np.minimum(obj_zero, result.fun)
+        nfev = (np.sum(result.nfev.reshape(batch + (-1,)), axis=-1)
+                + int(np.prod(grid_shape)))[()]
 
-        # Set up optimization bounds.
-        # Matches the R LongMemoryTS Hou.Perron implementation.
+        if self.noise:
+            best_w = np.argmin(obj, axis=-1)[..., None]
+            theta = np.take_along_axis(theta, best_w, axis=-1)[..., 0]
+            theta_noise = np.take_along_axis(theta_noise, best_w, axis=-1)[..., 0]
+            obj = np.take_along_axis(obj, best_w, axis=-1)[..., 0]
+
+        profile = {'d': d_grid, 'objective': obj, 'theta': theta}
+        i = np.argmin(obj, axis=-1)[..., None]
+        best_theta = np.take_along_axis(theta, i, axis=-1)[..., 0]
+        if self.noise:
+            profile['theta_noise'] = theta_noise
+            best_theta_noise = np.take_along_axis(theta_noise, i, axis=-1)[..., 0]
+            x0 = np.stack([d_grid[i[..., 0]], best_theta_noise, best_theta], axis=-1)
+        else:
+            x0 = np.stack([d_grid[i[..., 0]], best_theta], axis=-1)
+        return profile, x0, nfev
+
+    def _param_bounds(self):
+        """
+        Parameter bounds for the optimization and the method identifier.
+
+        Matches the R LongMemoryTS Hou.Perron implementation.
+        """
         if self.noise:
             # LWPLFC: [d, theta_w, theta_u]
             # theta_w >= 0 (noise variance ratio)
@@ -221,82 +411,148 @@ class LWLFC:
                 (0.0, 10000),     # theta in [0, 10000]
             ]
             method = 'lwlfc'
+        return param_bounds, method
 
-        # Objective function wrapper
-        nfev = [0]
-
-        def obj_func(params):
-            nfev[0] += 1
-            return self.objective(params, data)
+    def _starting_values(self, data: Dict[str, np.ndarray], param_bounds):
+        """
+        Starting values for the quasi-Newton search.
 
-        # Starting point: (d=0, theta=0).
-        # Matches the R LongMemoryTS Hou.Perron implementation.
-        if self.noise:
-            x0 = np.array([0.0, 0.0, 0.0])
+        Returns the profile (or None), the starting values and the number of
+        objective evaluations spent on finding them.
+        """
+        if self.optimizer == 'qn':
+            # Starting point: (d=0, theta=0).
+            # Matches the R LongMemoryTS Hou.Perron implementation.
+            x0 = np.zeros(data['I_X'].shape[:-1] + (len(param_bounds),))
+            return None, x0, 0
+        elif self.optimizer == 'profile':
+            # Starting point: best point of the profiled objective
+            return self._profile(data, param_bounds[-1][1])
         else:
-            x0 = np.array([0.0, 0.0])
+            raise ValueError("optimizer must be one of 'qn', 'profile'")
 
-        # L-BFGS-B optimization.
-        # Matches the R LongMemoryTS Hou.Perron implementation.
-        try:
-            best_result = minimize(
-                obj_func,
-                x0,
-                method='L-BFGS-B',
-                bounds=param_bounds,
-                options={'maxiter': 1000, 'ftol': 1e-8}
-            )
-        except Exception:
-            best_result = None
-
-        if best_result is None or not np.isfinite(best_result.fun):
-            d_hat = np.nan
-            theta = np.nan
-            theta_noise = np.nan
-            final_obj = np.nan
+    def _optimize(self,
+                  data: Dict[str, np.ndarray],
+                  x0: np.ndarray,
+                  param_bounds) -> Dict[str, Any]:
+        """
+        Minimize the objective from x0 and compute the standard errors.
+
+        data['I_X'] and x0 hold one row per series; the searches for all
+        rows run in lockstep and the results are arrays over the rows.
+        """
+        m = data['m']
+        I_X = data['I_X']
+
+        # Bounded quasi-Newton optimization with analytic gradient.
+        # Tolerance matches the R LongMemoryTS Hou.Perron implementation.
+        best_result = vectorized_bounded_quasi_newton(
+            lambda params, index: self.objective_and_gradient(params, dict(data, I_X=I_X[index])),
+            x0,
+            bounds=param_bounds,
+            ftol=1e-8,
+            maxiter=1000
+        )
+
+        valid = np.isfinite(best_result.fun)
+        d_hat = np.where(valid, best_result.x[:, 0], np.nan)
+        theta = np.where(valid, best_result.x[:, -1], np.nan)
+        if self.noise:
+            theta_noise = np.where(valid, best_result.x[:, 1], np.nan)
         else:
-            d_hat = best_result.x[0]
-            if self.noise:
-                theta_noise = best_result.x[1]
-                theta = best_result.x[2]
-            else:
-                theta = best_result.x[1]
-                theta_noise = np.nan
-            final_obj = best_result.fun
+            theta_noise = np.full(len(x0), np.nan)
+        final_obj = np.where(valid, best_result.fun, np.nan)
 
         # Asymptotic standard error: Theorem 2 of Hou and Perron (2014)
         ase = 1 / (2 * np.sqrt(m))
 
-        # Finite-sample standard error via numerical Hessian
-        if np.isfinite(d_hat) and best_result is not None:
-            try:
-                # Compute numerical Hessian at the optimum
-                eps = 1e-5
-                if self.noise:
-                    params_opt = np.array([d_hat, theta_noise, theta])
-                else:
-                    params_opt = np.array([d_hat, theta])
-
-                # Second derivative w.r.t. d (first parameter)
-                d_plus = params_opt.copy()
-                d_plus[0] += eps
-                d_minus = params_opt.copy()
-                d_minus[0] -= eps
-
-                f_plus = self.objective(d_plus, data)
-                f_minus = self.objective(d_minus, data)
-                f_center = final_obj
-
-                d2_dd = (f_plus - 2*f_center + f_minus) / (eps**2)
-
-                if d2_dd > 0:
-                    se = np.sqrt(1 / (m * d2_dd))
-                else:
-                    se = ase  # Fall back to asymptotic SE
-            except Exception:
-                se = ase
+        # Finite-sample standard error from the analytic second derivative
+        # of the objective with respect to d at the optimum
+        se = np.full(len(x0), np.nan)
+        for i in np.flatnonzero(np.isfinite(d_hat)):
+            d2_dd = self.hessian(best_result.x[i], dict(data, I_X=I_X[i]))[0, 0]
+            if d2_dd > 0:
+                se[i] = np.sqrt(1 / (m * d2_dd))
+            else:
+                se[i] = ase  # Fall back to asymptotic SE
+
+        return {
+            'd_hat': d_hat,
+            'theta': theta,
+            'theta_noise': theta_noise,
+            'se': se,
+            'ase': ase,
+            'objective': final_obj,
+            'nfev': best_result.nfev,
+        }
+
+    def fit(self, X, m=None, verbose=False, d_init=None):
+        """
+        LWLFC estimation of memory parameter d.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Time series data.
+        m : int or 'plugin', optional
+            Number of frequencies to use. If None, uses n^0.8 as recommended
+            by Hou and Perron (2014) for the case with only LFC. If 'plugin',
+            uses the plug-in MSE-optimal bandwidth of LWPluginM.
+        verbose : bool, default=False
+            Print diagnostic information during fitting.
+        d_init : float or 'gph', optional
+            Starting value of d for the quasi-Newton search, with theta
+            (and theta_noise) starting at zero. Replaces the starting
+            values of the optimizer setting, so no profile is computed.
+            'gph' uses the log-periodogram regression estimate (see
+            pyelw.gph.gph).
+
+        Returns
+        -------
+        self : object
+            Returns the fitted estimator.
+        """
+        X = np.asarray(X, dtype=np.float64).flatten()
+        n = len(X)
+
+        # Default bandwidth
+        if m is None:
+            m = int(n**0.8)
+        elif m == 'plugin':
+            # Use plug-in MSE-optimal bandwidth
+            from .lw_plugin_m import LWPluginM
+            selector = LWPluginM(bounds=self.bounds, verbose=verbose)
+            selector.select(X)
+
+            # Store plug-in-specific attributes
+            self.plugin_m_optimal_m_ = selector.optimal_m_
+            self.plugin_m_curvature_ = selector.curvature_
+
+            m = selector.optimal_m_
+
+        # Prepare data
+        data = self.prepare_data(X, m)
+
+        # Optimize from the starting values
+        param_bounds, method = self._param_bounds()
+        if d_init is None:
+            profile, x0, nfev = self._starting_values(data, param_bounds)
+        elif self.optimizer not in ('qn', 'profile'):
+            raise ValueError("optimizer must be one of 'qn', 'profile'")
         else:
-            se = np.nan
+            d0, _ = initial_bracket(d_init, m, data['I_X'], data['freqs'])
+            profile, x0, nfev = None, np.zeros(len(param_bounds)), 0
+            if np.isfinite(d0):
+                x0[0] = np.clip(d0, *param_bounds[0])
+        result = self._optimize(dict(data, I_X=data['I_X'][np.newaxis]), x0[np.newaxis],
+                                param_bounds)
+        nfev += int(result['nfev'][0])
+
+        d_hat = result['d_hat'][0]
+        theta = result['theta'][0]
+        theta_noise = result['theta_noise'][0]
+        se = result['se'][0]
+        ase = result['ase']
 
         # Store fitted attributes
         self.n_ = n
@@ -306,8 +562,9 @@ class LWLFC:
         self.theta_noise_ = theta_noise if self.noise else np.nan
         self.se_ = se
         self.ase_ = ase
-        self.objective_ = final_obj
-        self.nfev_ = nfev[0]
+        self.objective_ = result['objective'][0]
+        self.nfev_ = nfev
+        self.profile_ = profile
         self.method_ = method
 
         if verbose:
@@ -319,10 +576,90 @@ class LWLFC:
             print(f"  se = {se:.6f}")
             print(f"  ase = {ase:.6f}")
             print(f"  n = {n}, m = {m}")
-            print(f"  nfev = {nfev[0]}")
+            print(f"  nfev = {nfev}")
 
         return self
 
+    def fit_many(self, X: np.ndarray, m: Optional[int] = None) -> Dict[str, Any]:
+        """
+        LWLFC estimation for many series of equal length.
+
+        All periodograms are computed with one FFT along the rows.  The
+        profile stage (optimizer='profile') and the quasi-Newton search are
+        vectorized across series, in chunks of rows to bound memory.  The
+        searches run in lockstep with the same steps as fit() for each
+        series, so each series gives the same estimate.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            2-D array with one time series per row
+        m : int, optional
+            Number of frequencies to use for every series. Default n^0.8.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary containing:
+            - 'n': sample size
+            - 'm': number of frequencies
+            - 'd_hat': array of memory parameter estimates
+            - 'theta': array of LFC parameter estimates
+            - 'theta_noise': array of noise parameter estimates (noise=True)
+            - 'se': array of standard errors
+            - 'ase': asymptotic standard error
+            - 'objective': array of objective function values
+            - 'nfev': array of objective function evaluation counts
+            - 'method': estimation method
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2:
+            raise ValueError("X must be a 2-D array with one series per row")
+        n_series, n = X.shape
+
+        if m is None:
+            m = int(n**0.8)
+        elif isinstance(m, str):
+            raise ValueError("fit_many requires an integer bandwidth m")
+
+        # Batched periodograms, one row per series
+        data = self.prepare_data(X, m)
+        param_bounds, method = self._param_bounds()
+
+        # Starting values and searches, in chunks of rows so that the
+        # profile and gradient arrays stay small enough to be cache friendly
+        if self.optimizer == 'profile':
+            width = self.n_grid * (16 if self.noise else 1)
+        else:
+            width = len(param_bounds)
+        chunk = max(1, 2**18 // (width * m))
+        keys = ['d_hat', 'theta', 'theta_noise', 'se', 'objective']
+        out = {key: np.empty(n_series) for key in keys}
+        nfev = np.zeros(n_series, dtype=int)
+        for start in range(0, n_series, chunk):
+            rows = slice(start, start + chunk)
+            chunk_data = dict(data, I_X=data['I_X'][rows])
+            _, x0, nfev[rows] = self._starting_values(chunk_data, param_bounds)
+            result = self._optimize(chunk_data, x0, param_bounds)
+            for key in keys:
+                out[key][rows] = result[key]
+            nfev[rows] += result['nfev']
+
+        results = {
+            'n': n,
+            'm': m,
+            'd_hat': out['d_hat'],
+            'theta': out['theta'],
+            'se': out['se'],
+            'ase': 1 / (2 * np.sqrt(m)),
+            'objective': out['objective'],
+            'nfev': nfev,
+            'method': method,
+        }
+        if self.noise:
+            results['theta_noise'] = out['theta_noise']
+        return results
+
     def estimate(self,
                  X: np.ndarray,
                  m=None,
@@ -339,7 +676,7 @@ class LWLFC:
         ----------
         X : np.ndarray
             Time series data.
-        m : int, optional
+        m : int or 'plugin', optional
             Number of frequencies to use.
         bounds : tuple of float, optional
             Lower and upper bounds for optimization.
@@ -398,6 +735,10 @@ class LWLFC:
             params.append(f"bounds={self.bounds}")
         if self.noise != self._default_noise:
             params.append(f"noise={self.noise}")
+        if self.optimizer != self._default_optimizer:
+            params.append(f"optimizer='{self.optimizer}'")
+        if self.n_grid != self._default_n_grid:
+            params.append(f"n_grid={self.n_grid}")
 
         params_str = ", ".join(params)
         return f"LWLFC({params_str})"
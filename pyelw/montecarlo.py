@@ -0,0 +1,712 @@
+import contextlib
+import copy
+import functools
+import inspect
+import itertools
+import json
+import os
+import tempfile
+import textwrap
+import time
+import numpy as np
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .parallel import effective_n_jobs
+from .simulate import replication_seeds
+
+
+class RunningStats:
+    """
+    Streaming mean and variance of a sequence of estimates.
+
+    Uses the updating formulas of Welford (1962), in the pairwise form of
+    Chan, Golub and LeVeque (1983) for batches, so that statistics can be
+    accumulated chunk by chunk and statistics from different workers can
+    be merged without storing the individual values.  Non-finite values,
+    such as those of failed estimates, are counted separately and left
+    out of the statistics.
+
+    Attributes
+    ----------
+    count : int
+        Number of finite values
+    mean : float
+        Mean of the finite values
+    m2 : float
+        Sum of squared deviations from the mean
+    n_nonfinite : int
+        Number of non-finite values
+
+    References
+    ----------
+    Welford, B. P. (1962). Note on a Method for Calculating Corrected Sums
+    of Squares and Products. _Technometrics_ 4, 419--420.
+
+    Chan, T. F., G. H. Golub and R. J. LeVeque (1983). Algorithms for
+    Computing the Sample Variance: Analysis and Recommendations. _The
+    American Statistician_ 37, 242--247.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.n_nonfinite = 0
+
+    def _combine(self, count: int, mean: float, m2: float):
+        total = self.count + count
+        if count == 0:
+            return
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta**2 * self.count * count / total
+        self.count = total
+
+    def update(self, values) -> "RunningStats":
+        """
+        Add one value or an array of values.
+
+        Parameters
+        ----------
+        values : float or array_like
+            New values
+
+        Returns
+        -------
+        self : RunningStats
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        finite = np.isfinite(values)
+        self.n_nonfinite += int(np.count_nonzero(~finite))
+        values = values[finite]
+        if len(values):
+            mean = float(np.mean(values))
+            self._combine(len(values), mean, float(np.sum((values - mean)**2)))
+        return self
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Add the values summarized by another RunningStats.
+
+        Parameters
+        ----------
+        other : RunningStats
+            Statistics of other values
+
+        Returns
+        -------
+        self : RunningStats
+        """
+        self._combine(other.count, other.mean, other.m2)
+        self.n_nonfinite += other.n_nonfinite
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Variance of the values (with divisor count, as np.var)."""
+        return self.m2 / self.count if self.count else np.nan
+
+    @property
+    def std(self) -> float:
+        """Standard deviation of the values (with divisor count, as np.std)."""
+        return np.sqrt(self.variance)
+
+    @property
+    def sem(self) -> float:
+        """Monte Carlo standard error of the mean."""
+        return np.sqrt(self.m2 / (self.count - 1) / self.count) if self.count > 1 else np.nan
+
+    def __repr__(self):
+        return f"RunningStats(count={self.count}, mean={self.mean:.6g}, std={self.std:.6g})"
+
+
+class RunningCovariance:
+    """
+    Streaming mean vector and covariance matrix of a sequence of vectors.
+
+    The multivariate counterpart of RunningStats, used for estimates
+    together with their control variates.  Vectors with a non-finite
+    element are counted separately and left out.
+
+    Parameters
+    ----------
+    k : int
+        Dimension of the vectors
+
+    Attributes
+    ----------
+    count : int
+        Number of finite vectors
+    mean : np.ndarray
+        Mean vector
+    comoment : np.ndarray
+        Sum of outer products of deviations from the mean (k x k)
+    n_nonfinite : int
+        Number of vectors with a non-finite element
+    """
+
+    def __init__(self, k: int):
+        self.count = 0
+        self.mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+        self.n_nonfinite = 0
+
+    def _combine(self, count: int, mean: np.ndarray, comoment: np.ndarray):
+        if count == 0:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * count / total
+        self.comoment = self.comoment + comoment + np.outer(delta, delta) * self.count * count / total
+        self.count = total
+
+    def update(self, values) -> "RunningCovariance":
+        """
+        Add the rows of an array of vectors.
+
+        Parameters
+        ----------
+        values : array_like
+            N x k array, one vector per row
+
+        Returns
+        -------
+        self : RunningCovariance
+        """
+        values = np.asarray(values, dtype=np.float64).reshape(-1, len(self.mean))
+        finite = np.isfinite(values).all(axis=1)
+        self.n_nonfinite += int(np.count_nonzero(~finite))
+        values = values[finite]
+        if len(values):
+            mean = np.mean(values, axis=0)
+            dev = values - mean
+            self._combine(len(values), mean, dev.T @ dev)
+        return self
+
+    def merge(self, other: "RunningCovariance") -> "RunningCovariance":
+        """
+        Add the vectors summarized by another RunningCovariance.
+
+        Parameters
+        ----------
+        other : RunningCovariance
+            Statistics of other vectors
+
+        Returns
+        -------
+        self : RunningCovariance
+        """
+        self._combine(other.count, other.mean, other.comoment)
+        self.n_nonfinite += other.n_nonfinite
+        return self
+
+    def mean_and_se(self) -> Tuple[float, float]:
+        """
+        Control variate estimate of the mean of the first element and its standard error.
+
+        The remaining elements are control variates with mean zero: the
+        estimate is mean[0] - beta' mean[1:], with beta the coefficients
+        of the least squares regression of the first element on the
+        others.  With k = 1 this is the sample mean.
+
+        Returns
+        -------
+        Tuple[float, float]
+            Estimate and standard error (NaN without enough vectors)
+        """
+        k = len(self.mean)
+        if self.count <= k:
+            return (self.mean[0] if self.count else np.nan), np.nan
+        S = self.comoment
+        beta = np.linalg.lstsq(S[1:, 1:], S[1:, 0], rcond=None)[0] if k > 1 else np.zeros(0)
+        residual = (S[0, 0] - beta @ S[1:, 0]) / (self.count - k)
+        return self.mean[0] - beta @ self.mean[1:], np.sqrt(max(residual, 0.0) / self.count)
+
+
+# An estimator configuration: an estimator, or an estimator and the
+# keyword arguments of its fit method, possibly depending on the cell
+EstimatorConfig = Union[Any, Tuple[Any, Union[Dict[str, Any], Callable[..., Dict[str, Any]]]]]
+
+
+def _grid_cells(grid) -> List[Dict[str, Any]]:
+    """Expand a mapping of parameter lists, or a sequence of mappings, into cells."""
+    if isinstance(grid, Mapping):
+        names = list(grid)
+        values = [v if isinstance(v, (list, tuple, np.ndarray)) else [v] for v in grid.values()]
+        return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+    return [dict(cell) for cell in grid]
+
+
+def _estimator_configs(estimators) -> List[Tuple[str, Any, Any]]:
+    """Names, estimators and fit parameters of the estimator configurations."""
+    if not isinstance(estimators, Mapping):
+        estimators = {repr(est): est for est in estimators}
+    configs = []
+    for name, config in estimators.items():
+        if isinstance(config, tuple):
+            est, fit_params = config
+        else:
+            est, fit_params = config, {}
+        configs.append((str(name), est, fit_params))
+    return configs
+
+
+def _atomic_write(path: str, write: Callable[[Any], None]):
+    """Write a file through write(fileobj) so that it appears complete or not at all."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp_')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+
+def _chunk_path(store: str, i: int, start: int) -> str:
+    return os.path.join(store, f'cell{i:05d}_rep{start:09d}.npz')
+
+
+def control_variate(innovations: np.ndarray, m) -> np.ndarray:
+    """
+    Log-periodogram control variates for local Whittle estimates of d.
+
+    Returns, for each row e of innovations,
+
+        C = -sum_j nu_j (|w_j|^2 - 1) / (2 sum_j nu_j^2),  j = 1, ..., m,
+
+    where w_j is the discrete Fourier transform of e at frequency j,
+    normalized by sqrt(n), and nu_j = log j - mean(log j).  For iid
+    standard normal innovations, E|w_j|^2 = 1 exactly, so C has mean
+    zero, and its variance is 1/(4 sum nu_j^2), about 1/(4m).  C is the
+    leading term of the expansion of d_hat - d for the local Whittle
+    estimators with bandwidth m (Robinson, 1995), so the two are highly
+    correlated when the innovations drive the series.
+
+    Parameters
+    ----------
+    innovations : np.ndarray
+        R x n array of iid standard normal innovations, e.g. from
+        arfima_batch(..., return_innovations=True)
+    m : int or array_like of int
+        Bandwidth, or one bandwidth per row
+
+    Returns
+    -------
+    np.ndarray
+        Control variates, one per row
+
+    References
+    ----------
+    Robinson, P. M. (1995). Gaussian Semiparametric Estimation of Long
+    Range Dependence. _Annals of Statistics_ 23, 1630--1661.
+    """
+    E = np.atleast_2d(np.asarray(innovations, dtype=np.float64))
+    n = E.shape[1]
+    ms = np.broadcast_to(np.asarray(m, dtype=int), (len(E),))
+    m_max = int(ms.max())
+    I = np.abs(np.fft.rfft(E, axis=1)[:, 1:m_max+1])**2 / n
+    C = np.empty(len(E))
+    for mj in np.unique(ms):
+        nu = np.log(np.arange(1, mj + 1))
+        nu -= nu.mean()
+        rows = ms == mj
+        C[rows] = -(I[rows, :mj] - 1) @ nu / (2 * nu @ nu)
+    return C
+
+
+def _run_chunk(dgp: Callable, cell: Dict[str, Any], seeds: list,
+               configs: List[Tuple[str, Any, Any]],
+               path: Optional[str] = None,
+               save_data: bool = False,
+               antithetic: bool = False,
+               control_variates: bool = False
+               ) -> Tuple[List[RunningStats], List[RunningCovariance], List[float]]:
+    """
+    Simulate one chunk of replications of a cell and fit every estimator.
+
+    Returns the statistics of the estimates, the statistics of the
+    independent units (estimates with their control variates, averaged
+    over antithetic pairs) and the fit times.  If path is given, these
+    are also saved there, with the simulated data next to them if
+    save_data is true.
+    """
+    dgp_kwargs = {'antithetic': True} if antithetic else {}
+    result = dgp(len(seeds), seed=seeds, **cell, **dgp_kwargs)
+    X, E = result if control_variates else (result, None)
+    X = np.atleast_2d(X)
+
+    stats, units, times, estimates = [], [], [], []
+    for _, est, fit_params in configs:
+        params = fit_params(**cell) if callable(fit_params) else fit_params
+        est = copy.deepcopy(est)
+        start = time.perf_counter()
+        d_hat, m = np.empty(len(X)), np.empty(len(X), dtype=int)
+        for r, x in enumerate(X):
+            est.fit(x, **params)
+            d_hat[r] = est.d_hat_
+            m[r] = getattr(est, 'm_', getattr(est, 'optimal_m_', 0))
+        times.append(time.perf_counter() - start)
+        stats.append(RunningStats().update(d_hat))
+        estimates.append(d_hat)
+
+        Z = d_hat[:, None]
+        if E is not None:
+            Z = np.column_stack([d_hat, control_variate(E, m)])
+        if antithetic:
+            Z = (Z[0::2] + Z[1::2]) / 2
+        units.append(RunningCovariance(Z.shape[1]).update(Z))
+
+    if path is not None:
+        if save_data:
+            _atomic_write(path[:-len('.npz')] + '.data.npy', lambda f: np.save(f, X))
+        # The statistics file is written last and marks the chunk as done
+        _atomic_write(path, lambda f: np.savez(
+            f, d_hat=np.array(estimates), time=np.array(times),
+            count=np.array([st.count for st in stats]),
+            mean=np.array([st.mean for st in stats]),
+            m2=np.array([st.m2 for st in stats]),
+            n_nonfinite=np.array([st.n_nonfinite for st in stats]),
+            unit_count=np.array([u.count for u in units]),
+            unit_mean=np.array([u.mean for u in units]),
+            unit_comoment=np.array([u.comoment for u in units]),
+            unit_nonfinite=np.array([u.n_nonfinite for u in units])))
+    return stats, units, times
+
+
+def _load_chunk(path: str) -> Tuple[List[RunningStats], List[RunningCovariance], List[float]]:
+    """Statistics and fit times of a chunk saved by _run_chunk."""
+    with np.load(path) as f:
+        stats, units = [], []
+        for k in range(len(f['count'])):
+            st = RunningStats()
+            st.count, st.mean, st.m2 = int(f['count'][k]), float(f['mean'][k]), float(f['m2'][k])
+            st.n_nonfinite = int(f['n_nonfinite'][k])
+            stats.append(st)
+            u = RunningCovariance(f['unit_mean'].shape[1])
+            u.count, u.mean, u.comoment = int(f['unit_count'][k]), f['unit_mean'][k], f['unit_comoment'][k]
+            u.n_nonfinite = int(f['unit_nonfinite'][k])
+            units.append(u)
+        return stats, units, list(f['time'])
+
+
+def _indexed_chunk(key: Tuple[int, int], *args) -> Tuple[Tuple[int, int], Any]:
+    return key, _run_chunk(*args)
+
+
+def _json_default(obj):
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"cannot store {type(obj).__name__} in a Monte Carlo study description")
+
+
+def _describe(obj) -> Any:
+    """
+    Description of a data generating process or fit parameters for study.json.
+
+    Functions are described by their qualified names, and lambdas and
+    nested functions also by their source, so that the description is the
+    same in every run of the same code.  Partial functions are described
+    by their function and arguments.
+    """
+    if isinstance(obj, functools.partial):
+        return {'func': _describe(obj.func), 'args': [_describe(a) for a in obj.args],
+                'keywords': {k: _describe(v) for k, v in sorted(obj.keywords.items())}}
+    if isinstance(obj, Mapping):
+        return {str(k): _describe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_describe(v) for v in obj]
+    if isinstance(obj, (str, int, float, bool, np.generic, np.ndarray)) or obj is None:
+        return obj
+    qualname = getattr(obj, '__qualname__', None)
+    if callable(obj) and qualname is not None:
+        name = f"{getattr(obj, '__module__', None)}.{qualname}"
+        if '<' in qualname:
+            with contextlib.suppress(OSError, TypeError):
+                name += ': ' + textwrap.dedent(inspect.getsource(obj)).strip()
+        return name
+    return repr(obj)
+
+
+def _open_store(store: str, spec: Dict[str, Any], seed_given: bool) -> Dict[str, Any]:
+    """
+    Create the study description in store, or check it against an existing one.
+
+    Returns the description in effect, whose seed is the stored one when
+    no seed was given, so that a run with fresh entropy can be resumed.
+    """
+    os.makedirs(store, exist_ok=True)
+    path = os.path.join(store, 'study.json')
+    spec = json.loads(json.dumps(spec, default=_json_default))
+    if os.path.exists(path):
+        with open(path) as f:
+            stored = json.load(f)
+        if not seed_given:
+            spec['entropy'], spec['spawn_key'] = stored['entropy'], stored['spawn_key']
+        for key in spec:
+            if spec[key] != stored.get(key):
+                raise ValueError(f"store {store!r} holds a different study ({key} differs)")
+        return stored
+    _atomic_write(path, lambda f: f.write(json.dumps(spec, indent=1).encode()))
+    return spec
+
+
+def monte_carlo(dgp: Callable[..., np.ndarray],
+                estimators: Union[Mapping[str, EstimatorConfig], Sequence[Any]],
+                grid,
+                R: int = 1000,
+                seed: Union[None, int, np.random.SeedSequence] = 0,
+                target: Union[str, Callable[..., float]] = 'd',
+                n_jobs: int = -1,
+                backend: str = 'loky',
+                chunk_size: Optional[int] = None,
+                store: Optional[str] = None,
+                shard: Optional[Tuple[int, int]] = None,
+                save_data: bool = False,
+                antithetic: bool = False,
+                control_variates: bool = False,
+                common_random_numbers: bool = False) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Monte Carlo study of estimators of d over a grid of parameters.
+
+    For each cell of the parameter grid, simulates R replications from
+    the data generating process, fits every estimator to each of them and
+    summarizes the estimates by their bias, standard deviation and RMSE.
+    The replications of all cells are split into chunks which run on a
+    pool of worker processes.  Each worker returns streaming statistics
+    (RunningStats) for its chunk instead of the estimates themselves, and
+    the chunks of each cell are merged in a fixed order, so the results
+    do not depend on the number of workers.
+
+    Replication r of cell i is drawn from child (i, r) of the root seed
+    sequence, so every replication is reproducible by itself (see
+    replication_seeds).
+
+    Three variance reduction techniques reach a given precision with
+    fewer replications.  All estimators are always fitted to the same
+    replications (common random numbers across estimators), so that
+    their differences are estimated precisely; common_random_numbers
+    extends this across the cells of the grid.  antithetic pairs each
+    replication with one whose innovations have a negatively correlated
+    periodogram, and control_variates adjusts the mean of the estimates
+    with a statistic of the innovations of known mean zero (see
+    control_variate).  The 'mcse' column is the standard error of the
+    resulting estimate of the mean (and the bias), and 'reps_eff' is the
+    number of independent replications that would give the same
+    standard error.
+
+    Parameters
+    ----------
+    dgp : callable
+        Data generating process, called as dgp(R, seed=seeds, **cell) and
+        returning an R x n array with one replication per row, where seeds
+        is a list of R seed sequences.  The batch simulators of
+        pyelw.simulate, such as arfima_batch, have this signature.  Use
+        functools.partial to fix other arguments, e.g.
+        partial(arfima_batch, burnin=1000).  Must be picklable for process
+        backends (loky also accepts lambdas).
+    estimators : mapping or sequence
+        Estimator configurations, by name.  Each is an estimator, such as
+        ELW(bounds=(-4, 4)), or a tuple (estimator, fit_params) where
+        fit_params is a dict of keyword arguments for fit() or a callable
+        returning it from the cell parameters, e.g.
+        lambda n, **cell: {'m': int(n**0.65)}.  A sequence of estimators
+        is named by their representations.
+    grid : mapping or sequence of mappings
+        Parameter grid: a mapping from parameter names to lists of values,
+        whose cartesian product gives the cells, or an explicit sequence
+        of cells, each a mapping of parameter names to values.
+    R : int, default=1000
+        Number of replications per cell
+    seed : int, SeedSequence or None, default=0
+        Root seed.  None draws fresh entropy.
+    target : str or callable, default='d'
+        True value of d in each cell: the name of a grid parameter, or a
+        callable returning it from the cell parameters.
+    n_jobs : int, default=-1
+        Number of worker processes.  -1 uses all available cores, 1 runs
+        serially in this process without importing joblib.
+    backend : str, default='loky'
+        joblib backend ('loky', 'multiprocessing' or 'threading').
+    chunk_size : int, optional
+        Number of replications per task.  Default 100.  The results do
+        not depend on the number of workers, but may differ in the last
+        digits for different chunk sizes.
+    store : str, optional
+        Directory in which to checkpoint the study.  Each completed chunk
+        is saved as an NPZ file with its estimates ('d_hat', estimators x
+        replications) and statistics, written atomically, and chunks
+        already in the store are skipped, so an interrupted run resumes
+        where it stopped when called again with the same arguments.  The
+        study description, including the data generating process, the
+        representations of the estimators and their fit parameters, is
+        saved as study.json and checked on resume, and a run with
+        different settings raises a ValueError instead of reusing the
+        stored chunks.  With seed=None, the stored seed is reused.
+    shard : tuple of (int, int), optional
+        (k, K) to run only shard k of K: the chunks whose position in the
+        list of all chunks is k modulo K.  Requires store.  Shards may run
+        on different machines sharing the store directory, and
+        load_results combines them once all have finished.
+    save_data : bool, default=False
+        Also save the simulated data of each chunk in the store, as an
+        .npy array (replications x n) that can be memory-mapped with
+        np.load(path, mmap_mode='r').
+    antithetic : bool, default=False
+        Simulate replications in antithetic pairs: dgp is called with
+        antithetic=True (see arfima_batch) and averages are taken over
+        pairs.  R must be even; chunk_size is rounded up to an even number.
+    control_variates : bool, default=False
+        Adjust the mean of the estimates with control variates.  dgp must
+        return the R x n standardized innovations of the sample with the
+        data, as arfima_batch(..., return_innovations=True) does, and the
+        control variate of each estimate is computed from them at the
+        bandwidth of the estimate.  The control has mean zero exactly for
+        fixed bandwidths, and only approximately for data-dependent ones.
+    common_random_numbers : bool, default=False
+        Draw replication r of every cell from the same seed, so that
+        differences between cells, e.g. between values of d in a row of
+        a table, are estimated precisely.
+
+    Returns
+    -------
+    Dict[str, np.ndarray] or None
+        Results table with one entry per cell and estimator: the grid
+        parameters, 'estimator' (name), 'd_true' (true value), 'reps' (number
+        of finite estimates), 'n_failed' (number of non-finite estimates),
+        'mean', 'bias', 'sd', 'mse', 'rmse', 'mcse' (Monte Carlo standard
+        error of the mean), 'reps_eff' (effective number of replications)
+        and 'time' (total fit time in seconds).  None if a shard finishes
+        before the others.
+    """
+    if shard is not None:
+        if store is None:
+            raise ValueError("shard requires a store")
+        if not 0 <= shard[0] < shard[1]:
+            raise ValueError("shard must be (k, K) with 0 <= k < K")
+    cells = _grid_cells(grid)
+    configs = _estimator_configs(estimators)
+    truths = [target(**cell) if callable(target) else cell[target] for cell in cells]
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    chunk_size = max(1, min(R, 100 if chunk_size is None else int(chunk_size)))
+    if antithetic:
+        if R % 2:
+            raise ValueError("antithetic requires an even number of replications")
+        chunk_size += chunk_size % 2
+
+    if store is not None:
+        spec = {'R': R, 'chunk_size': chunk_size, 'cells': cells, 'd_true': truths,
+                'estimators': [name for name, _, _ in configs],
+                'estimator_configs': [{'estimator': repr(est), 'fit_params': _describe(fit_params)}
+                                      for _, est, fit_params in configs],
+                'dgp': _describe(dgp),
+                'entropy': root.entropy, 'spawn_key': list(root.spawn_key),
+                'antithetic': antithetic, 'control_variates': control_variates,
+                'common_random_numbers': common_random_numbers}
+        spec = _open_store(store, spec, seed is not None)
+        root = np.random.SeedSequence(spec['entropy'], spawn_key=tuple(spec['spawn_key']))
+    cell_seeds = replication_seeds(root, len(cells))
+    if common_random_numbers:
+        cell_seeds = cell_seeds[:1] * len(cells)
+
+    tasks = [(i, start) for i in range(len(cells)) for start in range(0, R, chunk_size)]
+    if shard is not None:
+        k, K = shard
+        tasks = tasks[k::K]
+    if store is not None:
+        tasks = [key for key in tasks if not os.path.exists(_chunk_path(store, *key))]
+
+    def args(i: int, start: int):
+        seeds = replication_seeds(cell_seeds[i], min(chunk_size, R - start), start=start)
+        path = None if store is None else _chunk_path(store, i, start)
+        return dgp, cells[i], seeds, configs, path, save_data, antithetic, control_variates
+
+    chunks = {}
+    n_workers = min(effective_n_jobs(n_jobs), max(1, len(tasks)))
+    if n_workers == 1:
+        for i, start in tasks:
+            chunks[i, start] = _run_chunk(*args(i, start))
+    else:
+        from joblib import Parallel, delayed
+        pool = Parallel(n_jobs=n_workers, backend=backend, return_as='generator_unordered')
+        for key, result in pool(delayed(_indexed_chunk)(key, *args(*key)) for key in tasks):
+            chunks[key] = result
+
+    if store is not None:
+        # Chunks of other runs and shards are read back from the store
+        if any(not os.path.exists(_chunk_path(store, i, start))
+               for i in range(len(cells)) for start in range(0, R, chunk_size)):
+            return None
+        return load_results(store)
+    names = [name for name, _, _ in configs]
+    return _results_table(cells, names, truths, chunks, chunk_size, R)
+
+
+def load_results(store: str) -> Dict[str, np.ndarray]:
+    """
+    Results table of a Monte Carlo study saved by monte_carlo.
+
+    Merges the statistics of all chunks in the store, whichever run or
+    shard computed them, in the same order as monte_carlo.
+
+    Parameters
+    ----------
+    store : str
+        Store directory of the study
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Results table, as returned by monte_carlo
+    """
+    with open(os.path.join(store, 'study.json')) as f:
+        spec = json.load(f)
+    R, chunk_size = spec['R'], spec['chunk_size']
+    keys = [(i, start) for i in range(len(spec['cells'])) for start in range(0, R, chunk_size)]
+    missing = [key for key in keys if not os.path.exists(_chunk_path(store, *key))]
+    if missing:
+        raise ValueError(f"store {store!r} is incomplete: {len(missing)} of {len(keys)} "
+                         f"chunks missing")
+    chunks = {key: _load_chunk(_chunk_path(store, *key)) for key in keys}
+    return _results_table(spec['cells'], spec['estimators'], spec['d_true'], chunks,
+                          chunk_size, R)
+
+
+def _results_table(cells, names, truths, chunks, chunk_size, R) -> Dict[str, np.ndarray]:
+    """Merge the chunk statistics of each cell in order and tabulate them."""
+    rows = []
+    for i, (cell, truth) in enumerate(zip(cells, truths)):
+        for k, name in enumerate(names):
+            stats, elapsed = RunningStats(), 0.0
+            units = None
+            for start in range(0, R, chunk_size):
+                chunk_stats, chunk_units, chunk_times = chunks[i, start]
+                stats.merge(chunk_stats[k])
+                if units is None:
+                    units = RunningCovariance(len(chunk_units[k].mean))
+                units.merge(chunk_units[k])
+                elapsed += chunk_times[k]
+            mean, mcse = units.mean_and_se()
+            bias = mean - truth
+            mse = stats.variance + bias**2
+            rows.append({**cell, 'estimator': name, 'd_true': truth, 'reps': stats.count,
+                         'n_failed': stats.n_nonfinite, 'mean': mean, 'bias': bias,
+                         'sd': stats.std, 'mse': mse, 'rmse': np.sqrt(mse), 'mcse': mcse,
+                         'reps_eff': (stats.m2 / (stats.count - 1) / mcse**2
+                                      if mcse > 0 else np.nan),
+                         'time': elapsed})
+
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    table = {}
+    for key in columns:
+        values = [row.get(key, np.nan) for row in rows]
+        column = np.array(values) if key != 'estimator' else None
+        if column is None or column.ndim != 1:
+            # Names and non-scalar parameters, such as AR coefficients
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+        table[key] = column
+    return table
@@ -1,5 +1,10 @@
+import os
+import time
 import numpy as np
-from typing import Callable, Optional, Tuple
+from numpy.polynomial import Chebyshev
+from numpy.polynomial.chebyshev import chebpts1
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence, Tuple
 
 _epsilon = np.sqrt(np.finfo(np.float64).eps)
 
@@ -143,24 +148,423 @@ def golden_section_search(func: Callable[[np.float64], np.float64],
     )
 
 
+def brent_search(func: Callable[[np.float64], np.float64],
+                 brack: Optional[Tuple[np.float64, np.float64]] = None,
+                 tol: Optional[np.float64] = _epsilon,
+                 maxiter: Optional[int] = 100) -> OptimizeResult:
+    """
+    Brent's method for minimizing 1D function within bounds.
+
+    Combines golden section steps with successive parabolic interpolation
+    through the three best points found so far.  On smooth objectives the
+    parabolic steps converge superlinearly, so far fewer evaluations are
+    needed than with golden_section_search, while golden section steps are
+    taken whenever a parabolic step is not acceptable.  The convergence
+    criterion is the same as for golden_section_search: the bracket
+    containing the minimum is narrower than tol * max(1, |x|).
+
+    Parameters
+    ----------
+    func : callable
+        Objective function to minimize, taking a single np.float64 argument and returning np.float64
+    brack : tuple, optional
+        Bounds for optimization as (lower, upper) of np.float64. Default: (-0.5, 1.0).
+    tol : np.float64, optional
+        Tolerance for convergence. Default matches SciPy.
+    maxiter : int, optional
+        Maximum number of iterations. Default: 100.
+
+    Returns
+    -------
+    OptimizeResult
+        Optimization results as with golden_section_search.
+
+    References
+    ----------
+    Brent, R. P. (1973). _Algorithms for Minimization without Derivatives_.
+    Prentice-Hall, Chapter 5.
+    """
+    # Default bounds
+    if brack is None:
+        a, b = np.float64(-0.5), np.float64(1.0)
+    else:
+        a, b = np.float64(brack[0]), np.float64(brack[1])
+
+    # Golden section step fraction, 1 minus the golden ratio conjugate
+    cgold = np.float64(0.5 * (3.0 - np.sqrt(5.0)))
+
+    # x: best point, w: second best, v: previous value of w
+    x = w = v = a + cgold * (b - a)
+    fx = fw = fv = func(x)
+    nfev = 1
+    iter = 0
+    step = 0.0   # Step taken in the last iteration
+    e = 0.0      # Step taken in the iteration before last
+
+    # Main loop
+    while iter < maxiter:
+        mid_point = 0.5 * (a + b)
+        tol1 = 0.25 * tol * max(1.0, abs(x))
+        tol2 = 2.0 * tol1
+
+        # Converged when the bracket is narrower than tol * max(1, |x|)
+        if abs(x - mid_point) <= tol2 - 0.5 * (b - a):
+            break
+        iter += 1
+
+        parabolic = False
+        if abs(e) > tol1:
+            # Parabola through (x, fx), (w, fw) and (v, fv)
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2.0 * (q - r)
+            if q > 0.0:
+                p = -p
+            q = abs(q)
+            e_prev = e
+            e = step
+
+            # Accept the parabolic step if it falls within the bracket and
+            # moves less than half the step before last
+            if abs(p) < abs(0.5 * q * e_prev) and q * (a - x) < p < q * (b - x):
+                step = p / q
+                u = x + step
+                # Do not evaluate too close to the bounds
+                if (u - a) < tol2 or (b - u) < tol2:
+                    step = tol1 if x < mid_point else -tol1
+                parabolic = True
+
+        if not parabolic:
+            # Golden section step into the larger part of the bracket
+            e = (b - x) if x < mid_point else (a - x)
+            step = cgold * e
+
+        # Do not evaluate closer than tol1 to x
+        if abs(step) >= tol1:
+            u = x + step
+        else:
+            u = x + (tol1 if step > 0 else -tol1)
+        fu = func(u)
+        nfev += 1
+
+        # Update the bracket and the three best points
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, fv = w, fw
+            w, fw = x, fx
+            x, fx = u, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, fv = w, fw
+                w, fw = u, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+
+    # Convergence assessment
+    success = iter < maxiter
+    if success:
+        message = f"Optimization terminated successfully; tolerance {tol} achieved"
+    else:
+        message = f"Maximum number of iterations ({maxiter}) exceeded"
+
+    return OptimizeResult(
+        x=x,
+        fun=fx,
+        success=success,
+        message=message,
+        nfev=nfev,
+        nit=iter
+    )
+
+
+def scalar_search(func: Callable[[np.float64], np.float64],
+                  brack: Optional[Tuple[np.float64, np.float64]] = None,
+                  method: str = 'golden',
+                  tol: Optional[np.float64] = _epsilon,
+                  maxiter: Optional[int] = 100) -> OptimizeResult:
+    """
+    Minimize 1D function within bounds using the chosen method.
+
+    Parameters
+    ----------
+    func : callable
+        Objective function to minimize, taking a single np.float64 argument and returning np.float64
+    brack : tuple, optional
+        Bounds for optimization as (lower, upper) of np.float64. Default: (-0.5, 1.0).
+    method : str, default='golden'
+        'golden' for golden_section_search or 'brent' for brent_search.
+    tol : np.float64, optional
+        Tolerance for convergence. Default matches SciPy.
+    maxiter : int, optional
+        Maximum number of iterations. Default: 100.
+
+    Returns
+    -------
+    OptimizeResult
+        Optimization results as with golden_section_search.
+    """
+    if method == 'golden':
+        return golden_section_search(func, brack=brack, tol=tol, maxiter=maxiter)
+    elif method == 'brent':
+        return brent_search(func, brack=brack, tol=tol, maxiter=maxiter)
+    else:
+        raise ValueError("optimizer must be one of 'golden', 'brent'")
+
+
+def bracketed_search(func: Callable[[np.float64], np.float64],
+                     brack: Tuple[np.float64, np.float64],
+                     x0: np.float64,
+                     width: np.float64,
+                     method: str = 'golden',
+                     tol: Optional[np.float64] = _epsilon,
+                     maxiter: Optional[int] = 100) -> OptimizeResult:
+    """
+    Minimize 1D function starting from a narrow bracket around an initial guess.
+
+    Searches (x0 - width, x0 + width), intersected with brack.  If the
+    minimum is found at an edge of the narrow bracket that lies inside
+    brack, the minimum of a unimodal function lies beyond that edge, and
+    the search is repeated between the opposite edge and the end of brack.
+    With a good initial guess this needs far fewer evaluations than
+    searching all of brack.
+
+    Parameters
+    ----------
+    func : callable
+        Objective function to minimize, taking a single np.float64 argument and returning np.float64
+    brack : tuple
+        Bounds for optimization as (lower, upper) of np.float64.
+    x0 : np.float64
+        Initial guess.  If not finite, all of brack is searched.
+    width : np.float64
+        Half-width of the initial bracket.
+    method : str, default='golden'
+        'golden' for golden_section_search or 'brent' for brent_search.
+    tol : np.float64, optional
+        Tolerance for convergence. Default matches SciPy.
+    maxiter : int, optional
+        Maximum number of iterations. Default: 100.
+
+    Returns
+    -------
+    OptimizeResult
+        Optimization results as with golden_section_search, with nfev
+        counting the evaluations of both searches.
+    """
+    lower, upper = np.float64(brack[0]), np.float64(brack[1])
+    if not (np.isfinite(x0) and np.isfinite(width)):
+        return scalar_search(func, brack=(lower, upper), method=method, tol=tol, maxiter=maxiter)
+
+    xl = max(lower, x0 - width)
+    xr = min(upper, x0 + width)
+    if not xl < xr:
+        return scalar_search(func, brack=(lower, upper), method=method, tol=tol, maxiter=maxiter)
+
+    result = scalar_search(func, brack=(xl, xr), method=method, tol=tol, maxiter=maxiter)
+
+    # Widen the search if the minimum is at an edge of the narrow bracket
+    edge = 10 * tol * max(1.0, abs(result.x))
+    if xr < upper and xr - result.x <= edge:
+        retry = scalar_search(func, brack=(xl, upper), method=method, tol=tol, maxiter=maxiter)
+    elif xl > lower and result.x - xl <= edge:
+        retry = scalar_search(func, brack=(lower, xr), method=method, tol=tol, maxiter=maxiter)
+    elif not np.isfinite(result.fun):
+        retry = scalar_search(func, brack=(lower, upper), method=method, tol=tol, maxiter=maxiter)
+    else:
+        return result
+    retry.nfev += result.nfev
+    return retry
+
+
+def search_tolerance(tol, m: int) -> np.float64:
+    """
+    Convergence tolerance for a search over the memory parameter d.
+
+    Parameters
+    ----------
+    tol : float, 'se' or None
+        Tolerance.  None gives the default of golden_section_search, and
+        'se' gives 1% of the asymptotic standard error 1/(2 sqrt(m)) of the
+        local Whittle estimators, so that d is not resolved far beyond its
+        sampling uncertainty.
+    m : int
+        Number of frequencies
+
+    Returns
+    -------
+    np.float64
+        Tolerance to pass to the search
+    """
+    if tol is None:
+        return _epsilon
+    elif isinstance(tol, str):
+        if tol != 'se':
+            raise ValueError("tol must be a positive float, 'se' or None")
+        return np.float64(0.01 / (2 * np.sqrt(m)))
+    elif tol > 0:
+        return np.float64(tol)
+    else:
+        raise ValueError("tol must be a positive float, 'se' or None")
+
+
+def chebyshev_search(func: Callable[[np.ndarray], np.ndarray],
+                     brack: Tuple[np.float64, np.float64],
+                     n_nodes: int = 12,
+                     tol: Optional[np.float64] = _epsilon,
+                     maxiter: Optional[int] = 20) -> OptimizeResult:
+    """
+    Minimize 1D function through a Chebyshev interpolant.
+
+    Intended for smooth objectives that are costly to evaluate one point
+    at a time but cheaper at many points at once, such as the ELW
+    objective, whose fractional differences at several values of d share
+    batched FFTs.
+
+    Algorithm:
+    1. Evaluate the objective at n_nodes Chebyshev nodes in one call.
+    2. Minimize the interpolating polynomial over the whole bracket by
+       comparing its values at the real roots of its derivative and at the
+       ends of the bracket.
+    3. Polish the minimizer by secant steps on the derivative of the
+       objective, estimated by central differences of exact evaluations
+       and starting from the curvature of the interpolant, until a step is
+       smaller than tol.
+
+    If the objective is not finite at every node, the interpolant is not
+    convex at its minimum, or the polished point is no better than the
+    best node, the minimum is found by Brent's method instead.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized objective function, taking a 1-D array of trial points
+        and returning an array of objective values.
+    brack : tuple
+        Bounds for optimization as (lower, upper) of np.float64.
+    n_nodes : int, default=12
+        Number of Chebyshev nodes.
+    tol : np.float64, optional
+        Tolerance for convergence. Default matches SciPy.
+    maxiter : int, optional
+        Maximum number of polishing steps. Default: 20.
+
+    Returns
+    -------
+    OptimizeResult
+        Optimization results as with golden_section_search, plus an
+        error_bound attribute: an estimate of the largest difference
+        between the interpolant and the objective over the bracket, given
+        by the magnitude of its two highest-order Chebyshev coefficients
+        (inf if the interpolant could not be formed).
+    """
+    xl, xr = np.float64(brack[0]), np.float64(brack[1])
+    nfev = 0
+
+    def batch(x):
+        nonlocal nfev
+        x = np.asarray(x, dtype=np.float64)
+        nfev += x.size
+        return np.asarray(func(x), dtype=np.float64)
+
+    def exact_search(x0, width, error_bound):
+        result = bracketed_search(lambda x: batch(np.array([x]))[0], (xl, xr), x0, width,
+                                  method='brent', tol=tol)
+        result.nfev = nfev
+        result.error_bound = error_bound
+        return result
+
+    # Step 1: Interpolate the objective at the Chebyshev nodes
+    x_nodes = 0.5 * (xl + xr) + 0.5 * (xr - xl) * chebpts1(n_nodes)
+    f_nodes = batch(x_nodes)
+    best_node = int(np.argmin(f_nodes))
+    if not np.all(np.isfinite(f_nodes)):
+        return exact_search(x_nodes[best_node], np.inf, np.inf)
+    p = Chebyshev.fit(x_nodes, f_nodes, n_nodes - 1, domain=[xl, xr])
+    error_bound = np.sum(np.abs(p.coef[-2:]))
+
+    # Step 2: Minimize the interpolant
+    roots = p.deriv().roots()
+    roots = roots.real[np.abs(roots.imag) <= 1e-10 * (xr - xl)]
+    candidates = np.concatenate([roots[(roots > xl) & (roots < xr)], [xl, xr]])
+    x = candidates[np.argmin(p(candidates))]
+    curvature = p.deriv(2)(x)
+    if not curvature > 0:
+        return exact_search(x, (xr - xl) / n_nodes, error_bound)
+
+    # Step 3: Secant steps on central difference derivatives
+    # The step balances truncation error against rounding error in
+    # objectives computed by FFT, which are noisier than machine precision
+    h = np.sqrt(_epsilon) * max(1.0, abs(x))
+    x_prev = g_prev = None
+    success = False
+    nit = 0
+    while nit < maxiter:
+        nit += 1
+        f_left, f_right = batch(np.array([x - h, x + h]))
+        g = (f_right - f_left) / (2 * h)
+        if x_prev is not None and g != g_prev:
+            secant = (g - g_prev) / (x - x_prev)
+            if secant > 0:
+                curvature = secant
+        x_new = np.clip(x - g / curvature, xl, xr)
+        step = x_new - x
+        x_prev, g_prev, x = x, g, x_new
+        if abs(step) <= tol * max(1.0, abs(x)):
+            success = True
+            break
+    fun = batch(np.array([x]))[0]
+
+    # Guard against a polish that wandered off
+    if not fun <= f_nodes[best_node]:
+        return exact_search(x_nodes[best_node], (xr - xl) / n_nodes, error_bound)
+
+    if success:
+        message = f"Optimization terminated successfully; tolerance {tol} achieved"
+    else:
+        message = f"Maximum number of iterations ({maxiter}) exceeded"
+
+    result = OptimizeResult(
+        x=x,
+        fun=fun,
+        success=success,
+        message=message,
+        nfev=nfev,
+        nit=nit
+    )
+    result.error_bound = error_bound
+    return result
+
+
 def robust_golden_section_search(func: Callable[[np.float64], np.float64],
                                  brack: Optional[Tuple[np.float64, np.float64]] = None,
                                  n_grid: Optional[int] = 20,
                                  tol: Optional[np.float64] = _epsilon,
-                                 maxiter: Optional[int] = 100) -> OptimizeResult:
+                                 maxiter: Optional[int] = 100,
+                                 method: str = 'golden',
+                                 n_jobs: int = 1,
+                                 trace: bool = False) -> OptimizeResult:
     """
     Robust golden section search with grid-based safety check.
 
-    This function enhances golden_section_search by adding a coarse grid search
-    as a safety check to avoid local minima. If the grid search finds a better
-    minimum than the golden section search, re-optimization is performed in the
-    region around the grid minimum.
+    This function enhances golden_section_search by first locating the
+    global minimum on a coarse grid, which guards against local minima,
+    and then refining it by golden section search between the grid points
+    neighboring the grid minimum.
 
     Algorithm:
-    1. Run standard golden section search over full bounds.
-    2. Run coarse grid search as safety check.
-    3. If grid found better minimum, re-run golden section between
-       neighboring grid points.
+    1. Evaluate the objective on a coarse grid over the full bounds.
+    2. Run golden section search between the neighbors of the grid minimum.
+    3. Return the better of the golden section and grid minima.
+
+    Every evaluation is cached by d, so no point is evaluated twice.
 
     Parameters
     ----------
@@ -176,11 +580,23 @@ def robust_golden_section_search(func: Callable[[np.float64], np.float64],
         Tolerance for convergence. Default matches SciPy.
     maxiter : int, optional
         Maximum number of iterations. Default: 100.
+    method : str, default='golden'
+        Local search used in step 2: 'golden' for golden_section_search
+        or 'brent' for brent_search.
+    n_jobs : int, default=1
+        Number of threads evaluating the grid.  Useful for objectives that
+        release the GIL, such as the FFT-based ELW objective.  -1 uses all
+        available cores.
+    trace : bool, default=False
+        Record every evaluation in the trace attribute of the result.
 
     Returns
     -------
     OptimizeResult
-        Optimization results as with golden_section_search.
+        Optimization results as with golden_section_search.  nfev counts
+        distinct evaluations.  If trace=True, the result also has a trace
+        attribute, a dictionary of arrays 'x', 'fun' and 'elapsed' (seconds
+        since the start of the search) in order of evaluation.
     """
     # Default bounds
     if brack is None:
@@ -188,32 +604,559 @@ def robust_golden_section_search(func: Callable[[np.float64], np.float64],
     else:
         xl, xr = np.float64(brack[0]), np.float64(brack[1])
 
-    # Step 1: Standard golden section search
-    result_gs = golden_section_search(func, brack=(xl, xr), tol=tol, maxiter=maxiter)
-
-    # Step 2: Grid search as safety check
-    grid = np.linspace(xl, xr, n_grid)
-    grid_values = [func(d) for d in grid]
-    best_grid_idx = np.argmin(grid_values)
-    obj_grid_min = grid_values[best_grid_idx]
-    nfev = result_gs.nfev + n_grid
-
-    # Step 3: If grid found better minimum, re-run golden section search
-    if obj_grid_min < result_gs.fun:
-        # Re-optimize between neighboring grid points.
-        # Use previous and next grid points as bounds.
-        if best_grid_idx == 0:
-            local_bounds = (grid[0], grid[1])
-        elif best_grid_idx == n_grid - 1:
-            local_bounds = (grid[n_grid - 2], grid[n_grid - 1])
+    start = time.perf_counter()
+    cache = {}
+    records = []
+
+    def cached_func(x):
+        key = float(x)
+        if key not in cache:
+            value = func(x)
+            cache[key] = value
+            if trace:
+                records.append((key, value, time.perf_counter() - start))
+        return cache[key]
+
+    if n_grid < 2:
+        result = scalar_search(cached_func, brack=(xl, xr), method=method,
+                               tol=tol, maxiter=maxiter)
+    else:
+        # Step 1: Grid search over the full bounds
+        grid = np.linspace(xl, xr, n_grid)
+        n_threads = n_jobs if n_jobs > 0 else max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+        if n_threads > 1:
+            with ThreadPoolExecutor(max_workers=min(n_threads, n_grid)) as pool:
+                grid_values = list(pool.map(cached_func, grid))
         else:
-            local_bounds = (grid[best_grid_idx - 1], grid[best_grid_idx + 1])
+            grid_values = [cached_func(d) for d in grid]
+        best_grid_idx = int(np.argmin(grid_values))
+
+        # Step 2: Golden section search between neighboring grid points
+        lo = min(max(best_grid_idx - 1, 0), n_grid - 2)
+        hi = max(min(best_grid_idx + 1, n_grid - 1), 1)
+        result = scalar_search(cached_func, brack=(grid[lo], grid[hi]), method=method,
+                               tol=tol, maxiter=maxiter)
+
+        # Step 3: Keep the grid minimum if the local search did not improve on it
+        if grid_values[best_grid_idx] < result.fun:
+            result.x = grid[best_grid_idx]
+            result.fun = grid_values[best_grid_idx]
+
+    result.nfev = len(cache)
+    if trace:
+        x, fun, elapsed = zip(*records)
+        result.trace = {
+            'x': np.array(x),
+            'fun': np.array(fun),
+            'elapsed': np.array(elapsed),
+        }
+    return result
+
+
+def bounded_quasi_newton(fun_and_grad: Callable[[np.ndarray], Tuple[np.float64, np.ndarray]],
+                         x0: np.ndarray,
+                         bounds: Sequence[Tuple[float, float]],
+                         ftol: Optional[np.float64] = 1e-8,
+                         gtol: Optional[np.float64] = 1e-5,
+                         maxiter: Optional[int] = 1000) -> OptimizeResult:
+    """
+    Projected BFGS for minimizing a smooth function subject to box constraints.
+
+    A small replacement for SciPy's L-BFGS-B for low-dimensional problems
+    with an analytic gradient.  Variables at a bound whose gradient points
+    out of the feasible box are held fixed; the remaining free variables
+    take a quasi-Newton step that is projected back onto the box, with a
+    weak Wolfe line search along the projected path.  The inverse
+    Hessian approximation is updated by the BFGS formula whenever the
+    curvature condition holds.  This is the single-problem case of
+    vectorized_bounded_quasi_newton.
+
+    Parameters
+    ----------
+    fun_and_grad : callable
+        Function taking a parameter vector and returning the objective value
+        and its gradient.
+    x0 : np.ndarray
+        Starting point.  Projected onto the bounds if necessary.
+    bounds : sequence of tuple
+        (lower, upper) bounds for each parameter.
+    ftol : np.float64, optional
+        Stop when the relative reduction of the objective,
+        (f_k - f_{k+1}) / max(|f_k|, |f_{k+1}|, 1), falls below ftol.
+        Default: 1e-8.
+    gtol : np.float64, optional
+        Stop when the largest component of the projected gradient falls
+        below gtol.  Default: 1e-5.
+    maxiter : int, optional
+        Maximum number of iterations. Default: 1000.
 
-        result_retry = golden_section_search(func, brack=local_bounds,
-                                             tol=tol, maxiter=maxiter)
-        result_retry.nfev = nfev + result_retry.nfev
-        return result_retry
+    Returns
+    -------
+    OptimizeResult
+        Optimization results as with golden_section_search, with x and
+        the additional attribute jac (gradient at the solution) as arrays.
+    """
+    def fun_and_grad_rows(x: np.ndarray, index: np.ndarray):
+        f, g = fun_and_grad(x[0])
+        return np.array([f], dtype=np.float64), np.asarray(g, dtype=np.float64)[np.newaxis]
+
+    x0 = np.asarray(x0, dtype=np.float64)
+    batch = vectorized_bounded_quasi_newton(fun_and_grad_rows, x0[np.newaxis], bounds,
+                                            ftol=ftol, gtol=gtol, maxiter=maxiter)
+    result = OptimizeResult(
+        x=batch.x[0],
+        fun=np.float64(batch.fun[0]),
+        success=bool(batch.success[0]),
+        message=batch.message[0],
+        nfev=int(batch.nfev[0]),
+        nit=int(batch.nit[0])
+    )
+    result.jac = batch.jac[0]
+    return result
+
+
+# Termination messages of bounded_quasi_newton
+_QN_MESSAGES = [
+    "Maximum number of iterations ({maxiter}) exceeded",
+    "Objective is not finite at the current point",
+    "Optimization terminated successfully; projected gradient below gtol",
+    "Optimization terminated successfully; no further descent possible",
+    "Optimization terminated successfully; relative reduction of f below ftol",
+]
+
+
+def _matmul_small(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """Products of stacked small matrices, row by row the same for any stack size."""
+    return np.sum(A[..., :, :, np.newaxis] * B[..., np.newaxis, :, :], axis=-2)
+
+
+def vectorized_bounded_quasi_newton(fun_and_grad: Callable[[np.ndarray, np.ndarray],
+                                                           Tuple[np.ndarray, np.ndarray]],
+                                    x0: np.ndarray,
+                                    bounds: Sequence[Tuple[float, float]],
+                                    ftol: Optional[np.float64] = 1e-8,
+                                    gtol: Optional[np.float64] = 1e-5,
+                                    maxiter: Optional[int] = 1000) -> OptimizeResult:
+    """
+    Projected BFGS for many independent box-constrained problems in lockstep.
+
+    Runs the iterations of bounded_quasi_newton on every row of x0, with
+    one call of fun_and_grad per step of the line searches evaluating all
+    problems that need it at once.  Each problem keeps its own inverse
+    Hessian approximation, line search state and stopping rule, and
+    stops updating once it has terminated, so its result does not depend
+    on the other problems.
+
+    Parameters
+    ----------
+    fun_and_grad : callable
+        Vectorized function fun_and_grad(x, index), returning the objective
+        values (shape k) and gradients (k x p) of problems index (an
+        integer array of length k) at the parameter vectors x (k x p).
+    x0 : np.ndarray
+        Starting points, one row per problem.  Projected onto the bounds
+        if necessary.
+    bounds : sequence of tuple
+        (lower, upper) bounds for each parameter, shared by all problems.
+    ftol : np.float64, optional
+        Relative reduction of the objective below which a problem stops
+        (see bounded_quasi_newton).  Default: 1e-8.
+    gtol : np.float64, optional
+        Projected gradient tolerance.  Default: 1e-5.
+    maxiter : int, optional
+        Maximum number of iterations. Default: 1000.
+
+    Returns
+    -------
+    OptimizeResult
+        Optimization results with x (k x p), fun, success, nfev and nit as
+        arrays over the problems, message as an array of termination
+        messages, and the additional attribute jac (k x p).
+    """
+    lower = np.array([b[0] for b in bounds], dtype=np.float64)
+    upper = np.array([b[1] for b in bounds], dtype=np.float64)
+    x = np.clip(np.asarray(x0, dtype=np.float64), lower, upper)
+    k, p = x.shape
+    boxed = np.all(np.isfinite(lower)) and np.all(np.isfinite(upper))
+    index = np.arange(k)
+    eye = np.eye(p)
+
+    f, g = fun_and_grad(x, index)
+    f, g = np.array(f, dtype=np.float64), np.array(g, dtype=np.float64)
+    nfev = np.ones(k, dtype=int)
+    H = np.tile(eye, (k, 1, 1))
+    scaled = np.zeros(k, dtype=bool)
+
+    # Wolfe line search constants: sufficient decrease and curvature
+    c1, c2 = 1e-4, 0.9
+
+    status = np.zeros(k, dtype=int)
+    nit = np.zeros(k, dtype=int)
+    active = np.ones(k, dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        while True:
+            active &= nit < maxiter
+            stop = active & ~np.isfinite(f)
+            status[stop] = 1
+            active &= ~stop
+
+            # Projected gradient test
+            pg = x - np.clip(x - g, lower, upper)
+            stop = active & (np.max(np.abs(pg), axis=-1) <= gtol)
+            status[stop] = 2
+            active &= ~stop
+            if not np.any(active):
+                break
+            rows = np.flatnonzero(active)
+            nit[rows] += 1
+
+            # Quasi-Newton direction on the free variables
+            xr, fr, gr, Hr = x[rows], f[rows], g[rows], H[rows]
+            free = ~(((xr <= lower) & (gr > 0)) | ((xr >= upper) & (gr < 0)))
+            H_free = np.where(free[:, :, np.newaxis] & free[:, np.newaxis, :], Hr, 0.0)
+            direction = -np.sum(H_free * np.where(free, gr, 0.0)[:, np.newaxis, :], axis=-1)
+            restart = np.sum(gr * direction, axis=-1) >= 0
+            # Not a descent direction: restart from steepest descent
+            Hr[restart] = eye
+            scaled[rows[restart]] = False
+            direction[restart] = np.where(free[restart], -gr[restart], 0.0)
+
+            # Before the first update there is no curvature information.  As
+            # in L-BFGS-B, the first trial step is the projected gradient
+            # step when every variable is bounded on both sides and of unit
+            # length otherwise.
+            if boxed:
+                step = np.ones(len(rows))
+            else:
+                step = np.where(scaled[rows], 1.0,
+                                np.minimum(1.0, 1.0 / np.max(np.abs(direction), axis=-1)))
+
+            # Projected weak Wolfe line searches by bracketing, in lockstep
+            accepted = np.zeros(len(rows), dtype=bool)
+            x_acc, s_acc = np.empty_like(xr), np.empty_like(xr)
+            f_acc, g_acc = np.empty_like(fr), np.empty_like(gr)
+            t_lo, t_hi = np.zeros(len(rows)), np.full(len(rows), np.inf)
+            s_prev = np.full_like(xr, np.nan)
+            searching = np.ones(len(rows), dtype=bool)
+            for _ in range(60):
+                x_new = np.clip(xr + step[:, np.newaxis] * direction, lower, upper)
+                s = x_new - xr
+                decrease = np.sum(gr * s, axis=-1)
+                # No movement, or expanding further only runs along the bounds
+                searching &= np.any(s != 0, axis=-1) & ~np.all(s == s_prev, axis=-1)
+                if not np.any(searching):
+                    break
+
+                # Projection onto the bounds can destroy descent for long
+                # steps; such steps are shortened without evaluating f
+                f_new = np.full(len(rows), np.nan)
+                g_new = np.full_like(gr, np.nan)
+                evaluate = np.flatnonzero(searching & (decrease < 0))
+                if len(evaluate) > 0:
+                    f_eval, g_eval = fun_and_grad(x_new[evaluate], rows[evaluate])
+                    f_new[evaluate], g_new[evaluate] = f_eval, g_eval
+                    nfev[rows[evaluate]] += 1
+                sufficient = (decrease < 0) & np.isfinite(f_new) & (f_new <= fr + c1 * decrease)
+
+                shorten = searching & ~sufficient
+                t_hi = np.where(shorten, step, t_hi)
+                accept = searching & sufficient
+                accepted |= accept
+                x_acc[accept], s_acc[accept] = x_new[accept], s[accept]
+                f_acc[accept], g_acc[accept] = f_new[accept], g_new[accept]
+                curvature = accept & (np.sum(g_new * s, axis=-1) >= c2 * decrease)
+                searching &= ~curvature
+                expand = accept & ~curvature
+                t_lo = np.where(expand, step, t_lo)
+                s_prev[expand] = s[expand]
+
+                step = np.where(searching, np.where(np.isfinite(t_hi), 0.5 * (t_lo + t_hi),
+                                                    2.0 * t_lo), step)
+                searching &= ~(np.isfinite(t_hi)
+                               & (t_hi - t_lo <= 1e-16 * np.maximum(t_hi, 1.0)))
+                if not np.any(searching):
+                    break
+
+            status[rows[~accepted]] = 3
+            active[rows[~accepted]] = False
+            H[rows] = Hr
+            rows, s = rows[accepted], s_acc[accepted]
+            f_new, g_new = f_acc[accepted], g_acc[accepted]
+            f_old, g_old, Hr = f[rows], g[rows], H[rows]
+
+            # BFGS update of the inverse Hessian approximation
+            y = g_new - g_old
+            sy = np.sum(s * y, axis=-1)
+            norms = np.sqrt(np.sum(s * s, axis=-1)) * np.sqrt(np.sum(y * y, axis=-1))
+            update = sy > _epsilon * norms
+            first = update & ~scaled[rows]
+            Hr[first] = eye * (sy[first] / np.sum(y[first] * y[first], axis=-1))[:, None, None]
+            scaled[rows[first]] = True
+            rho = (1.0 / np.where(update, sy, 1.0))[:, None, None]
+            V = eye - rho * (s[:, :, np.newaxis] * y[:, np.newaxis, :])
+            H_new = (_matmul_small(_matmul_small(V, Hr), np.swapaxes(V, -1, -2))
+                     + rho * (s[:, :, np.newaxis] * s[:, np.newaxis, :]))
+            Hr[update] = H_new[update]
+            H[rows] = Hr
+
+            converged = (f_old - f_new) <= ftol * np.maximum(np.maximum(np.abs(f_old),
+                                                                        np.abs(f_new)), 1.0)
+            x[rows], f[rows], g[rows] = x_acc[accepted], f_new, g_new
+            status[rows[converged]] = 4
+            active[rows[converged]] = False
+
+    messages = np.array([_QN_MESSAGES[i].format(maxiter=maxiter) for i in status], dtype=object)
+    result = OptimizeResult(
+        x=x,
+        fun=f,
+        success=status >= 2,
+        message=messages,
+        nfev=nfev,
+        nit=nit
+    )
+    result.jac = g
+    return result
+
+
+def vectorized_golden_section_search(func: Callable[[np.ndarray], np.ndarray],
+                                     lower: np.ndarray,
+                                     upper: np.ndarray,
+                                     tol: Optional[np.float64] = _epsilon,
+                                     maxiter: Optional[int] = 100) -> OptimizeResult:
+    """
+    Golden section search for many independent 1D problems in lockstep.
+
+    Runs golden_section_search on each element of the bracket arrays, with
+    one call of func per iteration evaluating all problems at once.  Each
+    problem follows exactly the steps of golden_section_search and stops
+    updating once its own bracket has converged.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized objective function, taking an array of trial points with
+        the shape of the brackets and returning an array of the same shape.
+    lower : np.ndarray
+        Lower ends of the brackets.
+    upper : np.ndarray
+        Upper ends of the brackets.
+    tol : np.float64, optional
+        Tolerance for convergence. Default matches SciPy.
+    maxiter : int, optional
+        Maximum number of iterations. Default: 100.
+
+    Returns
+    -------
+    OptimizeResult
+        Optimization results as with golden_section_search, with x, fun,
+        success and nfev given as arrays of the shape of the brackets.
+    """
+    xl, xr = np.broadcast_arrays(np.asarray(lower, dtype=np.float64),
+                                 np.asarray(upper, dtype=np.float64))
+    xl, xr = xl.copy(), xr.copy()
+
+    # Golden ratio conjugate
+    gratio = np.float64(0.61803398874989)
+
+    # Initial function evaluations
+    xlower = xl + (xr - xl) * (1 - gratio)
+    xupper = xl + (xr - xl) * gratio
+    vlower = np.asarray(func(xlower), dtype=np.float64)
+    vupper = np.asarray(func(xupper), dtype=np.float64)
+    nfev = np.full(xl.shape, 2)
+    nit = np.zeros(xl.shape, dtype=int)
+
+    # Track best solution found
+    best_x = np.where(vlower < vupper, xlower, xupper)
+    best_fun = np.minimum(vlower, vupper)
+
+    active = np.ones(xl.shape, dtype=bool)
+    for _ in range(maxiter):
+        nit += active
+
+        # Check convergence with relative tolerance
+        mid_point = 0.5 * (xl + xr)
+        relative_size = (xr - xl) / np.maximum(1.0, np.abs(mid_point))
+        active &= ~(relative_size <= tol)
+        if not np.any(active):
+            break
+
+        # Golden section search step on the active problems
+        left = active & (vlower < vupper)
+        right = active & ~(vlower < vupper)
+
+        xr = np.where(left, xupper, xr)
+        xl = np.where(right, xlower, xl)
+        new_upper = np.where(left, xlower, xupper)
+        new_vupper = np.where(left, vlower, vupper)
+        new_lower = np.where(right, xupper, xlower)
+        new_vlower = np.where(right, vupper, vlower)
+        xlower = np.where(left, xl + (xr - xl) * (1 - gratio), new_lower)
+        xupper = np.where(right, xl + (xr - xl) * gratio, new_upper)
+
+        trial = np.where(left, xlower, xupper)
+        values = np.asarray(func(trial), dtype=np.float64)
+        vlower = np.where(left, values, new_vlower)
+        vupper = np.where(right, values, new_vupper)
+        nfev += active
+
+        # Update best solution tracking
+        improved = active & (vlower < best_fun)
+        best_x = np.where(improved, xlower, best_x)
+        best_fun = np.where(improved, vlower, best_fun)
+        improved = active & (vupper < best_fun)
+        best_x = np.where(improved, xupper, best_x)
+        best_fun = np.where(improved, vupper, best_fun)
+
+    success = nit < maxiter
+    if np.all(success):
+        message = f"Optimization terminated successfully; tolerance {tol} achieved"
     else:
-        # Golden section minimum stands
-        result_gs.nfev = nfev
-        return result_gs
+        message = f"Maximum number of iterations ({maxiter}) exceeded"
+
+    return OptimizeResult(
+        x=best_x,
+        fun=best_fun,
+        success=success,
+        message=message,
+        nfev=nfev,
+        nit=int(np.max(nit, initial=0))
+    )
+
+
+def vectorized_bracketed_search(func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                                brack: Tuple[np.float64, np.float64],
+                                x0: np.ndarray,
+                                width: np.ndarray,
+                                tol: Optional[np.float64] = _epsilon,
+                                maxiter: Optional[int] = 100) -> OptimizeResult:
+    """
+    Bracketed golden section search for many independent 1D problems in lockstep.
+
+    Runs bracketed_search with method='golden' on each element of x0 and
+    width.  The narrow searches advance together, and the problems whose
+    minimum lies on an inner edge of their narrow bracket are searched
+    again together over their widened brackets.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized objective function func(x, index), returning the
+        objective of problems index (an integer array) at the trial
+        points x (an array of the same length).
+    brack : tuple
+        Bounds for optimization as (lower, upper) of np.float64, shared by
+        all problems.
+    x0 : np.ndarray
+        Initial guesses (1-D).  All of brack is searched where not finite.
+    width : np.ndarray
+        Half-widths of the initial brackets.
+    tol : np.float64, optional
+        Tolerance for convergence. Default matches SciPy.
+    maxiter : int, optional
+        Maximum number of iterations. Default: 100.
+
+    Returns
+    -------
+    OptimizeResult
+        Optimization results as with vectorized_golden_section_search, with
+        nfev counting the evaluations of both searches.
+    """
+    lower, upper = np.float64(brack[0]), np.float64(brack[1])
+    x0, width = np.broadcast_arrays(np.asarray(x0, dtype=np.float64),
+                                    np.asarray(width, dtype=np.float64))
+    with np.errstate(invalid='ignore'):
+        xl = np.maximum(lower, x0 - width)
+        xr = np.minimum(upper, x0 + width)
+    narrow = np.isfinite(x0) & np.isfinite(width) & (xl < xr)
+    xl = np.where(narrow, xl, lower)
+    xr = np.where(narrow, xr, upper)
+
+    index = np.arange(len(xl))
+    result = vectorized_golden_section_search(lambda x: func(x, index), xl, xr,
+                                              tol=tol, maxiter=maxiter)
+
+    # Widen the searches whose minimum is at an edge of the narrow bracket
+    edge = 10 * tol * np.maximum(1.0, np.abs(result.x))
+    at_right = narrow & (xr < upper) & (xr - result.x <= edge)
+    at_left = narrow & ~at_right & (xl > lower) & (result.x - xl <= edge)
+    failed = narrow & ~at_right & ~at_left & ~np.isfinite(result.fun)
+    retry = np.flatnonzero(at_right | at_left | failed)
+    if len(retry) > 0:
+        second = vectorized_golden_section_search(lambda x: func(x, retry),
+                                                  np.where(at_right, xl, lower)[retry],
+                                                  np.where(at_left, xr, upper)[retry],
+                                                  tol=tol, maxiter=maxiter)
+        result.x[retry] = second.x
+        result.fun[retry] = second.fun
+        result.success[retry] = second.success
+        result.nfev[retry] += second.nfev
+        result.nit = max(result.nit, second.nit)
+        if not np.all(result.success):
+            result.message = f"Maximum number of iterations ({maxiter}) exceeded"
+    return result
+
+
+def vectorized_robust_golden_section_search(func: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                                            lower: np.ndarray,
+                                            upper: np.ndarray,
+                                            n_grid: Optional[int] = 20,
+                                            tol: Optional[np.float64] = _epsilon,
+                                            maxiter: Optional[int] = 100) -> OptimizeResult:
+    """
+    Robust golden section search for many independent 1D problems in lockstep.
+
+    Runs robust_golden_section_search on each element of the bracket arrays.
+    The grid is evaluated for all problems at once, one grid point per
+    call, and the golden section searches between the neighbors of each
+    grid minimum advance together via vectorized_golden_section_search.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized objective function func(x, index), returning the
+        objective of problems index (an integer array) at the trial
+        points x (an array of the same length).
+    lower : np.ndarray
+        Lower ends of the brackets (1-D).
+    upper : np.ndarray
+        Upper ends of the brackets (1-D).
+    n_grid : int, optional
+        Number of grid points for safety check. Default: 20.
+    tol : np.float64, optional
+        Tolerance for convergence. Default matches SciPy.
+    maxiter : int, optional
+        Maximum number of iterations. Default: 100.
+
+    Returns
+    -------
+    OptimizeResult
+        Optimization results as with vectorized_golden_section_search.
+    """
+    xl, xr = np.broadcast_arrays(np.asarray(lower, dtype=np.float64),
+                                 np.asarray(upper, dtype=np.float64))
+    index = np.arange(len(xl))
+
+    if n_grid < 2:
+        return vectorized_golden_section_search(lambda x: func(x, index), xl, xr,
+                                                tol=tol, maxiter=maxiter)
+
+    # Step 1: Grid search over the full bounds
+    grid = np.linspace(xl, xr, n_grid, axis=-1)
+    grid_values = np.column_stack([func(grid[:, j], index) for j in range(n_grid)])
+    best_grid_idx = np.argmin(grid_values, axis=-1)
+    obj_grid_min = grid_values[index, best_grid_idx]
+
+    # Step 2: Golden section search between neighboring grid points
+    lo = np.clip(best_grid_idx - 1, 0, n_grid - 2)
+    hi = np.clip(best_grid_idx + 1, 1, n_grid - 1)
+    result = vectorized_golden_section_search(lambda x: func(x, index),
+                                              grid[index, lo], grid[index, hi],
+                                              tol=tol, maxiter=maxiter)
+
+    # Step 3: Keep the grid minimum where the local search did not improve on it
+    grid_better = obj_grid_min < result.fun
+    result.x = np.where(grid_better, grid[index, best_grid_idx], result.x)
+    result.fun = np.where(grid_better, obj_grid_min, result.fun)
+    result.nfev = result.nfev + n_grid
+    return result
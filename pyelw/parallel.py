@@ -0,0 +1,321 @@
+import contextlib
+import copy
+import os
+import shutil
+import tempfile
+import threading
+import time
+import numpy as np
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+
+# joblib is imported only when work is actually dispatched to workers,
+# which keeps `import pyelw` fast for serial use
+if TYPE_CHECKING:
+    from joblib import Parallel
+
+# Stack of active worker pools, one per thread
+_local = threading.local()
+
+
+def _pool_stack() -> list:
+    if not hasattr(_local, 'pools'):
+        _local.pools = []
+    return _local.pools
+
+
+def get_active_pool() -> Optional["Parallel"]:
+    """
+    Return the worker pool of the innermost active parallel_backend().
+
+    Returns
+    -------
+    joblib.Parallel or None
+        The active pool, or None outside of a parallel_backend() block.
+    """
+    stack = _pool_stack()
+    return stack[-1] if stack else None
+
+
+def effective_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Number of workers joblib would use for n_jobs.
+
+    Serial runs (n_jobs=1) are answered without importing joblib.
+    """
+    if n_jobs == 1:
+        return 1
+    from joblib import effective_n_jobs as joblib_effective_n_jobs
+    return joblib_effective_n_jobs(n_jobs)
+
+
+def _warm_worker(n: Optional[int] = None) -> int:
+    """
+    Import the estimators and exercise their numerical kernels in a worker.
+
+    Parameters
+    ----------
+    n : int, optional
+        Sample size to prepare FFTs for.  NumPy caches FFT twiddle factors
+        by transform length, so running one transform of each length the
+        estimators will use avoids paying that cost inside the first task.
+
+    Returns
+    -------
+    int
+        Process id of the worker.
+    """
+    from . import lw, elw, twostep, lw_bootstrap_m  # noqa: F401
+
+    if n is not None and n > 1:
+        x = np.zeros(n)
+        np.fft.fft(x)
+        np2 = 1 << (2*n - 1).bit_length()
+        np.fft.irfft(np.fft.rfft(x, n=np2), n=np2)
+    return os.getpid()
+
+
+@contextlib.contextmanager
+def parallel_backend(n_jobs: int = -1,
+                     backend: str = 'loky',
+                     n: Optional[int] = None,
+                     **kwargs):
+    """
+    Keep a warm pool of workers alive for bootstrap bandwidth searches.
+
+    Within the block, every LWBootstrapM search, including those started by
+    LW, ELW and TwoStepELW with m='auto', dispatches its work to this pool
+    instead of starting its own.  Workers are started and warmed up once,
+    so fitting many series in a loop pays the process startup and import
+    cost only once.  The pool takes precedence over the n_jobs arguments
+    of the estimators.
+
+    Parameters
+    ----------
+    n_jobs : int, default=-1
+        Number of workers.  -1 uses all available cores.
+    backend : str, default='loky'
+        joblib backend ('loky', 'multiprocessing' or 'threading').
+    n : int, optional
+        Typical sample size.  If provided, workers precompute FFTs of the
+        lengths used by the estimators for series of this length.
+    **kwargs
+        Additional keyword arguments passed to joblib.Parallel.
+
+    Yields
+    ------
+    joblib.Parallel
+        The active worker pool.
+    """
+    from joblib import Parallel, delayed
+
+    with Parallel(n_jobs=n_jobs, backend=backend, **kwargs) as pool:
+        n_workers = effective_n_jobs(n_jobs)
+        pool(delayed(_warm_worker)(n) for _ in range(n_workers))
+
+        stack = _pool_stack()
+        stack.append(pool)
+        try:
+            yield pool
+        finally:
+            stack.pop()
+
+
+# Fitted attributes collected for each series, by results table column
+_RESULT_FIELDS = {
+    'n': 'n_',
+    'm': 'm_',
+    'd_hat': 'd_hat_',
+    'se': 'se_',
+    'ase': 'ase_',
+    'objective': 'objective_',
+    'nfev': 'nfev_',
+}
+
+
+def _fit_one(estimator, x: np.ndarray, fit_params: Dict[str, Any]) -> Dict[str, Any]:
+    """Fit a copy of estimator to one series and collect its results."""
+    start = time.perf_counter()
+    est = copy.deepcopy(estimator).fit(np.array(x), **fit_params)
+    result = {key: getattr(est, attr, np.nan) for key, attr in _RESULT_FIELDS.items()}
+    if np.isnan(result['m']):
+        # Bandwidth selectors store their bandwidth as optimal_m_
+        result['m'] = getattr(est, 'optimal_m_', np.nan)
+    result['time'] = time.perf_counter() - start
+    return result
+
+
+def _indexed_fit(i: int, estimator, x: np.ndarray,
+                 fit_params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    return i, _fit_one(estimator, x, fit_params)
+
+
+def _trim_missing(x: np.ndarray, label) -> np.ndarray:
+    """Drop leading and trailing missing values of a series, rejecting gaps."""
+    finite = np.isfinite(x)
+    if not finite.any():
+        raise ValueError(f"Series {label} has no finite values")
+    first = np.argmax(finite)
+    last = len(x) - np.argmax(finite[::-1])
+    if not finite[first:last].all():
+        raise ValueError(f"Series {label} has missing values between its first "
+                         "and last observations")
+    return x[first:last]
+
+
+def _as_series_list(series) -> Tuple[list, Optional[list]]:
+    """
+    Split a collection of series into a list of arrays and their names.
+
+    Leading and trailing NaN, which pad the shorter series of a ragged
+    panel such as a DataFrame, are dropped.
+    """
+    if hasattr(series, 'items'):
+        names, values = zip(*series.items()) if len(series) else ((), ())
+        names = list(names)
+    else:
+        names, values = None, series
+    arrays = []
+    for i, x in enumerate(values):
+        label = repr(names[i]) if names is not None else i
+        arrays.append(_trim_missing(np.asarray(x, dtype=np.float64).ravel(), label))
+    return arrays, names
+
+
+def imap_fit(estimator,
+             series,
+             n_jobs: int = -1,
+             backend: str = 'loky',
+             fit_params: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Fit an estimator to each series of a collection, yielding results as they finish.
+
+    The series are copied once into a single buffer, which for process
+    backends is a temporary memory-mapped file, so workers read their
+    series from shared memory instead of receiving a pickled copy with
+    every task.  Tasks are submitted longest series first, so that the
+    slowest fits do not start last and leave the other workers idle.
+
+    Parameters
+    ----------
+    estimator : object
+        Any pyelw estimator, e.g. LW(), ELW(taper='hc') or LWLFC().  Each
+        series is fitted with its own copy.
+    series : sequence or mapping of array_like
+        Time series, possibly of different lengths.  If a mapping (such as
+        a dict or a pandas DataFrame), its keys are used as series names.
+        Leading and trailing NaN are dropped, so the columns of a ragged
+        panel can be passed directly; missing values inside a series raise
+        a ValueError.
+    n_jobs : int, default=-1
+        Number of workers.  -1 uses all available cores, 1 fits the series
+        serially in this process without importing joblib.  If the fits
+        themselves run in parallel (an n_jobs entry in fit_params, or the
+        n_jobs attribute of LWBootstrapM), the number of workers is divided
+        by their worker count to avoid oversubscription.
+    backend : str, default='loky'
+        joblib backend ('loky', 'multiprocessing' or 'threading').
+    fit_params : dict, optional
+        Keyword arguments passed to estimator.fit(), e.g. {'m': 'plugin'}.
+
+    Yields
+    ------
+    tuple of (int, dict)
+        Position of the series in the collection and its results: 'n',
+        'm', 'd_hat', 'se', 'ase', 'objective', 'nfev' (NaN when the
+        estimator does not report a value) and 'time', the fit time in
+        seconds.  Results arrive in order of completion.
+    """
+    fit_params = {} if fit_params is None else dict(fit_params)
+    arrays, _ = _as_series_list(series)
+    if not arrays:
+        return
+
+    # Respect parallelism inside each fit
+    inner_jobs = effective_n_jobs(fit_params.get('n_jobs', getattr(estimator, 'n_jobs', 1)))
+    n_workers = max(1, effective_n_jobs(n_jobs) // inner_jobs)
+
+    if n_workers == 1:
+        for i, x in enumerate(arrays):
+            yield i, _fit_one(estimator, x, fit_params)
+        return
+
+    from joblib import Parallel, delayed
+
+    lengths = np.array([len(x) for x in arrays])
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    order = np.argsort(-lengths, kind='stable')
+
+    temp_folder = None
+    try:
+        if backend == 'threading':
+            data = np.concatenate(arrays)
+        else:
+            # Memory-mapped slices are pickled as references to the file
+            temp_folder = tempfile.mkdtemp(prefix='pyelw_')
+            path = os.path.join(temp_folder, 'series.npy')
+            data = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64,
+                                             shape=(int(offsets[-1]),))
+            for i, x in enumerate(arrays):
+                data[offsets[i]:offsets[i+1]] = x
+            data.flush()
+            data = np.load(path, mmap_mode='r')
+        del arrays
+
+        pool = Parallel(n_jobs=n_workers, backend=backend,
+                        return_as='generator_unordered')
+        tasks = (delayed(_indexed_fit)(int(i), estimator, data[offsets[i]:offsets[i+1]],
+                                       fit_params)
+                 for i in order)
+        for i, result in pool(tasks):
+            yield i, result
+    finally:
+        if temp_folder is not None:
+            shutil.rmtree(temp_folder, ignore_errors=True)
+
+
+def fit_collection(estimator,
+                   series,
+                   n_jobs: int = -1,
+                   backend: str = 'loky',
+                   fit_params: Optional[Dict[str, Any]] = None) -> Dict[str, np.ndarray]:
+    """
+    Fit an estimator to each series of a collection in parallel.
+
+    Runs imap_fit and gathers its results into a table with one entry per
+    series, in the order of the collection.  Unlike the fit_many methods
+    of the estimators, the series may have different lengths and any
+    bandwidth choice, including m='auto', is allowed.
+
+    Parameters
+    ----------
+    estimator : object
+        Any pyelw estimator.  Each series is fitted with its own copy.
+    series : sequence or mapping of array_like
+        Time series, possibly of different lengths.  If a mapping, its
+        keys are used as series names.  Leading and trailing NaN are
+        dropped (see imap_fit).
+    n_jobs : int, default=-1
+        Number of workers (see imap_fit).
+    backend : str, default='loky'
+        joblib backend ('loky', 'multiprocessing' or 'threading').
+    fit_params : dict, optional
+        Keyword arguments passed to estimator.fit().
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Dictionary of arrays with entries 'n', 'm', 'd_hat', 'se', 'ase',
+        'objective', 'nfev' and 'time', plus 'name' if series is a mapping.
+    """
+    arrays, names = _as_series_list(series)
+    results = [None] * len(arrays)
+    for i, result in imap_fit(estimator, arrays, n_jobs=n_jobs, backend=backend,
+                              fit_params=fit_params):
+        results[i] = result
+
+    table = {}
+    if names is not None:
+        table['name'] = np.array(names, dtype=object)
+    for key in list(_RESULT_FIELDS) + ['time']:
+        table[key] = np.array([r[key] for r in results])
+    return table
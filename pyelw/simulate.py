@@ -1,73 +1,896 @@
+import collections
+import functools
+import math
+import threading
 import numpy as np
-from typing import Optional
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
 
 from .fracdiff import fracdiff
 
+# Largest number of complex FFT coefficients held at once by arfima_batch
+_BATCH_SIZE = 1 << 22
 
-def arfima(n: int, d: float, phi: float = 0.0, sigma: float = 1.0,
-           seed: Optional[int] = None, burnin: int = 0):
+# Largest total size in bytes of the arrays kept by each simulation cache
+_CACHE_BYTES = 1 << 26
+
+# Sources of random numbers accepted by the simulators
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+
+def _array_cache(max_bytes: int):
+    """
+    Least recently used cache of array results, bounded by their total size.
+
+    Unlike functools.lru_cache, which bounds the number of entries, this
+    never keeps more than max_bytes of arrays alive, and results larger
+    than max_bytes are returned without being cached, so that very long
+    simulations do not leave their kernels in memory.
+    """
+    def decorator(func):
+        cache = collections.OrderedDict()
+        lock = threading.Lock()
+        total = 0
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            nonlocal total
+            with lock:
+                if args in cache:
+                    cache.move_to_end(args)
+                    return cache[args]
+            result = func(*args)
+            if result.nbytes <= max_bytes:
+                with lock:
+                    if args not in cache:
+                        cache[args] = result
+                        total += result.nbytes
+                        while total > max_bytes:
+                            total -= cache.popitem(last=False)[1].nbytes
+            return result
+
+        def cache_clear():
+            nonlocal total
+            with lock:
+                cache.clear()
+                total = 0
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_bytes = lambda: total
+        return wrapper
+    return decorator
+
+
+def _lag_polynomials(phi, theta) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """AR and MA coefficients as tuples, without trailing zeros."""
+    ar, ma = (tuple(float(c) for c in np.atleast_1d(np.asarray(coef, dtype=np.float64)))
+              for coef in (phi, theta))
+    while ar and abs(ar[-1]) < 1e-13:
+        ar = ar[:-1]
+    while ma and abs(ma[-1]) < 1e-13:
+        ma = ma[:-1]
+    return ar, ma
+
+
+def _arma_impulse_response(n: int, ar: Tuple[float, ...], ma: Tuple[float, ...]) -> np.ndarray:
+    """
+    First n coefficients psi_j of theta(L) / phi(L).
+
+    Uses the recursion psi_j = theta_j + sum_i phi_i psi_{j-i}, stopped
+    once the last p coefficients are negligible, as they soon are for a
+    stationary AR polynomial.
+    """
+    p, q = len(ar), len(ma)
+    psi = np.zeros(n)
+    ar_rev = np.array(ar[::-1])
+    scale = 0.0
+    for j in range(n):
+        value = 1.0 if j == 0 else (ma[j-1] if j <= q else 0.0)
+        if p > 0 and j > 0:
+            lags = min(p, j)
+            value += ar_rev[p-lags:] @ psi[j-lags:j]
+        psi[j] = value
+        scale = max(scale, abs(value))
+        if j > q and (p == 0 or (j >= p and
+                                 np.max(np.abs(psi[j-p+1:j+1])) < 1e-17 * scale)):
+            break
+    return psi
+
+
+@_array_cache(_CACHE_BYTES)
+def _arfima_kernel_fft(n: int, d: float, ar: Tuple[float, ...],
+                       ma: Tuple[float, ...] = ()) -> np.ndarray:
+    """
+    FFT of _arfima_kernel, zero padded for linear convolution of length n.
+
+    Cached up to _CACHE_BYTES, so that repeated simulations of the same
+    process compute the impulse response only once.  The result is
+    read-only.
+    """
+    np2 = 1 << (2*n - 1).bit_length()
+    kernel_fft = np.fft.rfft(_arfima_kernel(n, d, ar, ma), n=np2)
+    kernel_fft.flags.writeable = False
+    return kernel_fft
+
+
+def _arfima_kernel(n: int, d: float, ar: Tuple[float, ...],
+                   ma: Tuple[float, ...] = ()) -> np.ndarray:
+    r"""
+    First n coefficients of the impulse response of theta(L) phi(L)^{-1} (1-L)^{-d}.
+
+    Parameters
+    ----------
+    n : int
+        Number of coefficients
+    d : float
+        Fractional differencing parameter
+    ar : tuple of float
+        AR coefficients phi_1, ..., phi_p of phi(L) = 1 - phi_1 L - ... - phi_p L^p.
+        An AR(1) coefficient must satisfy |phi_1| <= 1, and longer AR
+        polynomials must be stationary.
+    ma : tuple of float, optional
+        MA coefficients theta_1, ..., theta_q of theta(L) = 1 + theta_1 L + ... + theta_q L^q
+
+    Returns
+    -------
+    np.ndarray
+        Filter coefficients
+    """
+    # (1-L)^{-d}, as in fracdiff with parameter -d
+    b = np.ones(n)
+    if n > 1:
+        k = np.arange(1, n, dtype=np.float64)
+        b[1:] = np.cumprod((k + d - 1) / k)
+    if not ar and not ma:
+        return b
+
+    # theta(L) / phi(L)
+    if len(ar) == 1 and not ma:
+        a = ar[0] ** np.arange(n, dtype=np.float64)
+    else:
+        a = _arma_impulse_response(n, ar, ma)
+    if abs(d) < 1e-13:
+        return a
+
+    np2 = 1 << (2*n - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(a, n=np2) * np.fft.rfft(b, n=np2), n=np2)[:n]
+
+
+def _arfima_filter(e: np.ndarray, d: float, ar: Tuple[float, ...],
+                   ma: Tuple[float, ...] = ()) -> np.ndarray:
     r"""
-    Simulate ARFIMA(1,d,0) process: (1 - \phi L) (1-L)^d X_t = \epsilon_t
+    Apply theta(L) phi(L)^{-1} (1-L)^{-d} to each row of e, with zero presample values.
+
+    The filters are combined into a single impulse response and applied
+    to all rows at once with batched FFTs.  Explosive AR(1) components,
+    whose impulse response would swamp the FFT in rounding error, are
+    generated recursively for all rows at once and then fractionally
+    integrated.
+
+    Parameters
+    ----------
+    e : np.ndarray
+        2-D array of innovations, one series per row.  For an AR(1)
+        component, the first column holds its initial values.
+    d : float
+        Fractional differencing parameter
+    ar : tuple of float
+        AR coefficients (see _arfima_kernel)
+    ma : tuple of float, optional
+        MA coefficients
+
+    Returns
+    -------
+    np.ndarray
+        Filtered series (same shape as e)
+    """
+    n = e.shape[-1]
+
+    if len(ar) == 1 and abs(ar[0]) > 1:
+        phi = ar[0]
+        v = e.copy()
+        for j, theta in enumerate(ma, start=1):
+            v[:, j:] += theta * e[:, :-j]
+        u = np.empty_like(v)
+        u[:, 0] = v[:, 0]
+        for t in range(1, n):
+            u[:, t] = phi * u[:, t-1] + v[:, t]
+        return u if abs(d) < 1e-13 else fracdiff(u, -d)
+
+    if not ar and not ma and abs(d) < 1e-13:
+        return e
+
+    kernel_fft = _arfima_kernel_fft(n, float(d), ar, ma)
+    np2 = 2 * (len(kernel_fft) - 1)
+    x = np.empty_like(e)
+    block = max(1, _BATCH_SIZE // len(kernel_fft))
+    for start in range(0, e.shape[0], block):
+        rows = slice(start, start + block)
+        x[rows] = np.fft.irfft(np.fft.rfft(e[rows], n=np2) * kernel_fft, n=np2)[:, :n]
+    return x
+
+
+def replication_seeds(seed: Union[None, int, np.random.SeedSequence],
+                      R: int,
+                      start: int = 0) -> List[np.random.SeedSequence]:
+    """
+    Independent seed sequences for replications start, ..., start + R - 1.
+
+    Replication r gets child r of the seed sequence, as from
+    np.random.SeedSequence(seed).spawn(), but computed directly from r.
+    The seeds of a replication therefore do not depend on how the
+    replications are split into chunks or among workers, and their
+    streams are statistically independent.
+
+    Parameters
+    ----------
+    seed : int, SeedSequence or None
+        Root seed.  None draws fresh entropy from the operating system;
+        keep root.entropy of a SeedSequence to reproduce such a run.
+    R : int
+        Number of replications
+    start : int, default=0
+        Index of the first replication
+
+    Returns
+    -------
+    List[np.random.SeedSequence]
+        One seed sequence per replication, which may be passed as the seed
+        of arfima or, as a list, of arfima_batch.
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return [np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (start + r,),
+                                   pool_size=root.pool_size)
+            for r in range(R)]
 
-    Algorithm:
+
+def _draw(R: int, seed, draw):
+    """
+    Random draws for R replications from the streams described by seed.
+
+    Calls draw(rng, size) for an array of draws for size replications,
+    either once for the whole batch or once per replication (with size=1)
+    if seed gives each replication its own stream (see arfima_batch).
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        seed = replication_seeds(seed, R)
+    if isinstance(seed, (list, tuple)):
+        # One stream per replication
+        if len(seed) != R:
+            raise ValueError("seed must have one entry per replication")
+        return np.concatenate([draw(np.random.default_rng(seed_r), 1) for seed_r in seed])
+
+    # One stream for the whole batch
+    if isinstance(seed, np.random.Generator):
+        rng = seed
+    else:
+        if seed is not None:
+            np.random.seed(seed)
+        rng = np.random
+    return draw(rng, R)
+
+
+def _draw_innovations(R: int, n_total: int, ar: Tuple[float, ...], ma: Tuple[float, ...],
+                      sigma: float, seed) -> np.ndarray:
+    """
+    Innovations for arfima_batch, with the stationary initial values of
+    a pure AR(1) component in the first column.
+    """
+    stationary = len(ar) == 1 and not ma and abs(ar[0]) < 1
+
+    def draw(rng, size):
+        e = rng.normal(0, sigma, (size, n_total))
+        if stationary:
+            e[:, 0] = rng.normal(0, sigma / np.sqrt(1 - ar[0]**2), size)
+        return e
+
+    return _draw(R, seed, draw)
+
+
+def _antithetic(e: np.ndarray, sigma: float) -> np.ndarray:
+    """
+    Antithetic counterparts of rows of iid N(0, sigma^2) innovations.
+
+    Keeps the phase of each Fourier coefficient and maps its squared
+    modulus, an exponential variable, through the uniform u -> 1 - u.
+    The result is again Gaussian white noise, but its periodogram is
+    negatively correlated with that of e, ordinate by ordinate, which
+    sign flips (to which periodogram-based estimators are invariant)
+    cannot achieve.  The coefficients at frequency zero and, for even
+    lengths, pi are kept.
+    """
+    L = e.shape[-1]
+    if L < 3:
+        return -e
+    z = np.fft.rfft(e, axis=-1)
+    interior = slice(1, (L + 1) // 2)
+    w = np.maximum(np.abs(z[:, interior])**2 / (sigma**2 * L), 1e-300)
+    z[:, interior] *= np.sqrt(-np.log(-np.expm1(-w)) / w)
+    return np.fft.irfft(z, n=L, axis=-1)
+
+
+def arfima(n: int, d: float, phi: Union[float, Sequence[float]] = 0.0, sigma: float = 1.0,
+           seed: SeedLike = None, burnin: int = 0,
+           theta: Union[float, Sequence[float]] = 0.0):
+    r"""
+    Simulate ARFIMA(p,d,q) process: \phi(L) (1-L)^d X_t = \theta(L) \epsilon_t
+
+    Algorithm for the ARFIMA(1,d,0) process (1 - \phi L) (1-L)^d X_t = \epsilon_t:
     1. Generate AR(1) process:
        (1 - \phi L) u_t = \epsilon_t  =>  u_t = \phi u_{t-1} + \epsilon_t
     2. Apply fractional filter: X_t = (1-L)^(-d) u_t
     3. Discard burn-in observations
 
+    Steps 1 and 2 are carried out together as one FFT convolution with
+    the impulse response of (1 - \phi L)^{-1} (1-L)^{-d}.
+
+    Sequences of AR and MA coefficients give the general ARFIMA(p,d,q)
+    process phi(L) (1-L)^d X_t = theta(L) epsilon_t, with
+    phi(L) = 1 - phi_1 L - ... - phi_p L^p and theta(L) = 1 + theta_1 L +
+    ... + theta_q L^q.  Only a pure AR(1) component is started from its
+    stationary distribution; otherwise presample values are zero, and a
+    burn-in should be used.
+
     Parameters
     ----------
     n : int
         Sample size (final output length)
     d : float
         Fractional differencing parameter
-    phi : float, default=0.0
-        AR(1) coefficient
+    phi : float or sequence of float, default=0.0
+        AR(1) coefficient, or AR coefficients phi_1, ..., phi_p of a
+        stationary AR polynomial
     sigma : float, default=1.0
         Innovation standard deviation
-    seed : int, optional
-        Random seed for reproducibility
+    seed : int, SeedSequence or Generator, optional
+        Source of random numbers.  An int seeds the global legacy random
+        state with np.random.seed(seed) and None draws from it as it is;
+        neither is safe when simulating in concurrent threads.  A
+        SeedSequence (see replication_seeds) or Generator draws from its
+        own stream, which is thread safe when each thread has its own.
     burnin : int, default=0
         Number of burn-in observations to discard
+    theta : float or sequence of float, default=0.0
+        MA coefficients theta_1, ..., theta_q
 
     Returns
     -------
     np.ndarray
-        ARFIMA(1,d,0) process of length n
+        ARFIMA(p,d,q) process of length n
     """
-    if seed is not None:
-        np.random.seed(seed)
+    if isinstance(seed, np.random.SeedSequence):
+        # A single replication drawn from this seed sequence itself
+        seed = [seed]
+    return arfima_batch(1, n, d, phi=phi, sigma=sigma, seed=seed, burnin=burnin,
+                        theta=theta)[0]
+
+
+def arfima_batch(R: int, n: int, d: float, phi: Union[float, Sequence[float]] = 0.0,
+                 sigma: float = 1.0,
+                 seed: Union[SeedLike, Sequence[SeedLike]] = None,
+                 burnin: int = 0,
+                 theta: Union[float, Sequence[float]] = 0.0,
+                 antithetic: bool = False,
+                 return_innovations: bool = False
+                 ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    r"""
+    Simulate R independent replications of an ARFIMA(p,d,q) process.
+
+    Generates the same process as arfima, for all replications at once:
+    the innovations are drawn as one R x (n + burnin) array and filtered
+    with batched FFTs by a single impulse response, computed once, so the
+    cost per replication is a small fraction of a call to arfima.
+
+    Parameters
+    ----------
+    R : int
+        Number of replications
+    n : int
+        Sample size (final output length)
+    d : float
+        Fractional differencing parameter
+    phi : float or sequence of float, default=0.0
+        AR coefficients (see arfima)
+    sigma : float, default=1.0
+        Innovation standard deviation
+    seed : int, SeedSequence, Generator or sequence, optional
+        Source of random numbers.  An int, Generator or None draws all
+        replications from one stream, as in arfima.  A SeedSequence gives
+        each replication r its own stream, from child r of the sequence
+        (see replication_seeds), and a sequence of R seeds gives one
+        stream per replication explicitly.  With per-replication streams,
+        replication r is the same whether simulated alone, as
+        arfima(..., seed=replication_seeds(seed, R)[r]), or in any chunk
+        of a batch, so results do not depend on how the work is divided
+        among workers.
+    burnin : int, default=0
+        Number of burn-in observations to discard from each replication
+    theta : float or sequence of float, default=0.0
+        MA coefficients theta_1, ..., theta_q
+    antithetic : bool, default=False
+        Replace the innovations of each odd replication 2j + 1 by the
+        antithetic counterparts of those of replication 2j, which have
+        the same distribution but a negatively correlated periodogram,
+        in the burn-in and in the sample separately.  Estimates of d from
+        the two replications of a pair are then negatively correlated,
+        which reduces the variance of Monte Carlo averages over pairs.
+    return_innovations : bool, default=False
+        Also return the innovations of the last n periods, divided by
+        sigma, which are iid standard normal.  Their periodogram gives
+        control variates with known mean (see pyelw.montecarlo).
+
+    Returns
+    -------
+    np.ndarray or tuple of np.ndarray
+        R x n array with one replication per row, and the R x n array of
+        standardized innovations if return_innovations is true
+    """
+    n_total = n + burnin
+    ar, ma = _lag_polynomials(phi, theta)
+
+    # Innovations, with the stationary initial values of an AR(1)
+    # component in the first column
+    e = _draw_innovations(R, n_total, ar, ma, sigma, seed)
+    stationary = len(ar) == 1 and not ma and abs(ar[0]) < 1
+
+    if antithetic and R > 1:
+        pairs = R // 2
+        start = 1 if stationary else 0
+        if stationary:
+            e[1:2*pairs:2, 0] = -e[0:2*pairs:2, 0]
+        for cols in (slice(start, max(start, burnin)), slice(max(start, burnin), n_total)):
+            if cols.stop > cols.start:
+                e[1:2*pairs:2, cols] = _antithetic(e[0:2*pairs:2, cols], sigma)
+
+    x = _arfima_filter(e, d, ar, ma)
+
+    # Discard burn-in
+    if not return_innovations:
+        return x[:, burnin:]
+    innovations = e[:, burnin:] / sigma
+    if stationary and burnin == 0:
+        innovations[:, 0] *= np.sqrt(1 - ar[0]**2)
+    return x[:, burnin:], innovations
+
+
+@_array_cache(_CACHE_BYTES)
+def _stream_kernel_fft(memory: int, nfft: int, d: float, ar: Tuple[float, ...],
+                       ma: Tuple[float, ...]) -> np.ndarray:
+    """FFT of the impulse response truncated to memory lags, zero padded to nfft (read-only)."""
+    kernel_fft = np.fft.rfft(_arfima_kernel(memory, d, ar, ma), n=nfft)
+    kernel_fft.flags.writeable = False
+    return kernel_fft
+
+
+def arfima_stream(n: int, d: float, phi: Union[float, Sequence[float]] = 0.0,
+                  sigma: float = 1.0, seed: SeedLike = None, burnin: int = 0,
+                  theta: Union[float, Sequence[float]] = 0.0,
+                  chunk_size: int = 1 << 20,
+                  memory: Optional[int] = None) -> Iterator[np.ndarray]:
+    r"""
+    Simulate a long ARFIMA(p,d,q) path in chunks with bounded memory.
+
+    Generates the process of arfima chunk by chunk.  The innovations are
+    drawn one chunk at a time and filtered by overlap-save convolution
+    with the impulse response truncated to `memory` lags: only the last
+    memory - 1 innovations are carried from one chunk to the next, so
+    the memory used is proportional to chunk_size + memory, not n.
+
+    If memory >= n + burnin, no lag is truncated and the path is the one
+    arfima would generate from the same stream of random numbers, up to
+    rounding (except that the stationary initial value of an AR(1)
+    component is drawn before, not after, the innovations).  Otherwise
+    each observation depends on the last `memory` innovations only, which
+    for d > 0 slightly reduces the variance of the low frequencies.
+
+    Explosive or unit root AR(1) components are not supported, since such
+    paths overflow long before the lengths this function is meant for;
+    use arfima or arfima_batch for them.
+
+    Parameters
+    ----------
+    n : int
+        Sample size (total length of the chunks)
+    d : float
+        Fractional differencing parameter
+    phi : float or sequence of float, default=0.0
+        AR coefficients (see arfima)
+    sigma : float, default=1.0
+        Innovation standard deviation
+    seed : int, SeedSequence or Generator, optional
+        Source of random numbers (see arfima)
+    burnin : int, default=0
+        Number of burn-in observations to generate and discard
+    theta : float or sequence of float, default=0.0
+        MA coefficients theta_1, ..., theta_q
+    chunk_size : int, default=2^20
+        Length of the chunks (the last one may be shorter)
+    memory : int, optional
+        Number of lags of the impulse response.  Default min(n + burnin, 2^20).
+
+    Yields
+    ------
+    np.ndarray
+        Consecutive chunks of the simulated path
 
+    Raises
+    ------
+    ValueError
+        If phi is a single AR coefficient with |phi| >= 1.
+    """
+    ar, ma = _lag_polynomials(phi, theta)
+    if len(ar) == 1 and abs(ar[0]) >= 1:
+        raise ValueError("arfima_stream requires |phi| < 1; use arfima or arfima_batch "
+                         "for explosive or unit root AR(1) components")
     n_total = n + burnin
+    if memory is None:
+        memory = min(n_total, 1 << 20)
+    memory = max(1, min(int(memory), n_total))
+    chunk_size = max(1, int(chunk_size))
+
+    if isinstance(seed, np.random.SeedSequence):
+        rng = np.random.default_rng(seed)
+    elif isinstance(seed, np.random.Generator):
+        rng = seed
+    else:
+        if seed is not None:
+            np.random.seed(seed)
+        rng = np.random
+
+    nfft = 1 << (memory - 1 + chunk_size - 1).bit_length()
+    kernel_fft = _stream_kernel_fft(memory, nfft, float(d), ar, ma)
+
+    # Carried state: the last memory - 1 innovations (zero before the sample)
+    state = np.zeros(memory - 1)
+    initial = None
+    if len(ar) == 1 and not ma and abs(ar[0]) < 1:
+        initial = rng.normal(0, sigma / np.sqrt(1 - ar[0]**2))
+
+    t = 0
+    while t < n_total:
+        size = min(chunk_size, n_total - t)
+        e = rng.normal(0, sigma, size)
+        if initial is not None and t == 0:
+            e[0] = initial
+
+        # Overlap-save: outputs after the first memory - 1 are free of
+        # circular wrap-around
+        buf = np.concatenate([state, e])
+        x = np.fft.irfft(np.fft.rfft(buf, n=nfft) * kernel_fft, n=nfft)[memory-1:memory-1+size]
+        if memory > 1:
+            state = buf[-(memory - 1):]
+
+        # Discard the burn-in
+        skip = min(max(burnin - t, 0), size)
+        t += size
+        if skip < size:
+            yield x[skip:]
+
+
+def arfima_fill(out: np.ndarray, d: float, phi: Union[float, Sequence[float]] = 0.0,
+                sigma: float = 1.0, seed: SeedLike = None, burnin: int = 0,
+                theta: Union[float, Sequence[float]] = 0.0,
+                chunk_size: int = 1 << 20,
+                memory: Optional[int] = None) -> np.ndarray:
+    """
+    Fill a 1-D array, such as a memory-mapped file, with an ARFIMA(p,d,q) path.
+
+    Writes the chunks of arfima_stream into out as they are generated, so
+    that series far larger than the available memory can be simulated
+    directly to disk, e.g. into
+    np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(n,)).
+
+    Parameters
+    ----------
+    out : np.ndarray
+        1-D array of length n to fill
+    d : float
+        Fractional differencing parameter
+    phi, sigma, seed, burnin, theta, chunk_size, memory
+        As for arfima_stream
+
+    Returns
+    -------
+    np.ndarray
+        out
+    """
+    n = len(out)
+    t = 0
+    for x in arfima_stream(n, d, phi=phi, sigma=sigma, seed=seed, burnin=burnin,
+                           theta=theta, chunk_size=chunk_size, memory=memory):
+        out[t:t+len(x)] = x
+        t += len(x)
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def arfima_autocovariance(n: int, d: float, phi: float = 0.0, sigma: float = 1.0) -> np.ndarray:
+    r"""
+    Autocovariances of a stationary ARFIMA(1,d,0) process at lags 0, ..., n-1.
+
+    For ARFIMA(0,d,0), gamma(0) = sigma^2 Gamma(1-2d) / Gamma(1-d)^2 and
+    gamma(k) = gamma(k-1) (k-1+d) / (k-d).  The AR(1) filter then gives
+
+        gamma_X(k) = (1 - phi^2)^{-1} \sum_h phi^{|h|} gamma(k-h),
+
+    where the sum is truncated once phi^{|h|} is below machine precision.
+
+    Parameters
+    ----------
+    n : int
+        Number of lags
+    d : float
+        Fractional differencing parameter, in (-1/2, 1/2)
+    phi : float, default=0.0
+        AR(1) coefficient, with |phi| < 1
+    sigma : float, default=1.0
+        Innovation standard deviation
 
-    # Step 1: Generate AR(1) process
-    eps = np.random.normal(0, sigma, n_total)
+    Returns
+    -------
+    np.ndarray
+        Autocovariances at lags 0, ..., n-1
+    """
+    if not (-0.5 < d < 0.5 and abs(phi) < 1):
+        raise ValueError("stationarity requires -0.5 < d < 0.5 and |phi| < 1")
 
+    # Number of terms of the AR(1) sum on each side
     if abs(phi) < 1e-13:
-        # Pure white noise case
-        u = eps
+        H = 0
     else:
-        # Generate AR(1) with proper stationary initialization
-        u = np.zeros(n_total)
+        H = int(np.ceil(np.log(np.finfo(np.float64).eps) / np.log(abs(phi))))
 
-        if abs(phi) < 1:
-            # Stationary case
-            u[0] = np.random.normal(0, sigma / np.sqrt(1 - phi**2))
-        else:
-            # Nonstationary case
-            u[0] = eps[0]
+    # ARFIMA(0,d,0) autocovariances at lags 0, ..., n-1+H
+    L = n + H
+    gamma = np.empty(L)
+    gamma[0] = sigma**2 * np.exp(math.lgamma(1 - 2*d) - 2 * math.lgamma(1 - d))
+    if L > 1:
+        k = np.arange(1, L, dtype=np.float64)
+        gamma[1:] = gamma[0] * np.cumprod((k - 1 + d) / (k - d))
+    if H == 0:
+        return gamma[:n]
 
-        # Generate AR(1) recursively
-        for t in range(1, n_total):
-            u[t] = phi * u[t-1] + eps[t]
+    # Lags -H, ..., n-1+H, filtered by the AR(1) autocovariances
+    two_sided = np.concatenate([gamma[H:0:-1], gamma])
+    weights = phi ** np.abs(np.arange(-H, H + 1, dtype=np.float64)) / (1 - phi**2)
+    size = len(two_sided) + len(weights) - 1
+    nfft = 1 << (size - 1).bit_length()
+    full = np.fft.irfft(np.fft.rfft(two_sided, n=nfft) * np.fft.rfft(weights, n=nfft), n=nfft)
+    return full[2*H:2*H + n]
 
-    # Step 2: Apply fractional filter if needed
-    if abs(d) < 1e-13:
-        # No fractional component, return AR(1) with burn-in removed
-        return u[burnin:]
 
-    # Apply fractional filter
-    x = fracdiff(u, -d)
+@_array_cache(_CACHE_BYTES)
+def _circulant_weights(n: int, d: float, phi: float) -> np.ndarray:
+    """
+    Square roots of the eigenvalues of a circulant embedding of the
+    ARFIMA(1,d,0) covariance matrix of order n, scaled for use with irfft.
 
-    # Discard burn-in
-    return x[burnin:]
+    The embedding has order m = 2N, for the smallest power of two N >= n-1
+    whose embedding is nonnegative definite.  Cached up to _CACHE_BYTES,
+    so that repeated simulations of the same process cost one inverse FFT
+    per replication.  The result is read-only.
+    """
+    # Strong short-run dependence relative to n may need a larger embedding
+    N = 1 << max(n - 2, 0).bit_length()
+    while True:
+        m = 2 * N
+        gamma = arfima_autocovariance(N + 1, d, phi)
+        c = np.concatenate([gamma, gamma[-2:0:-1]])
+        eigenvalues = np.fft.rfft(c).real
+        if eigenvalues.min() >= -1e-10 * eigenvalues.max():
+            break
+        if N >= max(1 << 20, 16 * n):
+            raise ValueError("circulant embedding is not nonnegative definite")
+        N *= 2
+
+    # Hermitian spectrum: real at frequencies 0 and m/2, complex between
+    weights = np.sqrt(np.maximum(eigenvalues, 0) * m / 2)
+    weights[0] *= np.sqrt(2)
+    weights[-1] *= np.sqrt(2)
+    weights.flags.writeable = False
+    return weights
+
+
+def arfima_exact(n: int, d: float, phi: float = 0.0, sigma: float = 1.0,
+                 seed: SeedLike = None) -> np.ndarray:
+    r"""
+    Simulate a stationary ARFIMA(1,d,0) process exactly.
+
+    Draws X_1, ..., X_n from their exact joint Gaussian distribution, by
+    circulant embedding of the autocovariance matrix (Davies and Harte,
+    1987; Wood and Chan, 1994).  Unlike arfima, which filters with a
+    truncated (1-L)^{-d} and needs a long burn-in to approach
+    stationarity, the result is stationary from the first observation at
+    O(n log n) cost.
+
+    Parameters
+    ----------
+    n : int
+        Sample size
+    d : float
+        Fractional differencing parameter, in (-1/2, 1/2)
+    phi : float, default=0.0
+        AR(1) coefficient, with |phi| < 1
+    sigma : float, default=1.0
+        Innovation standard deviation
+    seed : int, SeedSequence or Generator, optional
+        Source of random numbers (see arfima)
+
+    Returns
+    -------
+    np.ndarray
+        ARFIMA(1,d,0) process of length n
+
+    References
+    ----------
+    Davies, R. B. and D. S. Harte (1987). Tests for Hurst Effect.
+    _Biometrika_ 74, 95--101.
+
+    Wood, A. T. A. and G. Chan (1994). Simulation of Stationary Gaussian
+    Processes in [0, 1]^d. _Journal of Computational and Graphical
+    Statistics_ 3, 409--432.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        # A single replication drawn from this seed sequence itself
+        seed = [seed]
+    return arfima_exact_batch(1, n, d, phi=phi, sigma=sigma, seed=seed)[0]
+
+
+def arfima_exact_batch(R: int, n: int, d: float, phi: float = 0.0, sigma: float = 1.0,
+                       seed: Union[SeedLike, Sequence[SeedLike]] = None) -> np.ndarray:
+    r"""
+    Simulate R independent replications of a stationary ARFIMA(1,d,0) process exactly.
+
+    Batched version of arfima_exact.  The eigenvalues of the circulant
+    embedding are computed once per (n, d, phi) and cached unless they
+    are very large, and all replications are then generated with batched
+    inverse FFTs.
+
+    Parameters
+    ----------
+    R : int
+        Number of replications
+    n : int
+        Sample size
+    d : float
+        Fractional differencing parameter, in (-1/2, 1/2)
+    phi : float, default=0.0
+        AR(1) coefficient, with |phi| < 1
+    sigma : float, default=1.0
+        Innovation standard deviation
+    seed : int, SeedSequence, Generator or sequence, optional
+        Source of random numbers (see arfima_batch)
+
+    Returns
+    -------
+    np.ndarray
+        R x n array with one replication per row
+    """
+    weights = _circulant_weights(n, float(d), float(phi))
+    half = len(weights)
+    m = 2 * (half - 1)
+
+    # m standard normals per replication: real parts at frequencies
+    # 0, ..., m/2 and imaginary parts at 1, ..., m/2 - 1
+    z = _draw(R, seed, lambda rng, size: rng.standard_normal((size, m)))
+
+    x = np.empty((R, n))
+    block = max(1, _BATCH_SIZE // half)
+    for start in range(0, R, block):
+        rows = slice(start, start + block)
+        spectrum = z[rows, :half] * weights + 0j
+        spectrum[:, 1:-1] += 1j * z[rows, half:] * weights[1:-1]
+        x[rows] = np.fft.irfft(spectrum, n=m)[:, :n]
+    return sigma * x
+
+
+def random_level_shifts(R: int, n: int, p: float, sigma_eta: float = 1.0,
+                        seed: Union[SeedLike, Sequence[SeedLike]] = None) -> np.ndarray:
+    """
+    Simulate R independent replications of a random level shift process.
+
+    Following Definition 1 of Hou and Perron (2014), u_t = sum_{s<=t}
+    pi_s eta_s with eta_t ~ iid N(0, sigma_eta^2) and pi_t ~ iid
+    Bernoulli(p/n), so that p level shifts are expected over the sample.
+    Such a process is short memory but, like a long memory process, has
+    a spectral density that diverges near frequency zero (see LWLFC).
+
+    Parameters
+    ----------
+    R : int
+        Number of replications
+    n : int
+        Sample size
+    p : float
+        Expected number of level shifts over the sample
+    sigma_eta : float, default=1.0
+        Standard deviation of the shift magnitudes
+    seed : int, SeedSequence, Generator or sequence, optional
+        Source of random numbers (see arfima_batch).  For each stream, the
+        n uniform draws for the shift occurrences come before the n
+        normal draws for their magnitudes.
+
+    Returns
+    -------
+    np.ndarray
+        R x n array with one replication per row
+
+    References
+    ----------
+    Hou, J. and P. Perron (2014). Modified Local Whittle Estimator for Long
+    Memory Processes in the Presence of Low Frequency (and Other)
+    Contaminations. _Journal of Econometrics_ 182, 309--328.
+    """
+    def draw(rng, size):
+        shifts = rng.random((size, n)) < p / n
+        eta = rng.normal(0, sigma_eta, (size, n))
+        return np.cumsum(shifts * eta, axis=1)
+
+    return _draw(R, seed, draw)
+
+
+def white_noise(R: int, n: int, sigma: float = 1.0,
+                seed: Union[SeedLike, Sequence[SeedLike]] = None) -> np.ndarray:
+    """
+    Simulate R independent replications of Gaussian white noise.
+
+    Useful as additive measurement noise, as in the perturbed fractional
+    processes for which LWLFC is designed: add white_noise(R, n, sigma)
+    to the output of arfima_batch with a different seed.
+
+    Parameters
+    ----------
+    R : int
+        Number of replications
+    n : int
+        Sample size
+    sigma : float, default=1.0
+        Standard deviation
+    seed : int, SeedSequence, Generator or sequence, optional
+        Source of random numbers (see arfima_batch)
+
+    Returns
+    -------
+    np.ndarray
+        R x n array with one replication per row
+    """
+    return _draw(R, seed, lambda rng, size: rng.normal(0, sigma, (size, n)))
+
+
+def deterministic_trend(n: int, coef: Sequence[float] = (),
+                        breaks: Sequence[float] = (),
+                        shifts: Sequence[float] = ()) -> np.ndarray:
+    """
+    Deterministic trend with optional level shifts at known break dates.
+
+    Returns mu_t = sum_k coef[k] (t/n)^k + sum_b shifts[b] 1{t >= breaks[b] n}
+    for t = 1, ..., n.  Time is scaled by n so that the coefficients
+    describe the trend over the whole sample, whatever its length.  The
+    result broadcasts against the R x n arrays of the other simulators,
+    e.g. arfima_batch(R, n, d) + deterministic_trend(n, coef=(0, 2)).
+
+    Parameters
+    ----------
+    n : int
+        Sample size
+    coef : sequence of float, optional
+        Polynomial coefficients, constant first
+    breaks : sequence of float, optional
+        Break dates as fractions of the sample, in (0, 1)
+    shifts : sequence of float, optional
+        Size of the level shift at each break date
+
+    Returns
+    -------
+    np.ndarray
+        Trend of length n
+    """
+    if len(breaks) != len(shifts):
+        raise ValueError("breaks and shifts must have the same length")
+    t = np.arange(1, n + 1, dtype=np.float64)
+    mu = np.zeros(n)
+    if len(coef):
+        mu += np.polynomial.polynomial.polyval(t / n, np.asarray(coef, dtype=np.float64))
+    for fraction, shift in zip(breaks, shifts):
+        mu[t >= fraction * n] += shift
+    return mu
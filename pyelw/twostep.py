@@ -1,7 +1,8 @@
 import numpy as np
 from typing import Optional, Dict, Any, Tuple
 
-from .optimization import golden_section_search
+from .optimization import (chebyshev_search, scalar_search, search_tolerance,
+                           vectorized_golden_section_search)
 from .fracdiff import fracdiff
 from .lw import LW
 
@@ -23,6 +24,20 @@ class TwoStepELW:
         - 'hc': Complex cosine bell taper (Hurvich and Chen, 2000)
     trend_order : int, default=0
         Order of polynomial detrending. 0 = demean only, 1 = remove linear trend, etc.
+    optimizer : str, default='golden'
+        Minimizer used in both stages: 'golden' for golden section search
+        or 'brent' for Brent's method.
+    tol : float or 'se', optional
+        Convergence tolerance of the minimizer in both stages. Default
+        sqrt(machine epsilon). 'se' resolves d to 1% of its asymptotic
+        standard error.
+    surrogate : bool, default=False
+        Minimize a Chebyshev interpolant of the Stage 2 objective over the
+        Stage 2 bracket, polished by a few exact evaluations to within tol,
+        instead of searching the objective directly (see ELW).
+    n_nodes : int, default=6
+        Number of Chebyshev nodes when surrogate=True. Fewer than for ELW
+        suffice, since the Stage 2 bracket is narrow.
 
     Attributes
     ----------
@@ -48,6 +63,9 @@ class TwoStepELW:
         Stage 2 number of function evaluations.
     nfev_step1_ : int
         Stage 1 number of function evaluations.
+    surrogate_error_ : float
+        Estimated largest error of the Chebyshev interpolant of the Stage 2
+        objective (only if surrogate=True).
 
     References
     ----------
@@ -63,15 +81,24 @@ class TwoStepELW:
     Time Series. _Journal of Time Series Analysis_ 20, 87--126.
     """
 
-    def __init__(self, bounds=(-1.0, 2.2), taper='hc', trend_order=0):
+    def __init__(self, bounds=(-1.0, 2.2), taper='hc', trend_order=0, optimizer='golden',
+                 tol=None, surrogate=False, n_nodes=6):
         self.bounds = bounds
         self.taper = taper
         self.trend_order = trend_order
+        self.optimizer = optimizer
+        self.tol = tol
+        self.surrogate = surrogate
+        self.n_nodes = n_nodes
 
         # Store defaults for __repr__
         self._default_bounds = (-1.0, 2.2)
         self._default_taper = 'hc'
         self._default_trend_order = 0
+        self._default_optimizer = 'golden'
+        self._default_tol = None
+        self._default_surrogate = False
+        self._default_n_nodes = 6
 
     def weight_function(self, d: float) -> float:
         """
@@ -114,7 +141,7 @@ class TwoStepELW:
         Parameters
         ----------
         X : np.ndarray
-            Time series data
+            Time series data.  A 2-D array is detrended row by row.
         order : int, optional
             Order of time trend to remove.  For order=0,
             we remove a constant (demean).
@@ -124,6 +151,9 @@ class TwoStepELW:
         np.ndarray
             Detrended time series
         """
+        if X.ndim > 1:
+            return self._detrend_many(X, order)
+
         if order == 0:
             return X - np.mean(X)  # Demean only
 
@@ -154,6 +184,26 @@ class TwoStepELW:
 
         return X_detrended
 
+    def _detrend_many(self, X: np.ndarray, order: int) -> np.ndarray:
+        """Remove a polynomial trend from each row of a 2-D array."""
+        if order == 0:
+            return X - np.mean(X, axis=-1, keepdims=True)
+
+        n = X.shape[-1]
+        t = np.arange(1, n+1, dtype=np.float64)
+        Z = np.ones((n, order + 1), dtype=np.float64)
+        for i in range(1, order + 1):
+            Z[:, i] = t ** i
+
+        # One regression per row, sharing the design matrix
+        ZtZ = Z.T @ Z
+        ZtX = Z.T @ X.T
+        try:
+            beta = np.linalg.solve(ZtZ, ZtX)
+        except np.linalg.LinAlgError:
+            beta = np.linalg.pinv(Z) @ X.T
+        return X - (Z @ beta).T
+
     def objective(self, d: float, x: np.ndarray, m: int) -> float:
         """
         Exact local Whittle objective function.
@@ -194,7 +244,47 @@ class TwoStepELW:
         r = np.log(g) - 2 * d * np.sum(np.log(lam_trunc)) / m
         return float(r.real)
 
-    def fit(self, X, m=None, verbose=False, n_jobs=1):
+    def objective_many(self, d: np.ndarray, x: np.ndarray, m: int) -> np.ndarray:
+        """
+        Exact local Whittle objective function for many series at once.
+
+        Parameters
+        ----------
+        d : np.ndarray
+            Memory parameter for each series
+        x : np.ndarray
+            2-D array of detrended residuals with one series per row
+        m : int
+            Number of frequencies to use
+
+        Returns
+        -------
+        np.ndarray
+            Objective function values to be minimized
+        """
+        d = np.asarray(d, dtype=np.float64)
+
+        # Adaptive mean correction (see objective)
+        weight = np.where(d <= 0.5, 1.0,
+                          np.where(d < 0.75, 0.5 * (1.0 + np.cos(-2*np.pi + 4*np.pi*d)), 0.0))
+        myu = (1 - weight) * x[:, 0]
+        x_corrected = x - myu[:, None]
+
+        # ELW objective function
+        dx = fracdiff(x_corrected, d)
+        n = dx.shape[-1]
+        t = np.arange(0, n, dtype=np.float64)
+        lam = 2 * np.pi * t / n
+        fft_dx = np.fft.fft(np.conj(dx))
+        wdx = np.conj(fft_dx) * np.exp(1j * lam) / np.sqrt(2 * np.pi * n)
+        lam_trunc = lam[1:m+1]
+        vx = wdx[:, 1:m+1]
+        Iv = vx * np.conj(vx)
+        g = np.sum(Iv, axis=-1) / m
+        r = np.log(g) - 2 * d * np.sum(np.log(lam_trunc)) / m
+        return r.real
+
+    def fit(self, X, m=None, verbose=False, n_jobs=1, time_budget=None, d_init='gph'):
         """
         Two-step exact local Whittle estimation of memory parameter d.
 
@@ -202,17 +292,24 @@ class TwoStepELW:
         ----------
         X : np.ndarray
             Time series data.
-        m : int or 'auto', optional
+        m : int, 'auto' or 'plugin', optional
             Number of frequencies to use. Options:
             - int: Use specified number of frequencies
             - None: Use default n^0.65
             - 'auto': Use bootstrap procedure to select optimal bandwidth
+            - 'plugin': Use plug-in MSE-optimal bandwidth (fast)
         verbose : bool, default=False
             Print diagnostic information during estimation.
         n_jobs : int, default=1
             Number of parallel jobs for the bootstrap bandwidth search when
             m='auto' (ignored otherwise). Default 1 runs serially. -1 uses
             all available cores; any positive integer sets the worker count.
+        time_budget : float, optional
+            Maximum time in seconds for the bootstrap bandwidth search when
+            m='auto' (ignored otherwise). When exhausted, the best bandwidth
+            found so far is used and bootstrap_m_truncated_ is set.
+        d_init : float, 'gph' or None, default='gph'
+            Initial value of d for the Stage 1 search (see LW.fit).
 
         Returns
         -------
@@ -236,7 +333,8 @@ class TwoStepELW:
             # Use bootstrap MSE bandwidth selection to find optimal m
             from .lw_bootstrap_m import LWBootstrapM
             selector = LWBootstrapM(bounds=self.bounds, verbose=verbose,
-                                    n_jobs=n_jobs)
+                                    n_jobs=n_jobs, time_budget=time_budget,
+                                    optimizer=self.optimizer, tol=self.tol)
             selector.fit(X_detrended)
 
             # Store bootstrap-specific attributes
@@ -244,8 +342,20 @@ class TwoStepELW:
             self.bootstrap_m_iterations_ = selector.iterations_
             self.bootstrap_m_mse_profile_ = selector.mse_profile_
             self.bootstrap_m_k_n_ = selector.k_n_
+            self.bootstrap_m_truncated_ = selector.truncated_
 
             # Use the optimal m for two-step ELW estimation
+            m = selector.optimal_m_
+        elif m == 'plugin':
+            # Use plug-in MSE-optimal bandwidth
+            from .lw_plugin_m import LWPluginM
+            selector = LWPluginM(bounds=self.bounds, verbose=verbose)
+            selector.select(X_detrended)
+
+            # Store plug-in-specific attributes
+            self.plugin_m_optimal_m_ = selector.optimal_m_
+            self.plugin_m_curvature_ = selector.curvature_
+
             m = selector.optimal_m_
         if verbose:
             print(f"Using {m} frequencies for both steps")
@@ -254,8 +364,8 @@ class TwoStepELW:
         if verbose:
             print(f"Stage 1: {self.taper} tapered LW estimation")
         X_step1 = X_detrended  # Stage 1 uses detrended data
-        lw = LW(bounds=self.bounds, taper=self.taper)
-        lw.fit(X_step1, m=m)
+        lw = LW(bounds=self.bounds, taper=self.taper, optimizer=self.optimizer, tol=self.tol)
+        lw.fit(X_step1, m=m, d_init=d_init)
         d_step1 = lw.d_hat_
         se_step1 = lw.se_
         objective_step1 = lw.objective_
@@ -273,7 +383,16 @@ class TwoStepELW:
 
         # Use narrower bounds around the initial estimate
         local_bounds = (max(self.bounds[0], d_step1 - 2.576*se_step1), min(self.bounds[1], d_step1 + 2.576*se_step1))
-        result_step2 = golden_section_search(step2_objective_func, brack=local_bounds)
+        tol = search_tolerance(self.tol, m)
+        if self.surrogate:
+            def step2_objective_many(d: np.ndarray) -> np.ndarray:
+                return self.objective_many(d, np.broadcast_to(X_detrended, (len(d), n)), m)
+
+            result_step2 = chebyshev_search(step2_objective_many, local_bounds,
+                                            n_nodes=self.n_nodes, tol=tol)
+        else:
+            result_step2 = scalar_search(step2_objective_func, brack=local_bounds,
+                                         method=self.optimizer, tol=tol)
         d_step2 = result_step2.x
         if verbose:
             print(f"    Final estimate: d = {d_step2:.4f}")
@@ -293,16 +412,98 @@ class TwoStepELW:
         self.objective_step1_ = objective_step1
         self.nfev_ = result_step2.nfev
         self.nfev_step1_ = nfev_step1
+        if self.surrogate:
+            self.surrogate_error_ = result_step2.error_bound
 
         return self
 
+    def fit_many(self, X: np.ndarray, m: Optional[int] = None, d_init='gph') -> Dict[str, Any]:
+        """
+        Two-step exact local Whittle estimation for many series of equal length.
+
+        Stage 1 uses LW.fit_many and Stage 2 advances the golden section
+        searches of all series in lockstep, each within its own bracket
+        around the Stage 1 estimate.  Each series gives the same estimate
+        as fit() with optimizer='golden'; the optimizer and surrogate
+        settings are not used here.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            2-D array with one time series per row
+        m : int, optional
+            Number of frequencies to use for every series. Default n^0.65.
+        d_init : float, 'gph' or None, default='gph'
+            Initial value of d for the Stage 1 searches (see LW.fit_many).
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary containing:
+            - 'n': sample size
+            - 'm': number of frequencies
+            - 'd_hat': array of Stage 2 memory parameter estimates
+            - 'se': standard error
+            - 'ase': asymptotic standard error
+            - 'd_step1': array of Stage 1 estimates
+            - 'se_step1': array of Stage 1 standard errors
+            - 'objective': array of Stage 2 objective function values
+            - 'objective_step1': array of Stage 1 objective function values
+            - 'nfev': array of Stage 2 function evaluation counts
+            - 'nfev_step1': array of Stage 1 function evaluation counts
+            - 'method': estimation method
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2:
+            raise ValueError("X must be a 2-D array with one series per row")
+        n = X.shape[-1]
+        if m is None:
+            m = int(n**0.65)
+        elif isinstance(m, str):
+            raise ValueError("fit_many requires an integer bandwidth m")
+
+        # Step 0: Detrending
+        X_detrended = self.detrend(X, self.trend_order)
+
+        # Stage 1: Tapered local Whittle estimator
+        lw = LW(bounds=self.bounds, taper=self.taper, tol=self.tol)
+        step1 = lw.fit_many(X_detrended, m=m, d_init=d_init)
+        d_step1 = step1['d_hat']
+        se_step1 = step1['se']
+
+        # Stage 2: Modified ELW estimation within narrower bounds around
+        # each Stage 1 estimate (fmax/fmin ignore a NaN Stage 1 result,
+        # like max/min do in fit)
+        lower = np.fmax(self.bounds[0], d_step1 - 2.576*se_step1)
+        upper = np.fmin(self.bounds[1], d_step1 + 2.576*se_step1)
+        result_step2 = vectorized_golden_section_search(
+            lambda d: self.objective_many(d, X_detrended, m), lower, upper,
+            tol=search_tolerance(self.tol, m))
+
+        se = 1 / (2 * np.sqrt(m))
+        return {
+            'n': n,
+            'm': m,
+            'd_hat': result_step2.x,
+            'se': se,
+            'ase': se,
+            'd_step1': d_step1,
+            'se_step1': se_step1,
+            'objective': result_step2.fun,
+            'objective_step1': step1['objective'],
+            'nfev': result_step2.nfev,
+            'nfev_step1': step1['nfev'],
+            'method': '2elw',
+        }
+
     def estimate(self, X: np.ndarray,
                  m = None,
                  bounds: Optional[Tuple[float, float]] = None,
                  taper: Optional[str] = None,
                  trend_order: Optional[int] = None,
                  verbose: Optional[bool] = False,
-                 n_jobs: int = 1) -> Dict[str, Any]:
+                 n_jobs: int = 1,
+                 time_budget: Optional[float] = None) -> Dict[str, Any]:
         """
         Two-step exact local Whittle estimation of memory parameter d.
 
@@ -310,8 +511,9 @@ class TwoStepELW:
         ----------
         X : np.ndarray
             Time series data
-        m : int or 'auto', optional
-            Number of frequencies to use. Use 'auto' for bootstrap selection. Default m = n^0.65.
+        m : int, 'auto' or 'plugin', optional
+            Number of frequencies to use. Use 'auto' for bootstrap selection
+            or 'plugin' for plug-in selection. Default m = n^0.65.
         bounds: tuple[float, float], optional
             Lower and upper bounds for golden section search.
             If provided, temporarily overrides constructor bounds.
@@ -327,6 +529,10 @@ class TwoStepELW:
             Number of parallel jobs for the bootstrap bandwidth search when
             m='auto' (ignored otherwise). Default 1 runs serially. -1 uses
             all available cores; any positive integer sets the worker count.
+        time_budget : float, optional
+            Maximum time in seconds for the bootstrap bandwidth search when
+            m='auto' (ignored otherwise). When exhausted, the best bandwidth
+            found so far is used and bootstrap_m_truncated_ is set.
 
         Returns
         -------
@@ -348,7 +554,8 @@ class TwoStepELW:
 
         try:
             # Fit the model
-            self.fit(X, m=m, verbose=verbose, n_jobs=n_jobs)
+            self.fit(X, m=m, verbose=verbose, n_jobs=n_jobs,
+                     time_budget=time_budget)
 
             # Return results as dictionary for backward compatibility
             return {
@@ -383,6 +590,14 @@ class TwoStepELW:
             params.append(f"taper='{self.taper}'")
         if self.trend_order != self._default_trend_order:
             params.append(f"trend_order={self.trend_order}")
+        if self.optimizer != self._default_optimizer:
+            params.append(f"optimizer='{self.optimizer}'")
+        if self.tol != self._default_tol:
+            params.append(f"tol={self.tol!r}")
+        if self.surrogate != self._default_surrogate:
+            params.append(f"surrogate={self.surrogate}")
+        if self.n_nodes != self._default_n_nodes:
+            params.append(f"n_nodes={self.n_nodes}")
 
         params_str = ", ".join(params)
         return f"TwoStepELW({params_str})"
@@ -561,3 +561,83 @@ def test_elw_auto_m_basic(arfima_data_auto):
 
     # Check that m matches optimal_m
     assert elw.m_ == elw.bootstrap_m_optimal_m_
+
+
+@pytest.mark.parametrize("mean_est", ['none', 'mean', 'init'])
+@pytest.mark.parametrize("n_grid", [20, 0])
+def test_fit_many_matches_fit(mean_est, n_grid):
+    """fit_many gives the same results as fitting each series separately."""
+    X = np.array([arfima(n=300, d=0.2 * (i % 6) - 0.2, seed=i) for i in range(12)])
+
+    results = ELW(mean_est=mean_est, n_grid=n_grid).fit_many(X, m=40)
+
+    for i, x in enumerate(X):
+        elw = ELW(mean_est=mean_est, n_grid=n_grid).fit(x, m=40)
+        assert results['d_hat'][i] == elw.d_hat_
+        assert results['objective'][i] == elw.objective_
+        assert results['nfev'][i] == elw.nfev_
+        np.testing.assert_allclose(results['se'][i], elw.se_, rtol=1e-10)
+    assert results['ase'] == elw.ase_
+    assert results['method'] == 'elw'
+    assert results['n'] == elw.n_
+
+
+def test_fit_many_invalid_input():
+    """fit_many requires a 2-D array and an integer bandwidth."""
+    x = arfima(n=200, d=0.3, seed=1)
+    with pytest.raises(ValueError, match="2-D"):
+        ELW().fit_many(x)
+    with pytest.raises(ValueError, match="integer bandwidth"):
+        ELW().fit_many(np.vstack([x, x]), m='auto')
+
+
+@pytest.mark.parametrize("n_grid", [20, 0])
+def test_brent_optimizer(n_grid):
+    """Brent's method agrees with golden section search in fewer evaluations."""
+    x = arfima(n=500, d=0.35, phi=0.3, seed=7)
+    golden = ELW(n_grid=n_grid).fit(x, m=60)
+    brent = ELW(n_grid=n_grid, optimizer='brent').fit(x, m=60)
+    assert abs(brent.d_hat_ - golden.d_hat_) < 1e-6
+    assert brent.nfev_ < golden.nfev_
+    assert repr(ELW(optimizer='brent', tol='se')) == "ELW(optimizer='brent', tol='se')"
+
+
+def test_grid_threads():
+    """Threaded grid evaluation does not change the estimate."""
+    x = arfima(n=400, d=0.35, seed=11)
+    serial = ELW().fit(x)
+    threaded = ELW().fit(x, n_jobs=2)
+    assert threaded.d_hat_ == serial.d_hat_
+    assert threaded.nfev_ == serial.nfev_
+
+
+@pytest.mark.parametrize("d_init", ['gph', 0.5])
+def test_d_init(d_init):
+    """Starting from d_init gives the same estimate as the robust search."""
+    x = arfima(n=500, d=0.35, phi=0.3, seed=7)
+    full = ELW().fit(x, m=60)
+    warm = ELW().fit(x, m=60, d_init=d_init)
+    assert abs(warm.d_hat_ - full.d_hat_) < 1e-6
+    if d_init == 'gph':
+        assert warm.nfev_ < full.nfev_
+
+
+@pytest.mark.parametrize("d", [-0.4, 0.35, 0.8, 1.3])
+def test_surrogate(d):
+    """The Chebyshev surrogate matches the exact search in fewer evaluations."""
+    x = arfima(n=500, d=d, phi=0.3, seed=7)
+    exact = ELW().fit(x, m=60)
+    surrogate = ELW(surrogate=True).fit(x, m=60)
+    assert abs(surrogate.d_hat_ - exact.d_hat_) < 1e-6
+    assert surrogate.nfev_ < exact.nfev_ / 2
+    assert surrogate.surrogate_error_ > 0
+    assert abs(surrogate.se_ - exact.se_) < 1e-3
+
+    # Coarser tolerance
+    coarse = ELW(surrogate=True, tol='se').fit(x, m=60)
+    assert abs(coarse.d_hat_ - exact.d_hat_) < 0.01 / (2 * np.sqrt(60))
+
+    # Starting from d_init
+    warm = ELW(surrogate=True).fit(x, m=60, d_init='gph')
+    assert abs(warm.d_hat_ - exact.d_hat_) < 1e-6
+    assert repr(ELW(surrogate=True, n_nodes=8)) == "ELW(surrogate=True, n_nodes=8)"
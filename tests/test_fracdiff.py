@@ -83,6 +83,19 @@ def test_edge_cases():
     assert np.isfinite(large_d_result).all()
 
 
+def test_batched_rows():
+    """A 2-D array is differenced row by row, each at its own d."""
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((4, 50))
+    d = np.array([-0.4, 0.0, 0.3, 1.2])
+
+    result = fracdiff(X, d)
+
+    assert result.shape == X.shape
+    for i in range(4):
+        np.testing.assert_array_equal(result[i], fracdiff(X[i], d[i]))
+
+
 #
 # Test against fdiff.R from the LongMemoryTS R package
 #
@@ -0,0 +1,65 @@
+import pytest
+import numpy as np
+
+from pyelw.gph import gph, initial_bracket, log_periodogram_regression, periodogram
+from pyelw.simulate import arfima
+
+
+@pytest.mark.parametrize("d_true", [-0.3, 0.0, 0.3])
+def test_gph_arfima(d_true):
+    """The log-periodogram estimate is close to the true d."""
+    estimates = [gph(arfima(n=1000, d=d_true, seed=i))['d_hat'] for i in range(50)]
+    assert abs(np.mean(estimates) - d_true) < 0.05
+
+
+def test_gph_standard_error():
+    """The standard error matches the sampling variability of the estimate."""
+    results = [gph(arfima(n=1000, d=0.3, seed=i), m=80) for i in range(200)]
+    sd = np.std([r['d_hat'] for r in results])
+    assert results[0]['se'] == pytest.approx(sd, rel=0.25)
+    # Asymptotically pi / sqrt(24 m)
+    assert results[0]['se'] == pytest.approx(np.pi / np.sqrt(24 * 80), rel=0.25)
+
+
+def test_gph_result_keys():
+    """Results are returned as a dictionary like estimate()."""
+    result = gph(arfima(n=500, d=0.2, seed=1))
+    assert result['n'] == 500
+    assert result['m'] == int(500**0.65)
+    assert result['method'] == 'gph'
+
+
+def test_gph_degenerate():
+    """A constant series gives NaN."""
+    result = gph(np.ones(100), m=10)
+    assert np.isnan(result['d_hat'])
+    assert np.isnan(result['se'])
+
+
+def test_initial_bracket():
+    """Brackets are 2.576 standard errors around the initial value."""
+    x = arfima(n=500, d=0.2, seed=1)
+    center, width = initial_bracket(0.4, 25)
+    assert center == 0.4
+    assert width == pytest.approx(2.576 / 10)
+
+    pilot = gph(x, 25)
+    center, width = initial_bracket('gph', 25, *periodogram(x, 25))
+    assert center == pilot['d_hat']
+    assert width == pytest.approx(2.576 * pilot['se'])
+
+    with pytest.raises(ValueError, match="d_init must be"):
+        initial_bracket('lw', 25)
+
+
+def test_log_periodogram_regression_rows():
+    """Periodograms in rows give the estimates of each row."""
+    I_X = np.array([periodogram(arfima(n=400, d=0.1 * i, seed=i), 30)[0] for i in range(4)])
+    freqs = periodogram(np.zeros(400), 30)[1]
+    I_X[2, ::3] = 0
+    d_hat, se = log_periodogram_regression(I_X, freqs)
+    for i in range(4):
+        expected = log_periodogram_regression(I_X[i], freqs)
+        assert d_hat[i] == pytest.approx(expected[0], rel=1e-12)
+        assert se[i] == pytest.approx(expected[1], rel=1e-12)
+    assert se[2] > se[0]
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+import pytest
+
+import pyelw
+
+
+def _run(code):
+    """Run code in a fresh interpreter and return its output."""
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                            text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_import_is_lazy():
+    """Importing pyelw does not import the estimators or their dependencies."""
+    out = _run("import sys, pyelw; "
+               "print(sorted(m for m in ('numpy', 'joblib', 'scipy', 'pyelw.lw') "
+               "if m in sys.modules))")
+    assert out == "[]"
+
+
+def test_serial_fits_do_not_import_joblib_or_scipy():
+    """Serial estimation, including bootstrap bandwidth selection, needs neither joblib nor SciPy."""
+    out = _run("import sys\n"
+               "from pyelw import LW, ELW, TwoStepELW, LWLFC, LWBootstrapM\n"
+               "from pyelw.simulate import arfima\n"
+               "x = arfima(n=200, d=0.3, seed=1)\n"
+               "LWBootstrapM(B=5, m_min=5, m_max=15, max_iter=2).fit(x)\n"
+               "LW().fit(x); ELW().fit(x); TwoStepELW().fit(x); LWLFC().fit(x)\n"
+               "print(sorted(m for m in ('joblib', 'scipy') if m in sys.modules))")
+    assert out == "[]"
+
+
+@pytest.mark.parametrize("name", pyelw.__all__)
+def test_public_names(name):
+    """Every public name resolves to the object defined in its submodule."""
+    obj = getattr(pyelw, name)
+    assert obj.__name__ == name
+    assert name in dir(pyelw)
+
+
+def test_unknown_attribute():
+    """Unknown attributes raise AttributeError."""
+    with pytest.raises(AttributeError, match="no_such_name"):
+        pyelw.no_such_name
@@ -700,3 +700,116 @@ def test_lw_auto_m_basic(arfima_data_auto):
     # Check that estimate is reasonable
     assert np.isfinite(lw.d_hat_)
     assert abs(lw.d_hat_ - d_true) < 0.3  # Loose bound
+
+
+#
+# Batched estimation
+#
+
+@pytest.mark.parametrize("taper", ['none', 'kolmogorov', 'cosine', 'bartlett', 'hc'])
+def test_fit_many_matches_fit(taper):
+    """fit_many gives the same results as fitting each series separately."""
+    X = np.array([arfima(n=300, d=0.1 * (i % 6) - 0.1, seed=i) for i in range(12)])
+
+    results = LW(taper=taper).fit_many(X, m=40)
+
+    for i, x in enumerate(X):
+        lw = LW(taper=taper).fit(x, m=40)
+        assert results['d_hat'][i] == lw.d_hat_
+        assert results['se'][i] == lw.se_
+        assert results['objective'][i] == lw.objective_
+        assert results['nfev'][i] == lw.nfev_
+    assert results['ase'] == lw.ase_
+    assert results['method'] == lw.method_
+    assert results['n'] == lw.n_
+    assert results['m'] == 40
+
+
+def test_fit_many_default_bandwidth():
+    """fit_many uses the n^0.65 default bandwidth."""
+    X = np.array([arfima(n=200, d=0.3, seed=i) for i in range(3)])
+    results = LW().fit_many(X)
+    assert results['m'] == int(200**0.65)
+    assert results['d_hat'].shape == (3,)
+
+
+def test_fit_many_invalid_input():
+    """fit_many requires a 2-D array and an integer bandwidth."""
+    x = arfima(n=200, d=0.3, seed=1)
+    with pytest.raises(ValueError, match="2-D"):
+        LW().fit_many(x)
+    with pytest.raises(ValueError, match="integer bandwidth"):
+        LW().fit_many(np.vstack([x, x]), m='auto')
+
+
+@pytest.mark.parametrize("taper", ['none', 'kolmogorov', 'hc'])
+def test_brent_optimizer(taper):
+    """Brent's method agrees with golden section search in fewer evaluations."""
+    x = arfima(n=500, d=0.35, phi=0.3, seed=7)
+    golden = LW(taper=taper).fit(x, m=60)
+    brent = LW(taper=taper, optimizer='brent').fit(x, m=60)
+    assert abs(brent.d_hat_ - golden.d_hat_) < 1e-6
+    assert brent.nfev_ < golden.nfev_ / 2
+
+
+def test_se_tolerance():
+    """tol='se' resolves d to a fraction of its standard error."""
+    x = arfima(n=500, d=0.35, seed=7)
+    exact = LW().fit(x, m=60)
+    approx = LW(optimizer='brent', tol='se').fit(x, m=60)
+    assert abs(approx.d_hat_ - exact.d_hat_) < 0.01 * exact.ase_
+    assert approx.nfev_ < 15
+
+    results = LW(tol='se').fit_many(np.vstack([x, x]), m=60)
+    assert np.all(np.abs(results['d_hat'] - exact.d_hat_) < 0.01 * exact.ase_)
+
+
+def test_invalid_optimizer():
+    """An unknown optimizer raises a ValueError."""
+    x = arfima(n=200, d=0.3, seed=1)
+    with pytest.raises(ValueError, match="optimizer must be one of"):
+        LW(optimizer='newton').fit(x)
+    with pytest.raises(ValueError, match="tol must be"):
+        LW(tol='asymptotic').fit(x)
+
+
+def test_repr_optimizer():
+    """Non-default optimizer settings appear in the representation."""
+    assert repr(LW(optimizer='brent', tol='se')) == "LW(optimizer='brent', tol='se')"
+
+
+@pytest.mark.parametrize("taper", ['none', 'kolmogorov', 'hc'])
+@pytest.mark.parametrize("d_init", ['gph', 0.3, 1.5, -0.9])
+def test_d_init(taper, d_init):
+    """Starting from d_init gives the same estimate as the full search."""
+    x = arfima(n=500, d=0.35, phi=0.3, seed=7)
+    full = LW(taper=taper).fit(x, m=60, d_init=None)
+    warm = LW(taper=taper).fit(x, m=60, d_init=d_init)
+    assert abs(warm.d_hat_ - full.d_hat_) < 1e-6
+    if d_init in ('gph', 0.3):
+        assert warm.nfev_ < full.nfev_
+
+
+def test_d_init_default_gph():
+    """By default the search starts from the log-periodogram estimate."""
+    x = arfima(n=500, d=0.35, seed=2)
+    default = LW().fit(x, m=60)
+    gph = LW().fit(x, m=60, d_init='gph')
+    assert default.d_hat_ == gph.d_hat_
+    assert default.nfev_ == gph.nfev_
+
+
+def test_d_init_rolling_windows():
+    """Warm starts from the previous window need fewer evaluations."""
+    x = arfima(n=1500, d=0.3, seed=3)
+    nfev_cold = nfev_warm = 0
+    d_prev = 'gph'
+    for start in range(0, 500, 50):
+        window = x[start:start + 1000]
+        cold = LW(optimizer='brent').fit(window, d_init=None)
+        warm = LW(optimizer='brent').fit(window, d_init=d_prev)
+        assert abs(warm.d_hat_ - cold.d_hat_) < 1e-6
+        nfev_cold += cold.nfev_
+        nfev_warm += warm.nfev_
+        d_prev = warm.d_hat_
+    assert nfev_warm < nfev_cold
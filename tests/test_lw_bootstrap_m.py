@@ -594,6 +594,114 @@ def test_repr_custom_params(lw_estimator):
     assert 'delta=-0.05' in repr_str
 
 
+#
+# Memoization tests
+#
+
+def test_fit_computes_periodogram_once(lw_estimator, simple_arfima_data, monkeypatch):
+    """The raw periodogram is computed once per fit, including k_n='auto'."""
+    selector = LWBootstrapM(lw_estimator=lw_estimator, B=5, m_min=5,
+                            m_max=15, max_iter=3)
+    calls = []
+    original = selector._periodogram
+
+    def counting_periodogram(X):
+        calls.append(len(X))
+        return original(X)
+
+    monkeypatch.setattr(selector, '_periodogram', counting_periodogram)
+    selector.fit(simple_arfima_data)
+    assert len(calls) == 1
+
+
+def test_fit_memoizes_lw_fits(selector, simple_arfima_data, monkeypatch):
+    """Each bandwidth is fitted at most once, including the final fit."""
+    fitted = []
+    original = selector.lw_estimator.fit
+
+    def counting_fit(X, m=None, **kwargs):
+        fitted.append(m)
+        return original(X, m=m, **kwargs)
+
+    monkeypatch.setattr(selector.lw_estimator, 'fit', counting_fit)
+    selector.fit(simple_arfima_data)
+    assert len(fitted) == len(set(fitted))
+    assert selector.lw_estimator.m_ == selector.optimal_m_
+
+
+def test_fit_stops_on_cycle(selector, simple_arfima_data, monkeypatch):
+    """A revisited state stops the iteration instead of running max_iter."""
+    selector.max_iter = 10
+    monkeypatch.setattr(
+        selector, '_evaluate_bandwidths',
+        lambda n, m_values, d, k_n, v_j, parallel, deadline: {
+            'mse': np.full(len(m_values), np.inf),
+            'mse_se': np.full(len(m_values), np.nan),
+            'nfev': np.zeros(len(m_values), dtype=np.int64),
+            'draws': None, 'time_resample': 0.0, 'time_optimize': 0.0})
+    selector.fit(simple_arfima_data)
+    assert selector.iterations_ < selector.max_iter
+    assert not selector.converged_
+
+
+#
+# Time budget tests
+#
+
+def test_time_budget_default_none():
+    """No time limit unless requested."""
+    selector = LWBootstrapM()
+    assert selector.time_budget is None
+    assert selector.deadline is None
+
+
+def test_time_budget_zero_returns_initial_bandwidth(selector, simple_arfima_data):
+    """An exhausted budget returns m_init without any bootstrap work."""
+    selector.time_budget = 0.0
+    selector.fit(simple_arfima_data)
+    assert selector.truncated_
+    assert selector.optimal_m_ == selector.m_init
+    assert selector.n_candidates_evaluated_ == 0
+    assert selector.n_replicates_evaluated_ == 0
+    assert np.isfinite(selector.d_hat_)
+
+
+def test_deadline_truncates_partial_profile(selector, simple_arfima_data, monkeypatch):
+    """A deadline reached mid-iteration returns the best evaluated bandwidth."""
+    import pyelw.lw_bootstrap_m as module
+
+    # Fake clock advancing by one second per call
+    clock = iter(range(1000))
+    monkeypatch.setattr(module.time, 'monotonic', lambda: next(clock))
+
+    # Budget covers the iteration check and two blocks of candidates
+    selector.time_budget = 3.5
+    selector.fit(simple_arfima_data)
+
+    n_candidates = selector.m_max - selector.m_min + 1
+    assert selector.truncated_
+    assert not selector.converged_
+    assert 0 < selector.n_candidates_evaluated_ < n_candidates
+    assert selector.n_replicates_evaluated_ == selector.n_candidates_evaluated_ * selector.B
+    assert len(selector.mse_profile_) == selector.n_candidates_evaluated_
+    assert selector.optimal_m_ == min(selector.mse_profile_, key=selector.mse_profile_.get)
+
+
+def test_no_time_budget_not_truncated(selector, simple_arfima_data):
+    """Without a budget the search runs to completion."""
+    selector.fit(simple_arfima_data)
+    assert not selector.truncated_
+    assert selector.n_candidates_evaluated_ >= selector.m_max - selector.m_min + 1
+
+
+@pytest.mark.parametrize("estimator", [LW, ELW, TwoStepELW])
+def test_estimator_forwards_time_budget(estimator, simple_arfima_data):
+    """fit(m='auto', time_budget=...) is forwarded to the bootstrap search."""
+    est = estimator().fit(simple_arfima_data, m='auto', time_budget=0.0)
+    assert est.bootstrap_m_truncated_
+    assert est.m_ == est.bootstrap_m_optimal_m_
+
+
 #
 # Edge case tests
 #
@@ -645,6 +753,41 @@ def test_n_jobs_invariance():
     assert serial.d_hat_ == parallel.d_hat_
 
 
+def test_evaluate_bandwidths_blocks_match_serial(selector, simple_arfima_data):
+    """Blocked parallel evaluation returns MSEs in candidate order."""
+    from joblib import Parallel
+
+    n = len(simple_arfima_data)
+    v_j = selector._locally_standardized_periodogram(simple_arfima_data, 0.3)
+    m_values = list(range(5, 16))
+
+    serial = selector._evaluate_bandwidths(n, m_values, 0.3, 2, v_j)
+    with Parallel(n_jobs=2) as parallel:
+        blocked = selector._evaluate_bandwidths(n, m_values, 0.3, 2, v_j,
+                                                parallel)
+
+    for key in ('mse', 'mse_se', 'nfev'):
+        np.testing.assert_array_equal(serial[key], blocked[key])
+    for m, mse in zip(m_values, serial['mse']):
+        assert selector._evaluate_bandwidth(simple_arfima_data, m, 0.3, 2, v_j) == (m, mse)
+
+
+def test_evaluate_bandwidths_tasks_exclude_estimator(selector, simple_arfima_data):
+    """Tasks carry only arrays and settings, not the LW estimator."""
+    import threading
+    from joblib import Parallel
+
+    n = len(simple_arfima_data)
+    v_j = selector._locally_standardized_periodogram(simple_arfima_data, 0.3)
+    serial = selector._evaluate_bandwidths(n, [5, 8, 11], 0.3, 2, v_j)
+
+    # An estimator that cannot be pickled would fail any task that holds it
+    selector.lw_estimator.lock = threading.Lock()
+    with Parallel(n_jobs=2) as parallel:
+        blocked = selector._evaluate_bandwidths(n, [5, 8, 11], 0.3, 2, v_j, parallel)
+    np.testing.assert_array_equal(serial['mse'], blocked['mse'])
+
+
 @pytest.mark.slow
 @pytest.mark.parametrize("estimator", [LW, ELW, TwoStepELW])
 def test_fit_auto_n_jobs_smoke(estimator):
@@ -656,3 +799,81 @@ def test_fit_auto_n_jobs_smoke(estimator):
     assert np.isfinite(est.d_hat_)
     assert hasattr(est, 'bootstrap_m_optimal_m_')
     assert est.m_ == est.bootstrap_m_optimal_m_
+
+
+#
+# Instrumentation tests
+#
+
+def test_iteration_paths(simple_arfima_data):
+    """Per-iteration paths line up with the candidate grid and iterations."""
+    selector = LWBootstrapM(k_n=2, B=10, m_min=5, m_max=20, m_init=8, max_iter=3)
+    selector.fit(simple_arfima_data)
+
+    n_iter = selector.iterations_
+    assert np.array_equal(selector.m_grid_, np.arange(5, 21))
+    assert selector.m_path_.shape == (n_iter,)
+    assert selector.m_path_[0] == 8
+    assert selector.d_path_.shape == (n_iter,)
+    assert selector.mse_path_.shape == (n_iter, len(selector.m_grid_))
+    assert selector.mse_se_path_.shape == selector.mse_path_.shape
+    assert np.all(selector.mse_se_path_ >= 0)
+    assert selector.nfev_path_.shape == (n_iter,)
+    assert selector.nfev_path_[0] > 0
+
+    # The last row of the path is the final MSE profile
+    last = dict(zip(selector.m_grid_.tolist(), selector.mse_path_[-1]))
+    assert last == selector.mse_profile_
+
+
+def test_timings(simple_arfima_data):
+    """Timings are recorded for every iteration and are non-negative."""
+    selector = LWBootstrapM(k_n=2, B=10, m_min=5, m_max=15, m_init=8, max_iter=2)
+    selector.fit(simple_arfima_data)
+
+    expected = {'lw_fit', 'periodogram', 'resampling', 'optimization',
+                'dispatch', 'total'}
+    assert set(selector.timings_) == expected
+    for values in selector.timings_.values():
+        assert values.shape == (selector.iterations_,)
+        assert np.all(values >= 0)
+    assert selector.timings_['optimization'][0] > 0
+
+
+def test_store_draws(simple_arfima_data):
+    """Bootstrap draws are kept only on request and reproduce the MSE."""
+    common = dict(k_n=2, B=10, m_min=5, m_max=15, m_init=8, max_iter=2)
+    assert LWBootstrapM(**common).fit(simple_arfima_data).d_star_ is None
+
+    selector = LWBootstrapM(store_draws=True, **common).fit(simple_arfima_data)
+    assert selector.d_star_.shape == (10, len(selector.m_grid_))
+    assert selector.d_star_.dtype == np.float32
+
+    mse = np.mean((selector.d_star_.astype(np.float64) - selector.d_path_[-1])**2, axis=0)
+    np.testing.assert_allclose(mse, selector.mse_path_[-1], rtol=1e-5)
+
+
+def test_optimizer(simple_arfima_data):
+    """The optimizer is passed to the default LW estimator and the replicates."""
+    common = dict(k_n=2, B=10, m_min=5, m_max=15, m_init=8, max_iter=2)
+    selector = LWBootstrapM(optimizer='brent', **common)
+    assert selector.lw_estimator.optimizer == 'brent'
+    assert repr(selector) == "LWBootstrapM(k_n=2, B=10, optimizer='brent')"
+
+    golden = LWBootstrapM(**common).fit(simple_arfima_data)
+    brent = selector.fit(simple_arfima_data)
+    assert brent.optimal_m_ == golden.optimal_m_
+    np.testing.assert_allclose(brent.mse_path_, golden.mse_path_, rtol=1e-5)
+    assert brent.nfev_path_.sum() < golden.nfev_path_.sum()
+
+
+def test_warm_start(simple_arfima_data):
+    """Warm starts reproduce the bandwidth search with fewer evaluations."""
+    common = dict(k_n=2, B=20, m_min=5, m_max=30, m_init=8, max_iter=2)
+    cold = LWBootstrapM(**common).fit(simple_arfima_data)
+    warm = LWBootstrapM(warm_start=True, **common).fit(simple_arfima_data)
+    assert warm.optimal_m_ == cold.optimal_m_
+    np.testing.assert_allclose(warm.d_path_, cold.d_path_, atol=1e-6)
+    np.testing.assert_allclose(warm.mse_path_, cold.mse_path_, rtol=1e-4)
+    assert warm.nfev_path_.sum() < cold.nfev_path_.sum()
+    assert repr(LWBootstrapM(warm_start=True)) == "LWBootstrapM(warm_start=True)"
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+
+from pyelw import LW, ELW, TwoStepELW, LWLFC, LWPluginM
+from pyelw.lw_bootstrap_m import LWBootstrapM
+from pyelw.simulate import arfima
+
+
+@pytest.fixture
+def ar_data():
+    """ARFIMA(1, 0.3, 0) data with phi=0.5."""
+    return arfima(n=5000, d=0.3, phi=0.5, seed=42, burnin=500)
+
+
+def test_init_defaults():
+    """Default construction creates an LW estimator."""
+    selector = LWPluginM()
+    assert isinstance(selector.lw_estimator, LW)
+    assert selector.L is None
+    assert repr(selector) == "LWPluginM()"
+
+
+def test_select_formula(ar_data):
+    """Selected m follows (3n/(4 pi))^{4/5} |E|^{-2/5}."""
+    selector = LWPluginM()
+    m = selector.select(ar_data)
+    n = len(ar_data)
+    expected = (3 * n / (4 * np.pi))**0.8 * abs(selector.curvature_)**(-0.4)
+    assert m == int(np.clip(np.round(expected), 6, n // 2))
+    assert selector.optimal_m_ == m
+    assert selector.L_ == int(n**0.8)
+
+
+def test_select_curvature_sign(ar_data):
+    """Positive AR coefficient gives negative curvature E = -phi/(1-phi)^2."""
+    selector = LWPluginM()
+    selector.select(ar_data)
+    assert selector.curvature_ < 0
+    assert abs(selector.pilot_d_ - 0.3) < 0.2
+
+
+def test_select_respects_limits(ar_data):
+    """Selected m lies within [m_min, m_max]."""
+    selector = LWPluginM(m_min=50, m_max=60)
+    m = selector.select(ar_data)
+    assert 50 <= m <= 60
+
+
+def test_fit_estimates_d(ar_data):
+    """fit() estimates d at the selected bandwidth."""
+    selector = LWPluginM().fit(ar_data)
+    lw = LW().fit(ar_data, m=selector.optimal_m_)
+    assert selector.d_hat_ == lw.d_hat_
+    assert selector.se_ == lw.se_
+    assert selector.method_ == 'lw_plugin_m'
+
+
+@pytest.mark.parametrize("estimator", [LW, ELW, TwoStepELW, LWLFC])
+def test_estimators_accept_plugin(estimator, ar_data):
+    """Estimators accept m='plugin' and record the selection."""
+    est = estimator().fit(ar_data, m='plugin')
+    assert est.m_ == est.plugin_m_optimal_m_
+    assert np.isfinite(est.plugin_m_curvature_)
+    assert np.isfinite(est.d_hat_)
+
+
+def test_bootstrap_m_init_plugin():
+    """LWBootstrapM can start its iteration from the plug-in bandwidth."""
+    x = arfima(n=200, d=0.3, phi=0.5, seed=1)
+    selector = LWBootstrapM(k_n=2, B=5, m_init='plugin', max_iter=1)
+    selector.fit(x)
+    m_plugin = LWPluginM(m_min=6, m_max=100).select(x)
+    assert selector.m_init_ == m_plugin
@@ -48,6 +48,8 @@ def test_repr():
 
     est = LWLFC(noise=True)
     assert "noise=True" in repr(est)
+    est = LWLFC(optimizer='profile', n_grid=20)
+    assert repr(est) == "LWLFC(optimizer='profile', n_grid=20)"
 
 
 # =============================================================================
@@ -405,6 +407,117 @@ def test_objective_large_theta(estimator):
     assert isinstance(obj, (float, np.floating))
 
 
+@pytest.mark.parametrize("noise", [False, True])
+@pytest.mark.parametrize("seed", [0, 6])
+def test_profile_optimizer(noise, seed):
+    """Profiling theta finds at least as good an optimum as the default start."""
+    x = arfima(n=500, d=0.1, phi=0.0, seed=seed)
+    rng = np.random.RandomState(seed)
+    x = x + 2 * np.cumsum(rng.binomial(1, 0.01, 500) * rng.randn(500))
+
+    qn = LWLFC(noise=noise).fit(x)
+    profile = LWLFC(noise=noise, optimizer='profile').fit(x)
+
+    assert profile.objective_ <= qn.objective_ + 1e-5
+    assert qn.profile_ is None
+    assert profile.profile_['d'].shape == (50,)
+    assert profile.profile_['objective'].shape == (50,)
+    assert np.all(profile.profile_['theta'] >= 0)
+    assert ('theta_noise' in profile.profile_) == noise
+    assert profile.objective_ <= np.min(profile.profile_['objective']) + 1e-12
+
+
+def test_profile_matches_objective(estimator):
+    """Profile values are objective values at the profiled parameters."""
+    x = arfima(n=300, d=0.3, phi=0.0, seed=5)
+    est = LWLFC(optimizer='profile', n_grid=10).fit(x)
+    data = est.prepare_data(x, est.m_)
+    profile = est.profile_
+    for d, theta, obj in zip(profile['d'], profile['theta'], profile['objective']):
+        assert est.objective(np.array([d, theta]), data) == pytest.approx(obj, rel=1e-12)
+
+
+def test_invalid_optimizer():
+    """Unknown optimizers are rejected."""
+    x = arfima(n=200, d=0.3, phi=0.0, seed=1)
+    with pytest.raises(ValueError, match="optimizer"):
+        LWLFC(optimizer='nelder-mead').fit(x)
+
+
+@pytest.mark.parametrize("noise", [False, True])
+@pytest.mark.parametrize("optimizer", ['qn', 'profile'])
+def test_fit_many_matches_fit(noise, optimizer):
+    """fit_many gives the same results as fitting each series separately."""
+    X = np.array([arfima(n=300, d=0.1 * (i % 6) - 0.1, phi=0.3 * (i % 2), seed=i)
+                  for i in range(6)])
+    est = LWLFC(noise=noise, optimizer=optimizer, n_grid=20)
+
+    results = est.fit_many(X, m=60)
+
+    for i, x in enumerate(X):
+        single = LWLFC(noise=noise, optimizer=optimizer, n_grid=20).fit(x, m=60)
+        assert results['d_hat'][i] == single.d_hat_
+        assert results['theta'][i] == single.theta_
+        assert results['se'][i] == single.se_
+        assert results['objective'][i] == single.objective_
+        assert results['nfev'][i] == single.nfev_
+        if noise:
+            assert results['theta_noise'][i] == single.theta_noise_
+    assert ('theta_noise' in results) == noise
+    assert results['ase'] == single.ase_
+    assert results['method'] == single.method_
+
+
+def test_fit_many_invalid_input(estimator):
+    """fit_many requires a 2-D array."""
+    with pytest.raises(ValueError, match="2-D"):
+        estimator.fit_many(arfima(n=200, d=0.3, seed=1))
+
+
+@pytest.mark.parametrize("noise, params", [
+    (False, np.array([0.3, 2.0])),
+    (True, np.array([0.3, 0.5, 2.0])),
+])
+def test_analytic_derivatives(noise, params):
+    """Analytic gradient and Hessian agree with finite differences."""
+    x = arfima(n=500, d=0.3, phi=0.3, seed=1)
+    est = LWLFC(noise=noise)
+    data = est.prepare_data(x, int(500**0.8))
+
+    obj, grad = est.objective_and_gradient(params, data)
+    assert obj == pytest.approx(est.objective(params, data), rel=1e-12)
+
+    h = 1e-6
+    steps = h * np.eye(len(params))
+    grad_fd = np.array([(est.objective(params + e, data) - est.objective(params - e, data)) / (2 * h)
+                        for e in steps])
+    np.testing.assert_allclose(grad, grad_fd, rtol=1e-5, atol=1e-8)
+
+    hess_fd = np.array([(est.objective_and_gradient(params + e, data)[1]
+                         - est.objective_and_gradient(params - e, data)[1]) / (2 * h)
+                        for e in steps])
+    np.testing.assert_allclose(est.hessian(params, data), hess_fd, rtol=1e-5, atol=1e-8)
+
+
+def test_objective_and_gradient_invalid(estimator):
+    """Outside the admissible region the objective is inf and the gradient NaN."""
+    np.random.seed(42)
+    x = np.random.randn(256)
+    data = estimator.prepare_data(x, int(256**0.8))
+    obj, grad = estimator.objective_and_gradient(np.array([0.2, -1e6]), data)
+    assert obj == np.inf
+    assert np.all(np.isnan(grad))
+
+
+def test_se_from_analytic_hessian():
+    """The standard error uses the second derivative of the objective in d."""
+    x = arfima(n=500, d=0.3, phi=0.0, seed=3)
+    est = LWLFC().fit(x)
+    data = est.prepare_data(x, est.m_)
+    d2_dd = est.hessian(np.array([est.d_hat_, est.theta_]), data)[0, 0]
+    assert est.se_ == pytest.approx(np.sqrt(1 / (est.m_ * d2_dd)))
+
+
 # =============================================================================
 # Test against R LongMemoryTS Hou.Perron baseline results
 # =============================================================================
@@ -539,3 +652,16 @@ def test_r_lwlfc_baseline(case, nile_data, sealevel_data):
         f"ase mismatch for {case['name']}: "
         f"Python={result['ase']:.6f}, R={expected_ase:.6f}, error={ase_error:.6f}"
     )
+
+
+@pytest.mark.parametrize("optimizer", ['qn', 'profile'])
+def test_d_init(optimizer):
+    """d_init replaces the starting value search."""
+    x = arfima(n=600, d=0.3, seed=2)
+    full = LWLFC(optimizer=optimizer).fit(x)
+    warm = LWLFC(optimizer=optimizer).fit(x, d_init='gph')
+    assert abs(warm.d_hat_ - full.d_hat_) < 1e-4
+    assert warm.profile_ is None
+    assert warm.nfev_ <= full.nfev_
+    with pytest.raises(ValueError, match="optimizer must be one of"):
+        LWLFC(optimizer='newton').fit(x, d_init=0.3)
@@ -0,0 +1,255 @@
+import pytest
+import numpy as np
+from functools import partial
+
+import pyelw
+from pyelw import LW, ELW
+from pyelw.montecarlo import RunningCovariance, RunningStats, control_variate, monte_carlo
+from pyelw.simulate import arfima_batch, replication_seeds
+
+
+def test_running_stats():
+    """Merged streaming statistics match those of all values at once."""
+    rng = np.random.default_rng(0)
+    values = 1e6 + rng.normal(0, 1, 1000)
+    stats = RunningStats()
+    for chunk in np.array_split(values, 7):
+        stats.merge(RunningStats().update(chunk))
+    for v in rng.normal(0, 1, 5):
+        values = np.append(values, 1e6 + v)
+        stats.update(1e6 + v)
+    stats.update([np.nan, np.inf])
+
+    assert stats.count == len(values)
+    assert stats.n_nonfinite == 2
+    np.testing.assert_allclose(stats.mean, np.mean(values), rtol=1e-14)
+    np.testing.assert_allclose(stats.variance, np.var(values), rtol=1e-9)
+    np.testing.assert_allclose(stats.sem, np.std(values, ddof=1) / np.sqrt(len(values)),
+                               rtol=1e-9)
+    assert np.isnan(RunningStats().variance)
+
+
+def test_monte_carlo_matches_loop():
+    """Summary statistics match a loop over the same replications."""
+    R, n = 30, 128
+    m = lambda n, **cell: {'m': int(n**0.65)}  # noqa: E731
+    table = monte_carlo(arfima_batch, {'lw': (LW(), m), 'elw': (ELW(), m)},
+                        {'n': [n], 'd': [0.0, 0.4]}, R=R, seed=5, n_jobs=1, chunk_size=7)
+    assert list(table['estimator']) == ['lw', 'elw', 'lw', 'elw']
+    np.testing.assert_array_equal(table['d_true'], [0.0, 0.0, 0.4, 0.4])
+    np.testing.assert_array_equal(table['reps'], R)
+
+    cell_seeds = replication_seeds(np.random.SeedSequence(5), 2)
+    for i, d in enumerate([0.0, 0.4]):
+        X = arfima_batch(R, n, d, seed=replication_seeds(cell_seeds[i], R))
+        for k, est in enumerate([LW(), ELW()]):
+            d_hat = np.array([est.fit(x, m=int(n**0.65)).d_hat_ for x in X])
+            row = 2 * i + k
+            np.testing.assert_allclose(table['bias'][row], np.mean(d_hat) - d, atol=1e-14)
+            np.testing.assert_allclose(table['sd'][row], np.std(d_hat), rtol=1e-10)
+            np.testing.assert_allclose(table['rmse'][row], np.sqrt(np.mean((d_hat - d)**2)),
+                                       rtol=1e-10)
+
+
+def test_monte_carlo_parallel():
+    """Results do not depend on the number of workers."""
+    kwargs = dict(dgp=partial(arfima_batch, burnin=50), estimators=[LW()],
+                  grid=[{'n': 100, 'd': 0.2, 'phi': (0.3, -0.1)}], R=20, seed=1, chunk_size=6)
+    serial = monte_carlo(n_jobs=1, **kwargs)
+    threaded = monte_carlo(n_jobs=3, backend='threading', **kwargs)
+    for key in ['mean', 'sd', 'rmse', 'reps']:
+        np.testing.assert_array_equal(serial[key], threaded[key])
+    assert serial['phi'][0] == (0.3, -0.1)
+    assert serial['estimator'][0] == repr(LW())
+
+
+def test_monte_carlo_target():
+    """A callable target gives the true value of each cell."""
+    table = monte_carlo(arfima_batch, {'lw': LW()}, {'n': [100], 'd': [0.3]}, R=5,
+                        target=lambda d, **cell: d + 1, n_jobs=1)
+    np.testing.assert_allclose(table['bias'], table['mean'] - 1.3)
+    with pytest.raises(KeyError):
+        monte_carlo(arfima_batch, {'lw': LW()}, {'n': [100], 'd': [0.3]}, R=5,
+                    target='beta', n_jobs=1)
+
+
+def test_monte_carlo_exported():
+    """monte_carlo is available at package level."""
+    assert pyelw.monte_carlo is monte_carlo
+
+
+def test_monte_carlo_store(tmp_path):
+    """Interrupted runs resume from the chunks already in the store."""
+    store = str(tmp_path / 'study')
+    calls = []
+
+    def dgp(R, seed, **cell):
+        calls.append(seed[0])
+        if len(calls) == 3 and fail:
+            raise RuntimeError("worker died")
+        return arfima_batch(R, seed=seed, **cell)
+
+    kwargs = dict(estimators={'lw': LW()}, grid={'n': [100], 'd': [0.0, 0.3]}, R=12,
+                  seed=2, n_jobs=1, chunk_size=4)
+    expected = monte_carlo(arfima_batch, **kwargs)
+
+    fail = True
+    with pytest.raises(RuntimeError):
+        monte_carlo(dgp, store=store, **kwargs)
+    assert len(list((tmp_path / 'study').glob('cell*.npz'))) == 2
+
+    fail = False
+    calls.clear()
+    table = monte_carlo(dgp, store=store, **kwargs)
+    assert len(calls) == 4
+    for key in ['mean', 'sd', 'rmse', 'reps']:
+        np.testing.assert_array_equal(table[key], expected[key])
+
+    # Nothing left to do
+    calls.clear()
+    monte_carlo(dgp, store=store, **kwargs)
+    assert not calls
+
+    with np.load(str(tmp_path / 'study' / 'cell00001_rep000000004.npz')) as f:
+        assert f['d_hat'].shape == (1, 4)
+
+    with pytest.raises(ValueError, match="different study"):
+        monte_carlo(dgp, store=store, **dict(kwargs, R=16))
+
+
+def test_monte_carlo_store_checks_settings(tmp_path):
+    """Resuming with other estimators, fit parameters or DGP is an error."""
+    store = str(tmp_path / 'study')
+    kwargs = dict(grid={'n': [100], 'd': [0.3]}, R=4, seed=2, n_jobs=1, store=store)
+    dgp = partial(arfima_batch, phi=0.5)
+    monte_carlo(dgp, {'lw': (LW(), {'m': 20})}, **kwargs)
+    monte_carlo(partial(arfima_batch, phi=0.5), {'lw': (LW(), {'m': 20})}, **kwargs)
+
+    with pytest.raises(ValueError, match="estimator_configs differs"):
+        monte_carlo(dgp, {'lw': (LW(), {'m': 50})}, **kwargs)
+    with pytest.raises(ValueError, match="estimator_configs differs"):
+        monte_carlo(dgp, {'lw': (LW(taper='hc'), {'m': 20})}, **kwargs)
+    with pytest.raises(ValueError, match="dgp differs"):
+        monte_carlo(partial(arfima_batch, phi=0.8), {'lw': (LW(), {'m': 20})}, **kwargs)
+
+
+def test_monte_carlo_shards(tmp_path):
+    """Shards run separately and are merged from the shared store."""
+    from pyelw.montecarlo import load_results
+    store = str(tmp_path / 'study')
+    kwargs = dict(estimators={'lw': LW()}, grid={'n': [100], 'd': [0.0, 0.3]}, R=10,
+                  n_jobs=1, chunk_size=3)
+    expected = monte_carlo(arfima_batch, seed=8, **kwargs)
+
+    with pytest.raises(ValueError, match="incomplete"):
+        assert monte_carlo(arfima_batch, seed=8, store=store, shard=(0, 3), **kwargs) is None
+        load_results(store)
+    assert monte_carlo(arfima_batch, seed=8, store=store, shard=(2, 3), **kwargs) is None
+
+    # The seed is taken from the store when not given
+    table = monte_carlo(arfima_batch, seed=None, store=store, shard=(1, 3), **kwargs)
+    for key in ['mean', 'sd', 'rmse']:
+        np.testing.assert_array_equal(table[key], expected[key])
+        np.testing.assert_array_equal(load_results(store)[key], expected[key])
+
+    with pytest.raises(ValueError, match="requires a store"):
+        monte_carlo(arfima_batch, shard=(0, 2), **kwargs)
+
+
+def test_monte_carlo_save_data(tmp_path):
+    """Simulated data are saved next to the estimates."""
+    store = tmp_path / 'study'
+    monte_carlo(arfima_batch, [LW()], {'n': [50], 'd': [0.2]}, R=5, seed=3, n_jobs=1,
+                store=str(store), save_data=True)
+    X = np.load(str(store / 'cell00000_rep000000000.data.npy'), mmap_mode='r')
+    cell_seed = replication_seeds(np.random.SeedSequence(3), 1)[0]
+    np.testing.assert_array_equal(X, arfima_batch(5, 50, 0.2, seed=replication_seeds(cell_seed, 5)))
+
+
+def test_running_covariance():
+    """Merged covariance statistics and the control variate mean."""
+    rng = np.random.default_rng(1)
+    c = rng.normal(0, 1, 500)
+    y = 2.0 + 3.0 * c + rng.normal(0, 0.1, 500)
+    Z = np.column_stack([y, c])
+    stats = RunningCovariance(2)
+    for chunk in np.array_split(Z, 6):
+        stats.merge(RunningCovariance(2).update(chunk))
+    stats.update([np.nan, 1.0])
+    assert stats.count == 500 and stats.n_nonfinite == 1
+    np.testing.assert_allclose(stats.comoment / 500, np.cov(Z.T, bias=True), rtol=1e-10)
+
+    # Regression-adjusted mean: ybar - beta cbar
+    beta = np.polyfit(c, y, 1)[0]
+    mean, se = stats.mean_and_se()
+    np.testing.assert_allclose(mean, y.mean() - beta * c.mean(), rtol=1e-12)
+    assert se < 0.1 / np.sqrt(500) * 1.2
+
+    # Without controls, the sample mean and its standard error
+    plain = RunningCovariance(1).update(y)
+    np.testing.assert_allclose(plain.mean_and_se(),
+                               (y.mean(), np.std(y, ddof=1) / np.sqrt(500)), rtol=1e-12)
+
+
+def test_control_variate():
+    """The control variate has mean zero and variance 1/(4 sum nu_j^2)."""
+    m = 20
+    E = np.random.default_rng(2).standard_normal((20000, 200))
+    C = control_variate(E, m)
+    nu = np.log(np.arange(1, m + 1))
+    nu -= nu.mean()
+    var = 1 / (4 * nu @ nu)
+    assert abs(np.mean(C)) < 4 * np.sqrt(var / len(C))
+    assert abs(np.var(C) / var - 1) < 0.05
+    np.testing.assert_allclose(control_variate(E[:3], [5, m, m])[1:], C[1:3])
+
+
+def test_antithetic_innovations():
+    """Antithetic pairs have the same distribution and negatively correlated estimates."""
+    R, n = 400, 256
+    X, E = arfima_batch(R, n, 0.0, seed=np.random.SeedSequence(3), antithetic=True,
+                        return_innovations=True)
+    np.testing.assert_allclose(X, E)
+    assert abs(np.var(X[1::2]) - 1) < 0.02
+
+    # Periodogram ordinates of the pairs are negatively correlated
+    I = np.abs(np.fft.rfft(X, axis=1)[:, 1:20])**2
+    assert np.corrcoef(I[0::2].ravel(), I[1::2].ravel())[0, 1] < -0.5
+
+    d_hat = np.array([LW().fit(x, m=40).d_hat_ for x in X])
+    assert np.corrcoef(d_hat[0::2], d_hat[1::2])[0, 1] < -0.3
+
+
+def test_monte_carlo_variance_reduction():
+    """Antithetic pairs and control variates increase the effective replications."""
+    m = lambda n, **cell: {'m': 40}  # noqa: E731
+    kwargs = dict(estimators={'lw': (LW(), m)}, grid={'n': [256], 'd': [0.3]}, R=200,
+                  seed=4, n_jobs=1)
+    plain = monte_carlo(arfima_batch, **kwargs)
+    dgp = partial(arfima_batch, return_innovations=True)
+    reduced = monte_carlo(dgp, antithetic=True, control_variates=True, **kwargs)
+    assert plain['reps_eff'][0] == pytest.approx(plain['reps'][0])
+    assert reduced['reps_eff'][0] > 4 * plain['reps_eff'][0]
+    assert abs(reduced['bias'][0] - plain['bias'][0]) < 3 * plain['mcse'][0]
+
+    with pytest.raises(ValueError, match="even"):
+        monte_carlo(arfima_batch, antithetic=True, **dict(kwargs, R=11))
+
+
+def test_monte_carlo_common_random_numbers():
+    """With common random numbers, every cell uses the same innovations."""
+    kwargs = dict(estimators={'lw': LW()}, grid={'n': [128], 'd': [0.0, 0.2]}, R=10,
+                  seed=5, n_jobs=1)
+    dgp = partial(arfima_batch, return_innovations=True)
+    innovations = []
+
+    def recording(R, seed, **cell):
+        X, E = dgp(R, seed=seed, **cell)
+        innovations.append(E)
+        return X
+
+    monte_carlo(recording, common_random_numbers=True, chunk_size=10, **kwargs)
+    np.testing.assert_array_equal(innovations[0], innovations[1])
+    innovations.clear()
+    monte_carlo(recording, chunk_size=10, **kwargs)
+    assert not np.array_equal(innovations[0], innovations[1])
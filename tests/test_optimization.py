@@ -1,7 +1,14 @@
 import pytest  # noqa: F401
 import numpy as np
 
-from pyelw.optimization import golden_section_search
+from pyelw.optimization import (golden_section_search, bounded_quasi_newton,
+                                bracketed_search, brent_search, chebyshev_search,
+                                robust_golden_section_search,
+                                scalar_search, search_tolerance,
+                                vectorized_bounded_quasi_newton,
+                                vectorized_bracketed_search,
+                                vectorized_golden_section_search,
+                                vectorized_robust_golden_section_search)
 
 
 def test_quadratic_function():
@@ -171,3 +178,300 @@ def test_edge_cases():
     result = golden_section_search(narrow_func, brack=(0.5, 0.501))
     assert result.success
     assert 0.5 <= result.x <= 0.501
+
+
+def test_bounded_quasi_newton_rosenbrock():
+    """Bounded quasi-Newton finds the interior minimum of the Rosenbrock function."""
+    def rosenbrock(x):
+        f = 100 * (x[1] - x[0]**2)**2 + (1 - x[0])**2
+        grad = np.array([-400 * x[0] * (x[1] - x[0]**2) - 2 * (1 - x[0]),
+                         200 * (x[1] - x[0]**2)])
+        return f, grad
+
+    result = bounded_quasi_newton(rosenbrock, np.array([-1.2, 1.0]),
+                                  bounds=[(-2.0, 2.0), (-2.0, 2.0)],
+                                  ftol=1e-14)
+
+    assert result.success
+    np.testing.assert_allclose(result.x, [1.0, 1.0], atol=1e-4)
+    assert result.fun < 1e-8
+
+
+def test_bounded_quasi_newton_active_bound():
+    """Bounded quasi-Newton stops at a bound when the minimum lies outside."""
+    def quadratic(x):
+        return (x[0] - 2.0)**2 + (x[1] + 1.0)**2, np.array([2 * (x[0] - 2.0), 2 * (x[1] + 1.0)])
+
+    result = bounded_quasi_newton(quadratic, np.array([0.5, 0.5]),
+                                  bounds=[(0.0, 1.0), (0.0, 1.0)])
+
+    assert result.success
+    np.testing.assert_allclose(result.x, [1.0, 0.0], atol=1e-8)
+    assert result.jac[0] < 0 and result.jac[1] > 0
+
+
+def test_bounded_quasi_newton_unbounded_start():
+    """Starting points outside the bounds are projected onto them."""
+    def quadratic(x):
+        return np.sum((x - 0.25)**2), 2 * (x - 0.25)
+
+    result = bounded_quasi_newton(quadratic, np.array([5.0, -5.0, 0.0]),
+                                  bounds=[(0.0, 1.0)] * 3)
+
+    assert result.success
+    np.testing.assert_allclose(result.x, [0.25, 0.25, 0.25], atol=1e-6)
+    assert result.nfev >= result.nit
+
+
+def test_vectorized_bounded_quasi_newton_matches_scalar():
+    """Each problem in the lockstep quasi-Newton search follows the scalar search."""
+    shift = np.linspace(-1.0, 3.0, 6)
+    x0 = np.column_stack([np.linspace(-1.2, 0.5, 6), np.full(6, 1.0)])
+    bounds = [(-2.0, 2.0), (-2.0, 2.0)]
+
+    def rosenbrock(x, a):
+        f = 100 * (x[..., 1] - x[..., 0]**2)**2 + (a - x[..., 0])**2
+        grad = np.stack([-400 * x[..., 0] * (x[..., 1] - x[..., 0]**2) - 2 * (a - x[..., 0]),
+                         200 * (x[..., 1] - x[..., 0]**2)], axis=-1)
+        return f, grad
+
+    result = vectorized_bounded_quasi_newton(lambda x, index: rosenbrock(x, shift[index]),
+                                             x0, bounds, ftol=1e-14)
+
+    for i in range(6):
+        scalar = bounded_quasi_newton(lambda x: rosenbrock(x, shift[i]), x0[i], bounds,
+                                      ftol=1e-14)
+        np.testing.assert_array_equal(result.x[i], scalar.x)
+        assert result.fun[i] == scalar.fun
+        assert result.nfev[i] == scalar.nfev
+        assert result.nit[i] == scalar.nit
+        assert result.message[i] == scalar.message
+    assert np.all(result.success)
+
+
+def test_vectorized_golden_section_matches_scalar():
+    """Each problem in the vectorized search follows the scalar search exactly."""
+    centers = np.linspace(-0.4, 0.9, 7)
+    upper = np.linspace(0.2, 1.0, 7)
+
+    result = vectorized_golden_section_search(
+        lambda x: (x - centers)**2 + np.abs(x - centers)**0.5,
+        np.full(7, -0.5), upper)
+
+    for i in range(7):
+        scalar = golden_section_search(
+            lambda x: (x - centers[i])**2 + abs(x - centers[i])**0.5,
+            brack=(-0.5, upper[i]))
+        assert result.x[i] == scalar.x
+        assert result.fun[i] == scalar.fun
+        assert result.nfev[i] == scalar.nfev
+        assert result.success[i] == scalar.success
+
+
+def test_vectorized_golden_section_maxiter():
+    """Problems that do not converge within maxiter are flagged."""
+    result = vectorized_golden_section_search(lambda x: (x - 0.3)**2,
+                                              np.zeros(3), np.ones(3), maxiter=5)
+    assert not np.any(result.success)
+    assert "Maximum number of iterations" in result.message
+
+
+def test_vectorized_bracketed_search_matches_scalar():
+    """The vectorized bracketed search matches the scalar one, including widening."""
+    centers = np.array([-0.4, 0.1, 0.5, 1.2, 1.9])
+    # Good guesses, guesses whose bracket misses the minimum on either
+    # side, a bracket outside the bounds and no guess at all
+    x0 = np.array([-0.35, 0.6, 0.0, 1.21, np.nan])
+    width = np.array([0.1, 0.1, 0.2, 0.05, 0.1])
+
+    def f(x, center):
+        return (x - center)**2 + np.abs(x - center)**0.5
+
+    result = vectorized_bracketed_search(lambda x, index: f(x, centers[index]),
+                                         (-1.0, 2.2), x0, width)
+    for i, center in enumerate(centers):
+        scalar = bracketed_search(lambda x: f(x, center), (-1.0, 2.2), x0[i], width[i])
+        assert result.x[i] == scalar.x
+        assert result.fun[i] == scalar.fun
+        assert result.nfev[i] == scalar.nfev
+
+
+def test_vectorized_robust_golden_section_matches_scalar():
+    """The vectorized robust search matches the scalar one, including re-optimization."""
+    # Tilted double wells: golden section finds the wrong well for some
+    tilts = np.array([-0.5, -0.2, 0.0, 0.2, 0.5])
+
+    def f(x, tilt):
+        return (x**2 - 1)**2 + tilt * x
+
+    result = vectorized_robust_golden_section_search(
+        lambda x, index: f(x, tilts[index]), np.full(5, -2.0), np.full(5, 1.5))
+    assert result.x[0] > 0 and result.x[-1] < 0
+
+    for i, tilt in enumerate(tilts):
+        scalar = robust_golden_section_search(lambda x: f(x, tilt), brack=(-2.0, 1.5))
+        assert result.x[i] == scalar.x
+        assert result.fun[i] == scalar.fun
+        assert result.nfev[i] == scalar.nfev
+
+
+@pytest.mark.parametrize("func,brack,x_min", [
+    (lambda x: (x - 2.0)**2, (-1.0, 3.0), 2.0),
+    (lambda x: np.cosh(x - 0.3), (-1.0, 3.0), 0.3),
+    (lambda x: -np.exp(-(x - 0.7)**2), (0.5, 2.2), 0.7),
+    (lambda x: abs(x - 0.1), (-1.0, 3.0), 0.1),
+    (lambda x: (x - 1.5)**4, (-1.0, 3.0), 1.5),
+])
+def test_brent_matches_golden(func, brack, x_min):
+    """Brent's method finds the same minimum with fewer evaluations."""
+    golden = golden_section_search(func, brack=brack)
+    brent = brent_search(func, brack=brack)
+    assert brent.success
+    assert abs(brent.x - x_min) < 1e-7
+    assert brent.fun == func(brent.x)
+    assert brent.nfev <= golden.nfev
+
+
+def test_brent_smooth_convergence():
+    """On a smooth objective, parabolic steps converge quickly."""
+    result = brent_search(lambda x: (x - 0.35)**2 + 0.1 * (x - 0.35)**3,
+                          brack=(-1.0, 2.2))
+    assert result.nfev < 15
+    assert abs(result.x - 0.35) < 1e-8
+
+
+def test_brent_boundary_minimum():
+    """A minimum at the bound is approached from inside the bracket."""
+    result = brent_search(lambda x: x, brack=(0.5, 2.0))
+    assert 0.5 < result.x < 0.5 + 1e-7
+
+
+def test_brent_tolerance_and_maxiter():
+    """A looser tolerance needs fewer evaluations; maxiter is reported."""
+    tight = brent_search(lambda x: np.cosh(x - 0.3), brack=(-1.0, 3.0))
+    loose = brent_search(lambda x: np.cosh(x - 0.3), brack=(-1.0, 3.0), tol=1e-3)
+    assert loose.nfev < tight.nfev
+    assert abs(loose.x - 0.3) < 1e-3
+
+    result = brent_search(lambda x: abs(x - 0.1), brack=(-1.0, 3.0), maxiter=3)
+    assert not result.success
+    assert "Maximum number of iterations" in result.message
+
+
+def test_scalar_search_methods():
+    """scalar_search dispatches to the chosen method."""
+    func = lambda x: (x - 0.2)**2  # noqa: E731
+    assert scalar_search(func, (-1, 1), method='golden').x == golden_section_search(func, (-1, 1)).x
+    assert scalar_search(func, (-1, 1), method='brent').x == brent_search(func, (-1, 1)).x
+    with pytest.raises(ValueError, match="optimizer must be one of"):
+        scalar_search(func, (-1, 1), method='newton')
+
+
+def test_robust_search_with_brent():
+    """The robust search re-optimizes with Brent's method as with golden section."""
+    result = robust_golden_section_search(lambda x: (x**2 - 1)**2 - 0.5 * x,
+                                          brack=(-2.0, 1.5), method='brent')
+    assert result.x > 0.9
+    assert abs(result.x - 1.0) < 0.2
+
+
+def test_search_tolerance():
+    """Tolerances: default, fixed, and tied to the asymptotic standard error."""
+    assert search_tolerance(None, 100) == np.sqrt(np.finfo(np.float64).eps)
+    assert search_tolerance(1e-4, 100) == 1e-4
+    assert search_tolerance('se', 100) == pytest.approx(0.01 * 0.05)
+    for bad in ['ase', 0.0, -1.0]:
+        with pytest.raises(ValueError, match="tol must be"):
+            search_tolerance(bad, 100)
+
+
+def test_robust_search_grid_first():
+    """The grid is evaluated first and the local search stays in its bracket."""
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return (x**2 - 1)**2 - 0.3 * x
+
+    result = robust_golden_section_search(f, brack=(-2.0, 1.5), n_grid=20)
+    grid = np.linspace(-2.0, 1.5, 20)
+    np.testing.assert_array_equal(calls[:20], grid)
+
+    # All golden section evaluations lie in the right well
+    assert all(0.8 < x < 1.3 for x in calls[20:])
+    assert abs(result.x - 1.036) < 1e-3
+    assert result.nfev == len(calls)
+
+
+def test_robust_search_cache():
+    """Repeated points are not evaluated again."""
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return abs(x - 0.5)
+
+    # The minimum is on a grid point, which the refinement approaches but
+    # the grid minimum is kept if it is not improved upon
+    result = robust_golden_section_search(f, brack=(0.0, 1.0), n_grid=3)
+    assert len(set(calls)) == len(calls)
+    assert result.nfev == len(calls)
+    assert result.x == 0.5 and result.fun == 0.0
+
+
+def test_robust_search_trace():
+    """The trace records every distinct evaluation in order."""
+    func = lambda x: np.cosh(x - 0.3)  # noqa: E731
+    result = robust_golden_section_search(func, brack=(-1.0, 2.2), trace=True)
+    trace = result.trace
+    assert len(trace['x']) == result.nfev
+    np.testing.assert_array_equal(trace['fun'], func(trace['x']))
+    assert np.all(np.diff(trace['elapsed']) >= 0)
+    assert result.x in trace['x']
+    assert not hasattr(robust_golden_section_search(func, brack=(-1.0, 2.2)), 'trace')
+
+
+def test_robust_search_threads():
+    """Evaluating the grid on a thread pool gives identical results."""
+    func = lambda x: (x**2 - 1)**2 + 0.2 * x  # noqa: E731
+    serial = robust_golden_section_search(func, brack=(-2.0, 1.5))
+    threaded = robust_golden_section_search(func, brack=(-2.0, 1.5), n_jobs=4, trace=True)
+    assert threaded.x == serial.x
+    assert threaded.fun == serial.fun
+    assert threaded.nfev == serial.nfev
+
+
+def test_bracketed_search():
+    """A good initial guess saves evaluations; a poor one is recovered from."""
+    func = lambda x: (x - 0.3)**2  # noqa: E731
+    full = golden_section_search(func, brack=(-1.0, 2.2))
+    for x0, width in [(0.31, 0.1), (0.9, 0.1), (-0.5, 0.2), (np.nan, 0.1), (5.0, 0.1)]:
+        result = bracketed_search(func, (-1.0, 2.2), x0, width)
+        assert abs(result.x - 0.3) < 1e-7
+        if x0 == 0.31:
+            assert result.nfev < full.nfev
+    # A minimum at the bound is found from a bracket away from it
+    result = bracketed_search(lambda x: x, (-1.0, 2.2), 0.5, 0.1, method='brent')
+    assert result.x < -1.0 + 1e-6
+
+
+def test_chebyshev_search():
+    """The interpolant locates the minimum and a short polish refines it."""
+    func = lambda x: np.cosh(2 * (x - 0.3)) + 0.1 * x**3  # noqa: E731
+    exact = golden_section_search(func, brack=(-1.0, 2.2))
+    result = chebyshev_search(func, (-1.0, 2.2))
+    assert abs(result.x - exact.x) < 1e-6
+    assert result.success
+    assert result.nfev < exact.nfev
+    assert 0 < result.error_bound < 1e-3
+    # A minimum at the bound
+    result = chebyshev_search(lambda x: np.exp(x), (-1.0, 2.2))
+    assert result.x == -1.0
+
+
+def test_chebyshev_search_fallback():
+    """Without a finite interpolant, Brent's method is used."""
+    func = lambda x: np.where(x > 1.5, np.inf, (x - 0.3)**2)  # noqa: E731
+    result = chebyshev_search(func, (-1.0, 2.2))
+    assert abs(result.x - 0.3) < 1e-6
+    assert result.error_bound == np.inf
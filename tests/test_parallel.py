@@ -0,0 +1,140 @@
+import os
+import pytest
+import numpy as np
+
+import pyelw
+from pyelw.lw_bootstrap_m import LWBootstrapM
+from pyelw.parallel import get_active_pool, parallel_backend
+from pyelw.simulate import arfima
+
+
+def test_no_active_pool_by_default():
+    """Outside of parallel_backend() there is no active pool."""
+    assert get_active_pool() is None
+
+
+def test_parallel_backend_exported():
+    """parallel_backend is available at package level."""
+    assert pyelw.parallel_backend is parallel_backend
+
+
+def test_parallel_backend_sets_and_clears_pool():
+    """The pool is active inside the block and removed afterwards."""
+    with parallel_backend(n_jobs=2, n=64) as pool:
+        assert get_active_pool() is pool
+        with parallel_backend(n_jobs=2, backend='threading') as inner:
+            assert get_active_pool() is inner
+        assert get_active_pool() is pool
+    assert get_active_pool() is None
+
+
+def test_parallel_backend_matches_serial():
+    """Fits inside a shared pool reproduce serial results."""
+    series = [arfima(n=120, d=d, seed=i) for i, d in enumerate([0.1, 0.4])]
+    common = dict(k_n=2, B=10, m_min=5, m_max=15, m_init=8, max_iter=3)
+
+    serial = [LWBootstrapM(**common).fit(x) for x in series]
+    with parallel_backend(n_jobs=2):
+        pooled = [LWBootstrapM(**common).fit(x) for x in series]
+
+    for s, p in zip(serial, pooled):
+        assert s.optimal_m_ == p.optimal_m_
+        assert s.d_hat_ == p.d_hat_
+        assert s.mse_profile_ == p.mse_profile_
+
+
+@pytest.mark.slow
+def test_parallel_backend_serves_estimators():
+    """LW.fit(m='auto') runs in the shared pool."""
+    x = arfima(n=80, d=0.3, seed=3)
+    serial = pyelw.LW().fit(x, m='auto')
+    with parallel_backend(n_jobs=2):
+        pooled = pyelw.LW().fit(x, m='auto')
+    assert serial.m_ == pooled.m_
+    assert np.isclose(serial.d_hat_, pooled.d_hat_)
+
+
+@pytest.fixture
+def collection():
+    """Series of different lengths."""
+    return {f"s{i}": arfima(n=n, d=0.1 * i, seed=i)
+            for i, n in enumerate([80, 300, 150, 220])}
+
+
+@pytest.mark.parametrize("backend", ['loky', 'threading'])
+def test_fit_collection_matches_serial(collection, backend):
+    """Parallel fits over a collection reproduce individual fits, in input order."""
+    table = pyelw.fit_collection(pyelw.ELW(), collection, n_jobs=2, backend=backend)
+
+    assert list(table['name']) == list(collection)
+    for i, x in enumerate(collection.values()):
+        elw = pyelw.ELW().fit(x)
+        assert table['n'][i] == elw.n_
+        assert table['m'][i] == elw.m_
+        assert table['d_hat'][i] == elw.d_hat_
+        assert table['se'][i] == elw.se_
+        assert table['nfev'][i] == elw.nfev_
+    assert np.all(table['time'] > 0)
+
+
+def test_fit_collection_serial_fit_params(collection):
+    """fit_params are passed to fit; a sequence gives a table without names."""
+    table = pyelw.fit_collection(pyelw.LW(), list(collection.values()), n_jobs=1,
+                                 fit_params={'m': 20})
+    assert 'name' not in table
+    assert np.all(table['m'] == 20)
+
+
+def test_fit_collection_selector(collection):
+    """Bandwidth selectors report optimal_m_ as m and NaN for missing fields."""
+    table = pyelw.fit_collection(pyelw.LWPluginM(), collection, n_jobs=1)
+    for i, x in enumerate(collection.values()):
+        assert table['m'][i] == pyelw.LWPluginM().fit(x).optimal_m_
+    assert np.all(np.isnan(table['nfev']))
+
+
+def test_fit_collection_ragged_panel(data_dir):
+    """Columns of a DataFrame padded with NaN are fitted on their observed spans."""
+    pd = pytest.importorskip("pandas")
+    df = pd.read_csv(os.path.join(data_dir, "nelson_plosser_ext.csv")).drop(columns="year")
+    table = pyelw.fit_collection(pyelw.ELW(), df, n_jobs=1)
+
+    assert list(table['name']) == list(df.columns)
+    assert np.all(np.isfinite(table['d_hat']))
+    for i, name in enumerate(df.columns):
+        x = df[name].dropna().values
+        assert table['n'][i] == len(x)
+        assert table['d_hat'][i] == pyelw.ELW().fit(x).d_hat_
+
+
+def test_fit_collection_rejects_interior_gaps():
+    """Missing values inside a series are an error, not a NaN estimate."""
+    x = arfima(n=100, d=0.2, seed=1)
+    x[50] = np.nan
+    with pytest.raises(ValueError, match="'gap'"):
+        pyelw.fit_collection(pyelw.LW(), {'ok': x[:50], 'gap': x}, n_jobs=1)
+
+
+class _RecordingLW(pyelw.LW):
+    """LW estimator recording the lengths of the series it fits."""
+    started = []
+
+    def fit(self, X, **kwargs):
+        _RecordingLW.started.append(len(X))
+        return super().fit(X, **kwargs)
+
+
+def test_imap_fit_longest_first(collection):
+    """Tasks are submitted longest series first."""
+    _RecordingLW.started = []
+    results = list(pyelw.imap_fit(_RecordingLW(), collection, n_jobs=2,
+                                  backend='threading'))
+    assert sorted(i for i, _ in results) == [0, 1, 2, 3]
+    assert set(_RecordingLW.started[:2]) == {300, 220}
+
+
+def test_imap_fit_respects_inner_n_jobs(collection):
+    """Fits that use all workers themselves run one at a time, in input order."""
+    results = list(pyelw.imap_fit(pyelw.LW(), collection, n_jobs=2,
+                                  fit_params={'m': 20, 'n_jobs': 2}))
+    assert [i for i, _ in results] == [0, 1, 2, 3]
@@ -2,7 +2,9 @@ import pytest  # noqa: F401
 import numpy as np
 from math import gamma
 
-from pyelw.simulate import arfima
+from pyelw.simulate import (arfima, arfima_autocovariance, arfima_batch, arfima_exact,
+                            arfima_exact_batch, arfima_fill, arfima_stream, deterministic_trend,
+                            random_level_shifts, replication_seeds, white_noise)
 
 
 def test_basic_properties():
@@ -480,3 +482,312 @@ def test_ar1_initialization():
     var_early = np.var(x_unit[:100])
     var_late = np.var(x_unit[:900])  # Include more data to see growth
     assert var_late > var_early, f"Unit root variance should increase: early={var_early:.2f}, late={var_late:.2f}"
+
+
+@pytest.mark.parametrize("phi", [0.0, 0.5, -0.7, 1.0, 1.01])
+@pytest.mark.parametrize("d", [0.0, 0.3, 1.2])
+def test_filter_matches_recursion(d, phi):
+    """The FFT filter matches the AR(1) recursion followed by fracdiff."""
+    from pyelw.fracdiff import fracdiff
+    x = arfima(300, d, phi=phi, seed=3, burnin=50)
+
+    np.random.seed(3)
+    eps = np.random.normal(0, 1.0, 350)
+    u = eps.copy()
+    if 1e-13 <= abs(phi) < 1:
+        u[0] = np.random.normal(0, 1.0 / np.sqrt(1 - phi**2))
+    for t in range(1, 350):
+        u[t] = phi * u[t-1] + eps[t]
+    expected = fracdiff(u, -d)[50:] if d != 0 else u[50:]
+    np.testing.assert_allclose(x, expected, rtol=1e-10, atol=1e-10)
+
+
+def test_arfima_batch():
+    """Batched replications have the right shape and moments."""
+    R, n, d, phi = 2000, 200, 0.3, 0.5
+    X = arfima_batch(R, n, d, phi=phi, seed=42, burnin=100)
+    assert X.shape == (R, n)
+    assert np.isfinite(X).all()
+
+    # Reproducible
+    np.testing.assert_array_equal(X, arfima_batch(R, n, d, phi=phi, seed=42, burnin=100))
+
+    # Replications are independent draws from the same process
+    assert not np.allclose(X[0], X[1])
+    var_true = gamma(1 - 2*d) / gamma(1 - d)**2
+    var_white = np.var(arfima_batch(R, n, d, seed=1, burnin=1000)[:, -1])
+    assert abs(var_white - var_true) / var_true < 0.1
+
+    # Single replication
+    assert arfima_batch(1, n, d, seed=42).shape == (1, n)
+
+
+def test_integer_seed():
+    """Integer seeds seed the global random state, as np.random.seed does."""
+    np.random.seed(42)
+    eps = np.random.normal(0, 1.0, 100)
+    following = np.random.normal()
+    np.testing.assert_allclose(arfima(100, 0.0, seed=42), eps)
+    assert np.random.normal() == following
+
+
+def test_generator_seed():
+    """Generators and seed sequences give reproducible independent draws."""
+    x1 = arfima(100, 0.3, seed=np.random.default_rng(5))
+    x2 = arfima(100, 0.3, seed=np.random.default_rng(5))
+    np.testing.assert_array_equal(x1, x2)
+    rng = np.random.default_rng(5)
+    assert not np.array_equal(arfima(100, 0.3, seed=rng), arfima(100, 0.3, seed=rng))
+
+    seeds = replication_seeds(7, 3)
+    assert [s.spawn_key for s in seeds] == [(0,), (1,), (2,)]
+    assert replication_seeds(7, 2, start=1)[0].spawn_key == (1,)
+    assert not np.array_equal(arfima(100, 0.3, seed=seeds[0]), arfima(100, 0.3, seed=seeds[1]))
+
+
+def test_replications_independent_of_chunking():
+    """Per-replication streams give bitwise identical results however split."""
+    from concurrent.futures import ThreadPoolExecutor
+    root = np.random.SeedSequence(2024)
+    R, n = 10, 150
+    X = arfima_batch(R, n, 0.3, phi=0.5, seed=root, burnin=50)
+
+    # Children of the root sequence, one replication at a time
+    for r, child in enumerate(root.spawn(R)):
+        np.testing.assert_array_equal(arfima(n, 0.3, phi=0.5, seed=child, burnin=50), X[r])
+
+    # Chunks of replications simulated concurrently
+    def chunk(start):
+        seeds = replication_seeds(root, min(4, R - start), start=start)
+        return arfima_batch(len(seeds), n, 0.3, phi=0.5, seed=seeds, burnin=50)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        chunks = list(pool.map(chunk, range(0, R, 4)))
+    np.testing.assert_array_equal(np.vstack(chunks), X)
+
+    with pytest.raises(ValueError, match="one entry per replication"):
+        arfima_batch(3, n, 0.3, seed=replication_seeds(root, 2))
+
+
+def test_arfima_autocovariance():
+    """Autocovariances match the closed forms of special cases."""
+    d, phi = 0.3, 0.6
+    lags = np.arange(6)
+
+    # ARFIMA(0,d,0)
+    gamma0 = gamma(1 - 2*d) / gamma(1 - d)**2
+    rho = np.array([gamma(k + d) * gamma(1 - d) / (gamma(k + 1 - d) * gamma(d)) for k in lags])
+    np.testing.assert_allclose(arfima_autocovariance(6, d), gamma0 * rho, rtol=1e-12)
+
+    # AR(1)
+    np.testing.assert_allclose(arfima_autocovariance(6, 0.0, phi, sigma=2.0),
+                               4.0 * phi**lags / (1 - phi**2), rtol=1e-12)
+
+    # ARFIMA(1,d,0) against its MA(infinity) representation
+    from pyelw.simulate import _arfima_kernel
+    psi = _arfima_kernel(200000, -0.3, (-0.6,))
+    expected = [psi[:len(psi) - k] @ psi[k:] for k in lags]
+    np.testing.assert_allclose(arfima_autocovariance(6, -0.3, -0.6), expected, rtol=1e-8)
+
+    with pytest.raises(ValueError, match="stationarity"):
+        arfima_autocovariance(6, 0.5)
+
+
+@pytest.mark.parametrize("d, phi", [(0.3, 0.0), (-0.4, 0.0), (0.45, 0.5), (0.2, -0.7)])
+def test_arfima_exact(d, phi):
+    """Exact simulation reproduces the autocovariances from the first observation."""
+    R, n = 20000, 40
+    X = arfima_exact_batch(R, n, d, phi=phi, sigma=1.5, seed=np.random.SeedSequence(1))
+    assert X.shape == (R, n)
+    acov = 1.5**2 * arfima_autocovariance(n, d, phi)
+
+    # Stationary: same variance at the start and the end of the sample
+    se = acov[0] * np.sqrt(2 / R)
+    assert abs(np.var(X[:, 0]) - acov[0]) < 4 * se
+    assert abs(np.var(X[:, -1]) - acov[0]) < 4 * se
+    for k in range(1, 4):
+        assert abs(np.mean(X[:, :n-k] * X[:, k:]) - acov[k]) < 4 * se
+
+
+def test_arfima_exact_seeds():
+    """Exact simulation follows the seed conventions of arfima_batch."""
+    root = np.random.SeedSequence(7)
+    X = arfima_exact_batch(5, 100, 0.3, seed=root)
+    for r, child in enumerate(replication_seeds(root, 5)):
+        np.testing.assert_array_equal(arfima_exact(100, 0.3, seed=child), X[r])
+    np.testing.assert_array_equal(arfima_exact_batch(5, 100, 0.3, seed=3),
+                                  arfima_exact_batch(5, 100, 0.3, seed=3))
+    assert arfima_exact(1, 0.3, seed=1).shape == (1,)
+    with pytest.raises(ValueError, match="stationarity"):
+        arfima_exact(100, 0.6)
+
+
+def test_arfima_pdq():
+    """ARFIMA(p,d,q) matches a direct recursion of the ARMA part."""
+    from pyelw.fracdiff import fracdiff
+    R, n = 3, 300
+    phi, theta = (0.5, -0.3), (0.4, 0.2)
+    X = arfima_batch(R, n, 0.3, phi=phi, theta=theta, seed=np.random.SeedSequence(5))
+    assert X.shape == (R, n)
+
+    e = np.vstack([np.random.default_rng(s).normal(0, 1, (1, n))
+                   for s in replication_seeds(np.random.SeedSequence(5), R)])
+    u = np.zeros_like(e)
+    for t in range(n):
+        u[:, t] = e[:, t]
+        for j, c in enumerate(phi, start=1):
+            if t >= j:
+                u[:, t] += c * u[:, t-j]
+        for j, c in enumerate(theta, start=1):
+            if t >= j:
+                u[:, t] += c * e[:, t-j]
+    np.testing.assert_allclose(X, fracdiff(u, -0.3), atol=1e-10)
+
+    # Scalar and one-element coefficients give the same process
+    np.testing.assert_array_equal(arfima(n, 0.2, phi=(0.5,), seed=1), arfima(n, 0.2, phi=0.5, seed=1))
+    np.testing.assert_array_equal(arfima(n, 0.2, theta=(0.0,), seed=1), arfima(n, 0.2, seed=1))
+
+
+def test_arfima_ma_explosive():
+    """MA terms are applied before an explosive AR(1) recursion."""
+    n = 50
+    X = arfima(n, 0.0, phi=1.05, theta=0.5, seed=np.random.SeedSequence(2))
+    e = np.random.default_rng(np.random.SeedSequence(2)).normal(0, 1, n)
+    v = e.copy()
+    v[1:] += 0.5 * e[:-1]
+    u = np.empty(n)
+    u[0] = v[0]
+    for t in range(1, n):
+        u[t] = 1.05 * u[t-1] + v[t]
+    np.testing.assert_allclose(X, u, rtol=1e-12)
+
+
+def test_random_level_shifts():
+    """Level shifts match the example generator and have the expected frequency."""
+    n, p = 500, 5
+    u = random_level_shifts(1, n, p, sigma_eta=2.0, seed=np.random.default_rng(11))[0]
+    rng = np.random.default_rng(11)
+    shifts = rng.random(n) < p / n
+    np.testing.assert_array_equal(u, np.cumsum(shifts * rng.normal(0, 2.0, n)))
+
+    U = random_level_shifts(2000, n, p, seed=np.random.SeedSequence(3))
+    n_shifts = np.count_nonzero(np.diff(U, axis=1), axis=1)
+    assert abs(np.mean(n_shifts) - p) < 0.3
+
+
+def test_white_noise():
+    """White noise has the requested variance and follows the seed conventions."""
+    E = white_noise(200, 500, sigma=2.0, seed=np.random.SeedSequence(4))
+    assert E.shape == (200, 500)
+    assert abs(np.var(E) - 4.0) < 0.1
+    children = replication_seeds(np.random.SeedSequence(4), 200)
+    np.testing.assert_array_equal(white_noise(1, 500, sigma=2.0, seed=children[7:8])[0], E[7])
+
+
+def test_deterministic_trend():
+    """Polynomial trends and level shifts at break fractions."""
+    n = 10
+    t = np.arange(1, n + 1) / n
+    np.testing.assert_allclose(deterministic_trend(n, coef=(1.0, 2.0, -1.0)), 1 + 2*t - t**2)
+    mu = deterministic_trend(n, coef=(1.0,), breaks=(0.5,), shifts=(3.0,))
+    np.testing.assert_array_equal(mu, np.where(np.arange(1, n + 1) >= 5, 4.0, 1.0))
+    np.testing.assert_array_equal(deterministic_trend(n), np.zeros(n))
+    assert (arfima_batch(3, n, 0.2, seed=1) + mu).shape == (3, n)
+    with pytest.raises(ValueError, match="same length"):
+        deterministic_trend(n, breaks=(0.5,))
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'phi': (0.5, -0.2), 'theta': 0.4},
+                                    {'phi': -0.6, 'theta': (0.3, 0.1)}])
+def test_arfima_stream(kwargs):
+    """Without truncation, the chunks make up the path of arfima."""
+    n, burnin = 1000, 100
+    X = arfima(n, 0.3, seed=np.random.SeedSequence(1), burnin=burnin, **kwargs)
+    for chunk_size in [77, 1100]:
+        chunks = list(arfima_stream(n, 0.3, seed=np.random.SeedSequence(1), burnin=burnin,
+                                    chunk_size=chunk_size, **kwargs))
+        assert all(len(x) <= chunk_size for x in chunks)
+        assert np.max(np.abs(np.concatenate(chunks) - X)) < 1e-12 * np.max(np.abs(X))
+
+
+@pytest.mark.parametrize("phi", [1.0, -1.02])
+def test_arfima_stream_rejects_nonstationary_ar1(phi):
+    """Explosive and unit root AR(1) components are left to arfima."""
+    with pytest.raises(ValueError, match="arfima_batch"):
+        next(arfima_stream(100, 0.3, phi=phi))
+
+
+def test_arfima_stream_ar1():
+    """The stationary AR(1) start is drawn before the innovations."""
+    from pyelw.fracdiff import fracdiff
+    n, phi = 500, 0.5
+    x = np.concatenate(list(arfima_stream(n, 0.3, phi=phi, seed=np.random.default_rng(2),
+                                          chunk_size=64)))
+    rng = np.random.default_rng(2)
+    initial = rng.normal(0, 1 / np.sqrt(1 - phi**2))
+    e = rng.normal(0, 1, n)
+    e[0] = initial
+    u = np.empty(n)
+    u[0] = e[0]
+    for t in range(1, n):
+        u[t] = phi * u[t-1] + e[t]
+    np.testing.assert_allclose(x, fracdiff(u, -0.3), atol=1e-10)
+
+
+def test_arfima_stream_memory():
+    """With truncation, each observation depends on the last memory innovations."""
+    from pyelw.simulate import _arfima_kernel
+    n, memory, d = 600, 50, 0.4
+    x = np.concatenate(list(arfima_stream(n, d, seed=np.random.default_rng(3), chunk_size=128,
+                                          memory=memory)))
+    e = np.random.default_rng(3).normal(0, 1, n)
+    expected = np.convolve(e, _arfima_kernel(memory, d, ()))[:n]
+    np.testing.assert_allclose(x, expected, atol=1e-10)
+
+
+def test_arfima_fill(tmp_path):
+    """arfima_fill writes the stream into a memory-mapped file."""
+    n = 2000
+    path = str(tmp_path / 'x.npy')
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(n,))
+    arfima_fill(out, 0.3, phi=(0.4,), theta=0.2, seed=np.random.SeedSequence(4),
+                burnin=50, chunk_size=300)
+    del out
+    x = np.load(path)
+    expected = np.concatenate(list(arfima_stream(n, 0.3, phi=0.4, theta=0.2,
+                                                 seed=np.random.SeedSequence(4), burnin=50)))
+    np.testing.assert_allclose(x, expected, rtol=1e-10, atol=1e-12)
+
+
+def test_array_cache_bounded_by_bytes():
+    """The simulation caches keep at most max_bytes of arrays alive."""
+    from pyelw.simulate import _array_cache
+    calls = []
+
+    @_array_cache(800)
+    def zeros(n):
+        calls.append(n)
+        return np.zeros(n)
+
+    zeros(40)
+    zeros(40)
+    assert calls == [40]
+    assert zeros.cache_bytes() == 320
+
+    # Too large to cache: recomputed on every call
+    zeros(200)
+    zeros(200)
+    assert calls == [40, 200, 200]
+    assert zeros.cache_bytes() == 320
+
+    # The least recently used entry is evicted first
+    zeros(50)
+    zeros(40)
+    zeros(30)
+    assert zeros.cache_bytes() <= 800
+    zeros(40)
+    zeros(50)
+    assert calls == [40, 200, 200, 50, 30, 50]
+
+    zeros.cache_clear()
+    assert zeros.cache_bytes() == 0
@@ -290,3 +290,78 @@ def test_twostep_auto_m_basic(arfima_data_auto):
     # Check that estimate is reasonable
     assert np.isfinite(ts_elw.d_hat_)
     assert abs(ts_elw.d_hat_ - d_true) < 0.3  # Loose bound
+
+
+@pytest.mark.parametrize("taper", ['hc', 'none'])
+def test_fit_many_matches_fit(taper):
+    """fit_many gives the same results as fitting each series separately."""
+    X = np.array([arfima(n=300, d=0.2 * (i % 6) - 0.2, seed=i) for i in range(12)])
+
+    results = TwoStepELW(taper=taper).fit_many(X, m=40)
+
+    for i, x in enumerate(X):
+        est = TwoStepELW(taper=taper).fit(x, m=40)
+        assert results['d_hat'][i] == est.d_hat_
+        assert results['d_step1'][i] == est.d_step1_
+        assert results['objective'][i] == est.objective_
+        assert results['nfev'][i] == est.nfev_
+        assert results['nfev_step1'][i] == est.nfev_step1_
+    assert results['se'] == est.se_
+    assert results['m'] == 40
+
+
+@pytest.mark.parametrize("trend_order", [1, 2])
+def test_fit_many_detrended(trend_order):
+    """Polynomial detrending of many series agrees with fit up to rounding."""
+    t = np.arange(300)
+    X = np.array([arfima(n=300, d=0.3, seed=i) + 0.01 * i * t for i in range(6)])
+
+    results = TwoStepELW(trend_order=trend_order).fit_many(X)
+
+    for i, x in enumerate(X):
+        est = TwoStepELW(trend_order=trend_order).fit(x)
+        np.testing.assert_allclose(results['d_hat'][i], est.d_hat_, atol=1e-6)
+        np.testing.assert_allclose(results['d_step1'][i], est.d_step1_, atol=1e-6)
+
+
+def test_detrend_rows(estimator):
+    """detrend on a 2-D array detrends each row."""
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((3, 100)) + np.arange(100)
+    for order in [0, 1, 3]:
+        detrended = estimator.detrend(X, order)
+        for i in range(3):
+            np.testing.assert_allclose(detrended[i], estimator.detrend(X[i], order),
+                                       atol=1e-10)
+
+
+def test_brent_optimizer():
+    """Brent's method in both stages agrees with golden section search."""
+    x = arfima(n=500, d=0.35, phi=0.3, seed=7)
+    golden = TwoStepELW().fit(x, m=60)
+    brent = TwoStepELW(optimizer='brent').fit(x, m=60)
+    assert abs(brent.d_step1_ - golden.d_step1_) < 1e-6
+    assert abs(brent.d_hat_ - golden.d_hat_) < 1e-6
+    assert brent.nfev_ + brent.nfev_step1_ < (golden.nfev_ + golden.nfev_step1_) / 2
+    assert repr(TwoStepELW(optimizer='brent')) == "TwoStepELW(optimizer='brent')"
+
+
+def test_d_init():
+    """d_init starts the Stage 1 search."""
+    x = arfima(n=500, d=0.35, phi=0.3, seed=7)
+    full = TwoStepELW().fit(x, m=60)
+    warm = TwoStepELW().fit(x, m=60, d_init='gph')
+    assert abs(warm.d_step1_ - full.d_step1_) < 1e-6
+    assert abs(warm.d_hat_ - full.d_hat_) < 1e-6
+
+
+def test_surrogate():
+    """The Chebyshev surrogate for Stage 2 matches the exact search."""
+    x = arfima(n=500, d=0.35, phi=0.3, seed=7)
+    exact = TwoStepELW().fit(x, m=60)
+    surrogate = TwoStepELW(surrogate=True).fit(x, m=60)
+    assert surrogate.d_step1_ == exact.d_step1_
+    assert abs(surrogate.d_hat_ - exact.d_hat_) < 1e-6
+    assert surrogate.nfev_ < exact.nfev_ / 2
+    assert surrogate.surrogate_error_ > 0
+    assert repr(TwoStepELW(surrogate=True)) == "TwoStepELW(surrogate=True)"